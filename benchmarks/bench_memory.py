@@ -0,0 +1,55 @@
+"""Memory benchmark for the compact element classes.
+
+Generate a large yWriter project, read it with Yw7File and CompactYw7File,
+and compare the memory held by the project data (the xml tree not included).
+
+usage: bench_memory.py [--chapters N] [--scenes N]
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import gc
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from pywriter.yw.yw7_file import Yw7File
+from pywriter.yw.compact_yw7_file import CompactYw7File
+from yw7_generator import Yw7Generator
+
+
+def measure(novelClass, filePath):
+    """Return the number of bytes held by the project data after reading."""
+    gc.collect()
+    tracemalloc.start()
+    novel = novelClass(filePath)
+    novel.read()
+    novel.tree = None
+    gc.collect()
+    size, __ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, len(novel.scenes) + len(novel.chapters) + len(novel.characters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the memory used by Yw7File and CompactYw7File.')
+    parser.add_argument('--chapters', type=int, default=500, help='number of chapters')
+    parser.add_argument('--scenes', type=int, default=20, help='number of scenes per chapter')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tempDir:
+        filePath = os.path.join(tempDir, 'benchmark.yw7')
+        Yw7Generator(chapters=args.chapters, scenes=args.scenes, characters=20, sceneWords=100).generate(filePath)
+        regular, elements = measure(Yw7File, filePath)
+        compact, __ = measure(CompactYw7File, filePath)
+    print(f'{elements} elements')
+    print(f'Yw7File:        {regular / 1024 / 1024:8.1f} MiB ({regular / elements:.0f} bytes per element)')
+    print(f'CompactYw7File: {compact / 1024 / 1024:8.1f} MiB ({compact / elements:.0f} bytes per element)')
+    print(f'Saving:         {(regular - compact) / regular:8.1%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Scaling benchmark for merging projects.
+
+Generate synthetic projects of increasing size, and merge an edited copy
+of each project back into it with Yw7File.merge(). The copy has a new
+chapter behind every 10th chapter, and a new scene at the beginning
+of every 10th chapter. Report the merge time in total and per element,
+which should stay roughly constant with a linear-time merge.
+For comparison, time the former merge_lists() function, which was
+quadratic, on the chapter lists.
+
+usage: bench_merge.py [--sizes SIZE [SIZE ...]] [--scenes N] [--repeat N] [--no-former]
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import gc
+import time
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from pywriter.pywriter_globals import *
+from pywriter.yw.yw7_file import Yw7File
+from yw7_generator import Yw7Generator
+
+SIZES = (100, 1000, 10000, 50000)
+# Number of chapters and scenes per project.
+
+
+def former_merge_lists(srcLst, tgtLst):
+    """Insert srcLst items to tgtLst, if missing, as formerly done in Yw7File.merge()."""
+    j = 0
+    for item in srcLst:
+        if not item in tgtLst:
+            tgtLst.insert(j, item)
+            j += 1
+        else:
+            j = tgtLst.index(item) + 1
+
+
+def edit_project(novel):
+    """Add chapters and scenes to a project read in, as if edited in an exported document."""
+    srtChapters = []
+    for i, chId in enumerate(novel.srtChapters):
+        srtChapters.append(chId)
+        if i % 10:
+            continue
+
+        scId = novel.idAllocator.create_id('scene')
+        scene = novel.SCENE_CLASS()
+        scene.title = f'New scene {scId}'
+        scene.sceneContent = 'New scene content.'
+        novel.scenes[scId] = scene
+        novel.chapters[chId].srtScenes.insert(0, scId)
+
+        newChId = novel.idAllocator.create_id('chapter')
+        chapter = novel.CHAPTER_CLASS()
+        chapter.title = f'New chapter {newChId}'
+        chapter.chLevel = 0
+        chapter.chType = 0
+        novel.chapters[newChId] = chapter
+        srtChapters.append(newChId)
+        scId = novel.idAllocator.create_id('scene')
+        scene = novel.SCENE_CLASS()
+        scene.title = f'New scene {scId}'
+        scene.sceneContent = 'New scene content.'
+        novel.scenes[scId] = scene
+        chapter.srtScenes.append(scId)
+    novel.srtChapters = srtChapters
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the merge time for projects of increasing size.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help=f'number of chapters and scenes per project (default: {" ".join(str(s) for s in SIZES)})')
+    parser.add_argument('--scenes', type=int, default=4, help='number of scenes per chapter (default: 4)')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs per size (default: 3)')
+    parser.add_argument('--no-former', action='store_true', help='do not time the former merge_lists()')
+    args = parser.parse_args()
+    print(f'{"elements":>10} {"merge":>12} {"per element":>12} {"former merge_lists":>20}')
+    with tempfile.TemporaryDirectory() as tempDir:
+        filePath = os.path.join(tempDir, 'benchmark.yw7')
+        targetPath = os.path.join(tempDir, 'target.yw7')
+        # Does not exist, so merge() does not read the target project again.
+
+        for size in args.sizes:
+            chapters = max(1, size // (args.scenes + 1))
+            Yw7Generator(chapters=chapters, scenes=args.scenes, sceneWords=20).generate(filePath)
+            source = Yw7File(filePath)
+            source.read()
+            edit_project(source)
+            times = []
+            for __ in range(args.repeat):
+                target = Yw7File(filePath)
+                target.read()
+                target.filePath = targetPath
+                gc.collect()
+                startTime = time.perf_counter()
+                message = target.merge(source)
+                times.append(time.perf_counter() - startTime)
+                if message.startswith(ERROR):
+                    sys.exit(message)
+
+            elements = len(target.chapters) + len(target.scenes)
+            merge = statistics.median(times)
+            line = f'{elements:10} {merge * 1000:10.1f}ms {merge / elements * 1000000:10.2f}us'
+            if not args.no_former:
+                target = Yw7File(filePath)
+                target.read()
+                startTime = time.perf_counter()
+                former_merge_lists(source.srtChapters, target.srtChapters)
+                line = f'{line} {(time.perf_counter() - startTime) * 1000:18.1f}ms'
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Microbenchmark for the chapter number formatting.
+
+Compare NumberFormatter with the former number conversion functions,
+which were defined as closures in YwRn.run() and called for each chapter.
+Time the labels for one run with the given number of chapters,
+for each numbering style, with a cold and a warm NumberFormatter cache.
+
+usage: bench_numbers.py [--chapters N] [--repeat N]
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from ywrenumberlib.number_formatter import NumberFormatter
+
+STYLES = (('0', 'Arabic'), ('1', 'Roman'), ('2', 'English'))
+
+
+def former_labels(style, case, count):
+    """Return the labels for a run, as formerly computed in YwRn.run().
+
+    The functions are defined anew for each run, as before.
+    Note: number_to_english() returns wrong results from 100 on,
+    because it divides with floats.
+    """
+    ROMAN = [
+        (1000, "m"),
+        (900, "cm"),
+        (500, "d"),
+        (400, "cd"),
+        (100, "c"),
+        (90, "xc"),
+        (50, "l"),
+        (40, "xl"),
+        (10, "x"),
+        (9, "ix"),
+        (5, "v"),
+        (4, "iv"),
+        (1, "i"),
+    ]
+
+    def number_to_roman(n):
+        result = []
+        for (arabic, roman) in ROMAN:
+            (factor, n) = divmod(n, arabic)
+            result.append(roman * factor)
+            if n == 0:
+                break
+
+        return "".join(result)
+
+    TENS = {30: 'thirty', 40: 'forty', 50: 'fifty',
+            60: 'sixty', 70: 'seventy', 80: 'eighty', 90: 'ninety'}
+    ZERO_TO_TWENTY = (
+        'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+        'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty'
+    )
+
+    def number_to_english(n):
+        if any(not x.isdigit() for x in str(n)):
+            return ''
+        if n <= 20:
+            return ZERO_TO_TWENTY[n]
+        elif n < 100 and n % 10 == 0:
+            return TENS[n]
+        elif n < 100:
+            return f'{number_to_english(n - (n % 10))} {number_to_english(n % 10)}'
+        elif n < 1000 and n % 100 == 0:
+            return f'{number_to_english(n / 100)} hundred'
+        elif n < 1000:
+            return f'{number_to_english(n / 100)} hundred {number_to_english(n % 100)}'
+        elif n < 1000000:
+            return f'{number_to_english(n / 1000)} thousand {number_to_english(n % 1000)}'
+        return ''
+
+    labels = []
+    for i in range(1, count + 1):
+        if style == '1':
+            number = number_to_roman(i)
+        elif style == '2':
+            number = number_to_english(i)
+        else:
+            number = str(i)
+        if case == '0':
+            number = number.upper()
+        elif case == '1':
+            number = number.capitalize()
+        labels.append(number)
+    return labels
+
+
+def formatter_labels(style, case, count, cold):
+    """Return the labels for a run computed by NumberFormatter, clearing the cache first if cold."""
+    if cold:
+        NumberFormatter._labels.clear()
+    return NumberFormatter(style, case).get_labels(count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare NumberFormatter with the former number conversion.')
+    parser.add_argument('--chapters', type=int, default=1000, help='number of chapters per run (default: 1000)')
+    parser.add_argument('--repeat', type=int, default=200, help='number of runs (default: 200)')
+    args = parser.parse_args()
+    print(f'{args.chapters} labels per run, best of 5 x {args.repeat} runs')
+    print(f'{"style":8} {"former":>10} {"cold":>10} {"warm":>10}')
+    for style, name in STYLES:
+        times = []
+        for function, options in ((former_labels, ()), (formatter_labels, (True,)), (formatter_labels, (False,))):
+            timer = timeit.Timer(lambda: function(style, '1', args.chapters, *options))
+            times.append(min(timer.repeat(5, args.repeat)) / args.repeat)
+        print(f'{name:8} ' + ' '.join(f'{t * 1000000:8.1f}us' for t in times))
+
+
+if __name__ == '__main__':
+    main()
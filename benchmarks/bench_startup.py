@@ -0,0 +1,114 @@
+"""Startup benchmark for the silent mode.
+
+Run yw_renumber_.pyw --silent on a small synthetic project in a new process,
+with the interpreter's import time report switched on (-X importtime).
+Report the wall time and the import time, and check that the GUI stack
+(tkinter) is not loaded. The exit status is 1, if tkinter is loaded.
+
+usage: bench_startup.py [--repeat N] [--script PATH]
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from yw7_generator import Yw7Generator
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'yw_renumber_.pyw')
+GUI_MODULES = ('tkinter', '_tkinter')
+GUI_IMPORT = 'import tkinter, tkinter.ttk, tkinter.filedialog, tkinter.messagebox'
+
+
+def parse_importtime(text):
+    """Return a dictionary with the self import time in microseconds per module.
+
+    Positional arguments:
+        text -- str: stderr output of a process run with -X importtime.
+    """
+    modules = {}
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+
+        modules[fields[2].strip()] = int(fields[0])
+    return modules
+
+
+def is_gui_module(moduleName):
+    """Return True if the module belongs to the GUI stack."""
+    return moduleName.split('.')[0] in GUI_MODULES
+
+
+def run_process(args, env):
+    """Run a Python process with -X importtime.
+
+    Return a tuple with the wall time in seconds and the import times per module.
+    Raise RuntimeError, if the process fails.
+    """
+    startTime = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime'] + args, env=env,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    wallTime = time.perf_counter() - startTime
+    if process.returncode != 0:
+        raise RuntimeError(f'{" ".join(args)} failed:\n{process.stderr}')
+
+    return wallTime, parse_importtime(process.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the startup time of yw_renumber_.pyw in silent mode.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs (default: 5)')
+    parser.add_argument('--script', default=SCRIPT, help='application script to run (default: the source tree script)')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tempDir:
+        env = dict(os.environ, HOME=tempDir, USERPROFILE=tempDir)
+        # Keep the application's configuration file out of the user profile.
+
+        projectPath = os.path.join(tempDir, 'project.yw7')
+        Yw7Generator(chapters=20, scenes=5).generate(projectPath)
+        workPath = os.path.join(tempDir, 'work.yw7')
+        wallTimes = []
+        importTimes = []
+        for __ in range(args.repeat):
+            shutil.copyfile(projectPath, workPath)
+            try:
+                wallTime, modules = run_process([args.script, workPath, '--silent'], env)
+            except RuntimeError as ex:
+                sys.exit(str(ex))
+
+            wallTimes.append(wallTime)
+            importTimes.append(sum(modules.values()))
+        guiModules = sorted(moduleName for moduleName in modules if is_gui_module(moduleName))
+
+        print(f'Silent mode: {statistics.median(wallTimes) * 1000:8.1f} ms wall time, '
+              f'{statistics.median(importTimes) / 1000:8.1f} ms import time, {len(modules)} modules')
+        try:
+            __, modules = run_process(['-c', GUI_IMPORT], env)
+            guiImportTime = sum(importTime for moduleName, importTime in modules.items() if is_gui_module(moduleName))
+            print(f'GUI stack:   {guiImportTime / 1000:8.1f} ms import time (not needed in silent mode)')
+        except RuntimeError:
+            print('GUI stack:   tkinter is not installed')
+
+    if guiModules:
+        print(f'FAILED: silent mode loads {", ".join(guiModules)}')
+        sys.exit(1)
+
+    print('OK: silent mode does not load tkinter')
+
+
+if __name__ == '__main__':
+    main()
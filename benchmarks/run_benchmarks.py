@@ -0,0 +1,268 @@
+"""Benchmark runner for reading, renumbering, and writing yWriter projects.
+
+Generate synthetic projects of increasing size, time each processing phase,
+and report median and 95th percentile wall time, and peak memory.
+Only the standard library is used.
+
+usage: run_benchmarks.py [--sizes SIZE [SIZE ...]] [--phases PHASE [PHASE ...]] [--repeat N] [--json FILE]
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import gc
+import math
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SOURCE_PATH)
+from pywriter.ui.ui import Ui
+from pywriter.yw.yw7_file import Yw7File
+from pywriter.yw.xml_indent import indent
+from pywriter.yw.xml_serializer import serialize
+from ywrenumberlib.yw_rn import YwRn
+from yw7_generator import Yw7Generator
+from yw7_generator import PROJECT_SIZES
+
+RENUMBER_KWARGS = dict(
+    numbering_style='0',
+    numbering_case='0',
+    heading_prefix='||',
+    heading_suffix='||',
+    ren_regular=True,
+    ren_unused=False,
+    ren_parts=False,
+    ren_within_parts=False,
+    title_only=False,
+)
+# The application's default configuration (see yw_renumber_.pyw).
+
+
+class Phase:
+    """A processing phase to be timed.
+
+    Public methods:
+        setup(filePath) -- Prepare a run; return the argument for run().
+        run(state) -- The code to be timed.
+    """
+    NAME = None
+
+    def __init__(self, workDir):
+        """Initialize instance variables.
+
+        Positional arguments:
+            workDir -- str: directory for temporary files.
+        """
+        self._workDir = workDir
+
+    def setup(self, filePath):
+        return filePath
+
+    def run(self, state):
+        pass
+
+    def _copy(self, filePath):
+        """Return the path of a fresh copy of the project file."""
+        copyPath = os.path.join(self._workDir, 'copy.yw7')
+        shutil.copyfile(filePath, copyPath)
+        return copyPath
+
+
+class ReadPhase(Phase):
+    """Yw7File.read() with all sections."""
+    NAME = 'read'
+
+    def run(self, filePath):
+        Yw7File(filePath).read()
+
+
+class ReadChaptersPhase(Phase):
+    """Yw7File.read() with the chapters only, as done for renumbering."""
+    NAME = 'read_chapters'
+
+    def run(self, filePath):
+        Yw7File(filePath).read(sections=('chapters',))
+
+
+class RenumberPhase(Phase):
+    """YwRn.run(): read, renumber, and write back the project."""
+    NAME = 'renumber'
+
+    def setup(self, filePath):
+        return self._copy(filePath)
+
+    def run(self, filePath):
+        converter = YwRn()
+        converter.ui = Ui('')
+        converter.run(filePath, **RENUMBER_KWARGS)
+
+
+class BuildTreePhase(Phase):
+    """Yw7File._build_element_tree() after changing all chapter titles."""
+    NAME = 'build_tree'
+
+    def setup(self, filePath):
+        novel = Yw7File(filePath)
+        novel.read()
+        for chId in novel.srtChapters:
+            novel.chapters[chId].title = f'{novel.chapters[chId].title}*'
+        novel.get_languages()
+        return novel
+
+    def run(self, novel):
+        novel._build_element_tree()
+
+
+class IndentPhase(Phase):
+    """indent() on the whole xml tree."""
+    NAME = 'indent'
+
+    def setup(self, filePath):
+        return ET.parse(filePath).getroot()
+
+    def run(self, root):
+        indent(root)
+
+
+class SerializePhase(Phase):
+    """serialize(): convert the xml tree into yWriter xml text."""
+    NAME = 'serialize'
+
+    def setup(self, filePath):
+        return ET.parse(filePath).getroot()
+
+    def run(self, root):
+        serialize(root, Yw7File._CDATA_TAGS)
+
+
+class PostXmlPhase(Phase):
+    """Yw7File._post_xml_file(): the former post-processing of the file written by ElementTree."""
+    NAME = 'post_xml_file'
+
+    def setup(self, filePath):
+        copyPath = self._copy(filePath)
+        ET.parse(filePath).write(copyPath, xml_declaration=False, encoding='utf-8')
+        return copyPath
+
+    def run(self, filePath):
+        Yw7File(filePath)._post_xml_file(filePath)
+
+
+class WritePhase(Phase):
+    """Yw7File.write() after changing all chapter titles."""
+    NAME = 'write'
+
+    def setup(self, filePath):
+        novel = Yw7File(self._copy(filePath))
+        novel.read()
+        for chId in novel.srtChapters:
+            novel.chapters[chId].title = f'{novel.chapters[chId].title}*'
+        return novel
+
+    def run(self, novel):
+        novel.write()
+
+
+PHASES = (ReadPhase, ReadChaptersPhase, RenumberPhase, BuildTreePhase, IndentPhase, SerializePhase, PostXmlPhase, WritePhase)
+
+
+def percentile(values, fraction):
+    """Return the percentile of the values using the nearest-rank method."""
+    values = sorted(values)
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[rank - 1]
+
+
+def measure(phase, filePath, repeat):
+    """Time a phase and measure its peak memory.
+
+    Return a dictionary with the results.
+    Setup is not included in the measurement.
+    The peak memory is measured in an additional run, because tracemalloc slows down the code.
+    """
+    times = []
+    for __ in range(repeat):
+        state = phase.setup(filePath)
+        gc.collect()
+        startTime = time.perf_counter()
+        phase.run(state)
+        times.append(time.perf_counter() - startTime)
+        state = None
+
+    state = phase.setup(filePath)
+    gc.collect()
+    tracemalloc.start()
+    phase.run(state)
+    __, peakMemory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(
+        median=statistics.median(times),
+        p95=percentile(times, 0.95),
+        min=min(times),
+        peakMemory=peakMemory,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time reading, renumbering, and writing of synthetic yWriter projects.')
+    parser.add_argument('--sizes', nargs='+', choices=PROJECT_SIZES, default=['small', 'medium'],
+                        help='project sizes (default: small medium)')
+    parser.add_argument('--phases', nargs='+', choices=[phase.NAME for phase in PHASES],
+                        default=[phase.NAME for phase in PHASES], help='phases to time (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed runs per phase (default: 5)')
+    parser.add_argument('--seed', type=int, default=1, help='seed for the project generator (default: 1)')
+    parser.add_argument('--json', metavar='FILE', help='write the results to a JSON file')
+    args = parser.parse_args()
+
+    results = []
+    print(f'{"size":8} {"phase":14} {"median":>10} {"p95":>10} {"peak memory":>12}')
+    with tempfile.TemporaryDirectory() as workDir:
+        for size in args.sizes:
+            filePath = os.path.join(workDir, f'{size}.yw7')
+            generator = Yw7Generator(seed=args.seed, parts=PROJECT_SIZES[size]['chapters'] // 20,
+                                     unusedChapters=2, notesChapters=2, todoChapters=1, **PROJECT_SIZES[size])
+            message = generator.generate(filePath)
+            if message.startswith('!'):
+                sys.exit(message)
+
+            for phase in PHASES:
+                if not phase.NAME in args.phases:
+                    continue
+
+                result = dict(
+                    size=size,
+                    chapters=PROJECT_SIZES[size]['chapters'],
+                    scenes=PROJECT_SIZES[size]['chapters'] * PROJECT_SIZES[size]['scenes'],
+                    fileSize=os.path.getsize(filePath),
+                    phase=phase.NAME,
+                    repeat=args.repeat,
+                    )
+                result.update(measure(phase(workDir), filePath, args.repeat))
+                results.append(result)
+                print(f'{size:8} {phase.NAME:14} {result["median"] * 1000:8.1f}ms {result["p95"] * 1000:8.1f}ms'
+                      f' {result["peakMemory"] / 1024 / 1024:9.1f}MiB')
+
+    if args.json:
+        report = dict(
+            python=platform.python_version(),
+            platform=platform.platform(),
+            time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+            seed=args.seed,
+            results=results,
+            )
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+"""Generate synthetic yWriter 7 projects for performance testing.
+
+The projects are written by Yw7File, so they have the same xml layout
+as projects written by the application.
+The output is deterministic for a given seed.
+
+usage: yw7_generator.py [options] filePath
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from pywriter.pywriter_globals import *
+from pywriter.yw.yw7_file import Yw7File
+
+WORDS = ('the', 'a', 'he', 'she', 'they', 'said', 'went', 'house', 'night', 'door', 'light', 'voice',
+         'quickly', 'slowly', 'old', 'dark', 'river', 'letter', 'morning', 'never', 'again', 'window',
+         'looked', 'opened', 'heard', 'walked', 'garden', 'silence', 'fire', 'road', 'city', 'friend')
+
+PROJECT_SIZES = dict(
+    small=dict(chapters=20, scenes=5),
+    medium=dict(chapters=200, scenes=10),
+    large=dict(chapters=1000, scenes=20),
+    )
+# Presets for the number of chapters and scenes per chapter.
+
+
+class Yw7Generator:
+    """Generator for synthetic yWriter 7 projects.
+
+    Public methods:
+        generate(filePath) -- Write a synthetic project.
+
+    Public instance variables:
+        seed -- int: seed of the random number generator.
+        parts -- int: number of part headings.
+        chapters -- int: number of normal chapters.
+        unusedChapters -- int: number of "Unused" chapters.
+        notesChapters -- int: number of "Notes" chapters.
+        todoChapters -- int: number of "Todo" chapters.
+        scenes -- int: number of scenes per chapter.
+        characters -- int: number of characters.
+        locations -- int: number of locations.
+        items -- int: number of items.
+        projectNotes -- int: number of project notes.
+        sceneWords -- int: average number of words per scene.
+    """
+
+    def __init__(self, seed=1, parts=0, chapters=10, unusedChapters=0, notesChapters=0, todoChapters=0,
+                 scenes=5, characters=10, locations=5, items=5, projectNotes=2, sceneWords=500):
+        """Initialize instance variables.
+
+        Optional arguments:
+            see the public instance variables.
+        """
+        self.seed = seed
+        self.parts = parts
+        self.chapters = chapters
+        self.unusedChapters = unusedChapters
+        self.notesChapters = notesChapters
+        self.todoChapters = todoChapters
+        self.scenes = scenes
+        self.characters = characters
+        self.locations = locations
+        self.items = items
+        self.projectNotes = projectNotes
+        self.sceneWords = sceneWords
+
+    def generate(self, filePath):
+        """Write a synthetic project.
+
+        Positional arguments:
+            filePath -- str: path to the .yw7 file to create.
+
+        Return a message beginning with the ERROR constant in case of error.
+        """
+        rng = random.Random(self.seed)
+        novel = Yw7File(filePath)
+        novel.title = 'Synthetic project'
+        novel.desc = self._text(rng, 50)
+        novel.authorName = 'Benchmark'
+        novel.languageCode = 'en'
+        novel.countryCode = 'US'
+        # Set the locale explicitly, so the output does not depend on the machine.
+
+        #--- Story world.
+        for crIndex in range(1, self.characters + 1):
+            crId = str(crIndex)
+            character = novel.CHARACTER_CLASS()
+            character.title = f'Character {crIndex}'
+            character.fullName = f'Character {crIndex} {rng.choice(WORDS).capitalize()}'
+            character.desc = self._text(rng, 30)
+            character.isMajor = crIndex <= max(1, self.characters // 5)
+            novel.characters[crId] = character
+            novel.srtCharacters.append(crId)
+        for lcIndex in range(1, self.locations + 1):
+            lcId = str(lcIndex)
+            location = novel.WE_CLASS()
+            location.title = f'Location {lcIndex}'
+            location.desc = self._text(rng, 20)
+            novel.locations[lcId] = location
+            novel.srtLocations.append(lcId)
+        for itIndex in range(1, self.items + 1):
+            itId = str(itIndex)
+            item = novel.WE_CLASS()
+            item.title = f'Item {itIndex}'
+            item.desc = self._text(rng, 20)
+            novel.items[itId] = item
+            novel.srtItems.append(itId)
+        for pnIndex in range(1, self.projectNotes + 1):
+            pnId = str(pnIndex)
+            projectNote = novel.PN_CLASS()
+            projectNote.title = f'Note {pnIndex}'
+            projectNote.desc = self._text(rng, 40)
+            novel.projectNotes[pnId] = projectNote
+            novel.srtPrjNotes.append(pnId)
+
+        #--- Chapter structure.
+        # Chapter types: 0 = Normal, 1 = Notes, 2 = Todo, 3 = Unused.
+        # Parts are placed evenly before the normal chapters;
+        # the other chapter types are spread randomly.
+        chTypes = [0] * self.chapters + [1] * self.notesChapters + [2] * self.todoChapters + [3] * self.unusedChapters
+        rng.shuffle(chTypes)
+        partPositions = set()
+        if self.parts:
+            for partIndex in range(self.parts):
+                partPositions.add(partIndex * len(chTypes) // self.parts)
+        chIndex = 0
+        scIndex = 0
+        partNumber = 0
+        chapterNumber = 0
+        for position, chType in enumerate(chTypes):
+            if position in partPositions:
+                partNumber += 1
+                chIndex += 1
+                chId = str(chIndex)
+                part = novel.CHAPTER_CLASS()
+                part.title = f'Part {partNumber}'
+                part.chLevel = 1
+                part.chType = 0
+                novel.chapters[chId] = part
+                novel.srtChapters.append(chId)
+            chIndex += 1
+            chId = str(chIndex)
+            chapter = novel.CHAPTER_CLASS()
+            if chType == 0:
+                chapterNumber += 1
+                chapter.title = f'Chapter {chapterNumber}'
+            else:
+                chapter.title = f'{("", "Notes", "Todo", "Unused")[chType]} {chIndex}'
+            chapter.desc = self._text(rng, 10)
+            chapter.chLevel = 0
+            chapter.chType = chType
+            novel.chapters[chId] = chapter
+            novel.srtChapters.append(chId)
+            for __ in range(self.scenes):
+                scIndex += 1
+                scId = str(scIndex)
+                scene = novel.SCENE_CLASS()
+                scene.title = f'Scene {scIndex}'
+                scene.desc = self._text(rng, 15)
+                scene.sceneContent = self._scene_content(rng)
+                scene.scType = chType
+                scene.status = rng.randint(1, 5)
+                if self.characters:
+                    scene.characters = rng.sample(novel.srtCharacters, min(3, self.characters))
+                if self.locations:
+                    scene.locations = [rng.choice(novel.srtLocations)]
+                if self.items and rng.random() < 0.3:
+                    scene.items = [rng.choice(novel.srtItems)]
+                novel.scenes[scId] = scene
+                chapter.srtScenes.append(scId)
+        return novel.write()
+
+    def _text(self, rng, words):
+        """Return a sentence-like text with the given number of words."""
+        return f'{" ".join(rng.choice(WORDS) for __ in range(words)).capitalize()}.'
+
+    def _scene_content(self, rng):
+        """Return a scene text of about sceneWords words, with paragraphs and some markup."""
+        wordsLeft = rng.randint(self.sceneWords // 2, self.sceneWords * 3 // 2)
+        paragraphs = []
+        while wordsLeft > 0:
+            paragraphWords = min(wordsLeft, rng.randint(20, 80))
+            paragraph = self._text(rng, paragraphWords)
+            if rng.random() < 0.1:
+                paragraph = f'[i]{paragraph}[/i]'
+            paragraphs.append(paragraph)
+            wordsLeft -= paragraphWords
+        return '\n'.join(paragraphs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic yWriter 7 project.')
+    parser.add_argument('filePath', metavar='Path', help='path of the .yw7 file to create')
+    parser.add_argument('--size', choices=PROJECT_SIZES, help='preset for the number of chapters and scenes')
+    parser.add_argument('--seed', type=int, default=1, help='seed of the random number generator')
+    parser.add_argument('--parts', type=int, default=0, help='number of part headings')
+    parser.add_argument('--chapters', type=int, default=10, help='number of normal chapters')
+    parser.add_argument('--unused', type=int, default=0, help='number of "Unused" chapters')
+    parser.add_argument('--notes', type=int, default=0, help='number of "Notes" chapters')
+    parser.add_argument('--todo', type=int, default=0, help='number of "Todo" chapters')
+    parser.add_argument('--scenes', type=int, default=5, help='number of scenes per chapter')
+    parser.add_argument('--characters', type=int, default=10, help='number of characters')
+    parser.add_argument('--locations', type=int, default=5, help='number of locations')
+    parser.add_argument('--items', type=int, default=5, help='number of items')
+    parser.add_argument('--prjnotes', type=int, default=2, help='number of project notes')
+    parser.add_argument('--words', type=int, default=500, help='average number of words per scene')
+    args = parser.parse_args()
+    generator = Yw7Generator(seed=args.seed, parts=args.parts, chapters=args.chapters,
+                             unusedChapters=args.unused, notesChapters=args.notes, todoChapters=args.todo,
+                             scenes=args.scenes, characters=args.characters, locations=args.locations,
+                             items=args.items, projectNotes=args.prjnotes, sceneWords=args.words)
+    if args.size:
+        generator.chapters = PROJECT_SIZES[args.size]['chapters']
+        generator.scenes = PROJECT_SIZES[args.size]['scenes']
+    message = generator.generate(args.filePath)
+    print(message)
+    if message.startswith(ERROR):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,122 @@
-"""Provide a generic class for yWriter element representation.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-
-
-class BasicElement:
-    """Basic element representation (may be a project note).
-    
-    Public instance variables:
-        title -- str: title (name).
-        desc -- str: description.
-        kwVar -- dict: custom keyword variables.
-    """
-
-    def __init__(self):
-        """Initialize instance variables."""
-        self.title = None
-        # str
-        # xml: <Title>
-
-        self.desc = None
-        # str
-        # xml: <Desc>
-
-        self.kwVar = {}
-        # dictionary
-        # Optional key/value instance variables for customization.
+"""Provide a generic class for yWriter element representation.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+
+
+class BasicElement:
+    """Basic element representation (may be a project note).
+    
+    Public methods:
+        reset_changes() -- Mark all instance variables as unchanged.
+        set_changed(name) -- Mark an instance variable as changed.
+        is_changed(*names) -- Return True if instance variables have changed.
+
+    Public instance variables:
+        title -- str: title (name).
+        desc -- str: description.
+        kwVar -- dict: custom keyword variables.
+    """
+    _UNTRACKED_VARS = ('_changes', '_snapshot')
+    # Instance variables not considered by change tracking.
+
+    def __init__(self):
+        """Initialize instance variables."""
+        self._changes = None
+        # set of str: names of the instance variables marked as changed by set_changed().
+        # None means that changes are not tracked, i.e. the whole element is considered changed.
+
+        self._snapshot = None
+        # tuple: values of the tracked instance variables at the last reset_changes() call.
+        # Lists and dictionaries are stored as tuples, so in-place modifications are detected.
+
+        self.title = None
+        # str
+        # xml: <Title>
+
+        self.desc = None
+        # str
+        # xml: <Desc>
+
+        self.kwVar = {}
+        # dictionary
+        # Optional key/value instance variables for customization.
+
+    def reset_changes(self):
+        """Mark all instance variables as unchanged, and start tracking changes.
+        
+        Take a snapshot of the instance variables, to be compared by is_changed().
+        """
+        self._changes = set()
+        self._snapshot = self._get_state(self._get_tracked_vars())
+
+    def set_changed(self, name=None):
+        """Mark an instance variable as changed.
+        
+        Optional arguments:
+            name -- str: name of the instance variable. If None, consider the whole element changed.
+        """
+        if name is None:
+            self._changes = None
+            self._snapshot = None
+        elif self._changes is not None:
+            self._changes.add(name)
+
+    def is_changed(self, *names):
+        """Return True if instance variables have changed since the last reset_changes() call.
+        
+        Optional arguments:
+            names -- names of the instance variables to check. If omitted, check all.
+            
+        Assignments and in-place modifications are detected by comparing the snapshot.
+        Properties are checked by the instance variables holding their values, e.g. _sceneContent.
+        """
+        if self._changes is None:
+            return True
+
+        trackedVars = self._get_tracked_vars()
+        if len(trackedVars) != len(self._snapshot):
+            return True
+
+        if not names:
+            return bool(self._changes) or self._get_state(trackedVars) != self._snapshot
+
+        if not self._changes.isdisjoint(names):
+            return True
+
+        for name in names:
+            for varName in (name, f'_{name}'):
+                if varName in trackedVars:
+                    i = trackedVars.index(varName)
+                    if self._get_state((varName,)) != self._snapshot[i:i + 1]:
+                        return True
+
+                    break
+
+        return False
+
+    def _get_tracked_vars(self):
+        """Return a tuple with the names of the instance variables considered by change tracking."""
+        try:
+            names = type(self).__slots__
+        except AttributeError:
+            names = vars(self)
+        return tuple(name for name in names if not name in self._UNTRACKED_VARS)
+
+    def _get_state(self, names):
+        """Return a tuple with the values of the named instance variables, lists and dictionaries as tuples.
+        
+        An empty dictionary is stored as None, so a dictionary created on first access, 
+        like the compact classes' kwVar, does not count as a change.
+        """
+        state = []
+        for name in names:
+            value = getattr(self, name)
+            if isinstance(value, list):
+                value = tuple(value)
+            elif isinstance(value, dict):
+                value = tuple(value.items()) or None
+            state.append(value)
+        return tuple(state)
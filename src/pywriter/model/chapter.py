@@ -1,89 +1,89 @@
-"""Provide a class for yWriter chapter representation.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-from pywriter.model.basic_element import BasicElement
-
-
-class Chapter(BasicElement):
-    """yWriter chapter representation.
-    
-    Public instance variables:
-        chLevel -- int: chapter level (part/chapter).
-        chType -- int: chapter type (Normal/Notes/Todo/Unused).
-        suppressChapterTitle -- bool: uppress chapter title when exporting.
-        isTrash -- bool: True, if the chapter is the project's trash bin.
-        suppressChapterBreak -- bool: Suppress chapter break when exporting.
-        srtScenes -- list of str: the chapter's sorted scene IDs.        
-    """
-
-    def __init__(self):
-        """Initialize instance variables.
-        
-        Extends the superclass constructor.
-        """
-        super().__init__()
-
-        self.chLevel = None
-        # int
-        # xml: <SectionStart>
-        # 0 = chapter level
-        # 1 = section level ("this chapter begins a section")
-
-        self.chType = None
-        # int
-        # 0 = Normal
-        # 1 = Notes
-        # 2 = Todo
-        # 3= Unused
-        # Applies to projects created by yWriter version 7.0.7.2+.
-        #
-        # xml: <ChapterType>
-        # xml: <Type>
-        # xml: <Unused>
-        #
-        # This is how yWriter 7.1.3.0 reads the chapter type:
-        #
-        # Type   |<Unused>|<Type>|<ChapterType>|chType
-        # -------+--------+------+--------------------
-        # Normal | N/A    | N/A  | N/A         | 0
-        # Normal | N/A    | 0    | N/A         | 0
-        # Notes  | x      | 1    | N/A         | 1
-        # Unused | -1     | 0    | N/A         | 3
-        # Normal | N/A    | x    | 0           | 0
-        # Notes  | x      | x    | 1           | 1
-        # Todo   | x      | x    | 2           | 2
-        # Unused | -1     | x    | x           | 3
-        #
-        # This is how yWriter 7.1.3.0 writes the chapter type:
-        #
-        # Type   |<Unused>|<Type>|<ChapterType>|chType
-        #--------+--------+------+-------------+------
-        # Normal | N/A    | 0    | 0           | 0
-        # Notes  | -1     | 1    | 1           | 1
-        # Todo   | -1     | 1    | 2           | 2
-        # Unused | -1     | 1    | 0           | 3
-
-        self.suppressChapterTitle = None
-        # bool
-        # xml: <Fields><Field_SuppressChapterTitle> 1
-        # True: Chapter heading not to be displayed in written document.
-        # False: Chapter heading to be displayed in written document.
-
-        self.isTrash = None
-        # bool
-        # xml: <Fields><Field_IsTrash> 1
-        # True: This chapter is the yw7 project's "trash bin".
-        # False: This chapter is not a "trash bin".
-
-        self.suppressChapterBreak = None
-        # bool
-        # xml: <Fields><Field_SuppressChapterBreak> 0
-
-        self.srtScenes = []
-        # list of str
-        # xml: <Scenes><ScID>
-        # The chapter's scene IDs. The order of its elements
-        # corresponds to the chapter's order of the scenes.
+"""Provide a class for yWriter chapter representation.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.model.basic_element import BasicElement
+
+
+class Chapter(BasicElement):
+    """yWriter chapter representation.
+    
+    Public instance variables:
+        chLevel -- int: chapter level (part/chapter).
+        chType -- int: chapter type (Normal/Notes/Todo/Unused).
+        suppressChapterTitle -- bool: uppress chapter title when exporting.
+        isTrash -- bool: True, if the chapter is the project's trash bin.
+        suppressChapterBreak -- bool: Suppress chapter break when exporting.
+        srtScenes -- list of str: the chapter's sorted scene IDs.        
+    """
+
+    def __init__(self):
+        """Initialize instance variables.
+        
+        Extends the superclass constructor.
+        """
+        super().__init__()
+
+        self.chLevel = None
+        # int
+        # xml: <SectionStart>
+        # 0 = chapter level
+        # 1 = section level ("this chapter begins a section")
+
+        self.chType = None
+        # int
+        # 0 = Normal
+        # 1 = Notes
+        # 2 = Todo
+        # 3= Unused
+        # Applies to projects created by yWriter version 7.0.7.2+.
+        #
+        # xml: <ChapterType>
+        # xml: <Type>
+        # xml: <Unused>
+        #
+        # This is how yWriter 7.1.3.0 reads the chapter type:
+        #
+        # Type   |<Unused>|<Type>|<ChapterType>|chType
+        # -------+--------+------+--------------------
+        # Normal | N/A    | N/A  | N/A         | 0
+        # Normal | N/A    | 0    | N/A         | 0
+        # Notes  | x      | 1    | N/A         | 1
+        # Unused | -1     | 0    | N/A         | 3
+        # Normal | N/A    | x    | 0           | 0
+        # Notes  | x      | x    | 1           | 1
+        # Todo   | x      | x    | 2           | 2
+        # Unused | -1     | x    | x           | 3
+        #
+        # This is how yWriter 7.1.3.0 writes the chapter type:
+        #
+        # Type   |<Unused>|<Type>|<ChapterType>|chType
+        #--------+--------+------+-------------+------
+        # Normal | N/A    | 0    | 0           | 0
+        # Notes  | -1     | 1    | 1           | 1
+        # Todo   | -1     | 1    | 2           | 2
+        # Unused | -1     | 1    | 0           | 3
+
+        self.suppressChapterTitle = None
+        # bool
+        # xml: <Fields><Field_SuppressChapterTitle> 1
+        # True: Chapter heading not to be displayed in written document.
+        # False: Chapter heading to be displayed in written document.
+
+        self.isTrash = None
+        # bool
+        # xml: <Fields><Field_IsTrash> 1
+        # True: This chapter is the yw7 project's "trash bin".
+        # False: This chapter is not a "trash bin".
+
+        self.suppressChapterBreak = None
+        # bool
+        # xml: <Fields><Field_SuppressChapterBreak> 0
+
+        self.srtScenes = []
+        # list of str
+        # xml: <Scenes><ScID>
+        # The chapter's scene IDs. The order of its elements
+        # corresponds to the chapter's order of the scenes.
@@ -0,0 +1,69 @@
+"""Provide slotted variants of the yWriter element classes.
+
+The variants are subclasses of the original classes, storing the instance variables in slots.
+Since the original classes have no __slots__, the instances still have a __dict__ attribute,
+but the dictionary is not created as long as only the original instance variables are assigned.
+The custom keyword variables dictionary is created on first access.
+This saves a considerable amount of memory with large projects.
+
+Usage: Assign the variants to the CHAPTER_CLASS, SCENE_CLASS, CHARACTER_CLASS,
+WE_CLASS, and PN_CLASS constants of a Novel subclass (see CompactYw7File).
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.model.basic_element import BasicElement
+from pywriter.model.chapter import Chapter
+from pywriter.model.scene import Scene
+from pywriter.model.character import Character
+from pywriter.model.world_element import WorldElement
+
+
+def compact_class(elementClass):
+    """Return a slotted variant of an element class.
+
+    Positional arguments:
+        elementClass -- BasicElement subclass whose constructor takes no arguments.
+
+    The instance variables and their default values are taken from an instance of elementClass.
+    Lists and dictionaries are copied for each new instance.
+    kwVar is stored as None until it is accessed.
+    The methods and properties are inherited from elementClass.
+    """
+    defaults = []
+    for name, value in vars(elementClass()).items():
+        if name == 'kwVar':
+            defaults.append(('_kwVar', None))
+        else:
+            defaults.append((name, value))
+
+    def __init__(self):
+        """Initialize instance variables with the defaults of the original class."""
+        for name, value in defaults:
+            if isinstance(value, (list, dict)):
+                value = value.copy()
+            object.__setattr__(self, name, value)
+
+    def get_kwVar(self):
+        if self._kwVar is None:
+            self._kwVar = {}
+        return self._kwVar
+
+    def set_kwVar(self, kwVar):
+        self._kwVar = kwVar
+
+    namespace = dict(
+        __init__=__init__,
+        kwVar=property(get_kwVar, set_kwVar),
+        __slots__=tuple(name for name, __ in defaults),
+        __module__=__name__,
+        )
+    return type(f'Compact{elementClass.__name__}', (elementClass,), namespace)
+
+
+CompactBasicElement = compact_class(BasicElement)
+CompactWorldElement = compact_class(WorldElement)
+CompactCharacter = compact_class(Character)
+CompactChapter = compact_class(Chapter)
+CompactScene = compact_class(Scene)
@@ -1,19 +1,143 @@
-"""Helper module for ID generation.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-
-
-def create_id(elements):
-    """Return an unused ID for a new element.
-    
-    Positional arguments:
-        elements -- list or dictionary containing all existing IDs
-    """
-    i = 1
-    while str(i) in elements:
-        i += 1
-    return str(i)
-
+"""Helper module for ID generation.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from heapq import heappop
+from heapq import heappush
+
+
+def create_id(elements):
+    """Return an unused ID for a new element.
+    
+    Positional arguments:
+        elements -- list or dictionary containing all existing IDs
+    """
+    i = 1
+    while str(i) in elements:
+        i += 1
+    return str(i)
+
+
+class IdAllocator:
+    """Allocator for the IDs of a novel's elements.
+    
+    Return the same IDs as create_id(), i.e. the lowest unused numeric string,
+    but in constant time, by keeping track of the maximum ID and the ranges of free IDs per element kind.
+    Only the gaps between the existing IDs are stored, so high IDs take no extra time or memory.
+    The IDs handed out are reserved, so several IDs can be requested before the elements are added.
+    The collections are read when an ID is first requested, and whenever elements
+    have been removed without releasing their IDs.
+    If elements are removed and added without releasing and allocating their IDs, 
+    and the size does not decrease, the IDs returned are still unused, but may not be the lowest.
+    
+    Public methods:
+        create_id(kind) -- Return an unused ID for a new element of the given kind.
+        release_id(kind, elemId) -- Make the ID of a deleted element available again.
+        reset() -- Discard the tracked IDs.
+
+    Public class constants:
+        COLLECTIONS -- dict: (key: element kind; value: name of the novel's element dictionary).
+    """
+    COLLECTIONS = dict(
+        chapter='chapters',
+        scene='scenes',
+        character='characters',
+        location='locations',
+        item='items',
+        note='projectNotes',
+    )
+
+    def __init__(self, novel):
+        """Initialize instance variables.
+        
+        Positional arguments:
+            novel -- Novel instance whose element IDs are to be allocated.
+        """
+        self._novel = novel
+        self._kinds = {}
+        # key: element kind; value: list [elements, size, maximum ID, heap of free ID ranges, reserved IDs].
+        # size is the number of elements at the last call, minus the IDs released since.
+        # A free ID range is a tuple (start, stop), as for range().
+        # Reserved IDs are IDs handed out, whose elements may not have been added yet.
+
+    def create_id(self, kind):
+        """Return an unused ID for a new element of the given kind.
+        
+        Positional arguments:
+            kind -- str: 'chapter', 'scene', 'character', 'location', 'item', or 'note'.
+            
+        The new element is expected to be added to the novel's element dictionary.
+        The ID is not handed out again, unless it is released.
+        """
+        elements = getattr(self._novel, self.COLLECTIONS[kind])
+        state = self._kinds.get(kind)
+        if state is None or state[0] is not elements or len(elements) < state[1]:
+            state = self._scan(kind, elements, state)
+        free = state[3]
+        while free:
+            i, stop = heappop(free)
+            if i + 1 < stop:
+                heappush(free, (i + 1, stop))
+            if not str(i) in elements:
+                break
+        else:
+            i = state[2]
+            while True:
+                i += 1
+                if not str(i) in elements:
+                    break
+            state[2] = i
+        state[1] = len(elements)
+        state[4].add(i)
+        return str(i)
+
+    def release_id(self, kind, elemId):
+        """Make the ID of a deleted element available again.
+        
+        Positional arguments:
+            kind -- str: 'chapter', 'scene', 'character', 'location', 'item', or 'note'.
+            elemId -- str: ID of the element removed from the novel's element dictionary.
+        """
+        state = self._kinds.get(kind)
+        if state is not None:
+            i = int(elemId)
+            state[4].discard(i)
+            heappush(state[3], (i, i + 1))
+            state[1] -= 1
+
+    def reset(self):
+        """Discard the tracked IDs, so they are read again from the novel."""
+        self._kinds.clear()
+
+    def _scan(self, kind, elements, state):
+        """Read the maximum ID and the free ID ranges from the element dictionary, and return the new state.
+        
+        Positional arguments:
+            kind -- str: element kind.
+            elements -- the novel's element dictionary.
+            state -- the previous state of the element kind, or None.
+        
+        The reserved IDs of the previous state are kept, as long as their elements are not added.
+        """
+        reserved = set()
+        if state is not None and state[0] is elements:
+            reserved = {i for i in state[4] if not str(i) in elements}
+        ids = list(reserved)
+        for elemId in elements:
+            try:
+                ids.append(int(elemId))
+            except ValueError:
+                pass
+        free = []
+        # The ranges are appended in ascending order, so the list is a heap.
+        maxId = 0
+        for i in sorted(ids):
+            if i > maxId + 1:
+                free.append((maxId + 1, i))
+            if i > maxId:
+                maxId = i
+        state = [elements, len(elements), maxId, free, reserved]
+        self._kinds[kind] = state
+        return state
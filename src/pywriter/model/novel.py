@@ -1,310 +1,374 @@
-"""Provide a generic class for yWriter project representation.
-
-All classes representing specific file formats inherit from this class.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-from urllib.parse import quote
-import locale
-import os
-from pywriter.pywriter_globals import *
-from pywriter.model.basic_element import BasicElement
-from pywriter.model.chapter import Chapter
-from pywriter.model.scene import Scene
-from pywriter.model.character import Character
-from pywriter.model.world_element import WorldElement
-
-
-class Novel(BasicElement):
-    """Abstract yWriter project file representation.
-
-    This class represents a file containing a novel with additional 
-    attributes and structural information (a full set or a subset
-    of the information included in an yWriter project file).
-
-    Public methods:
-        read() -- Parse the file and get the instance variables.
-        merge(source) -- Update instance variables from a source instance.
-        write() -- Write instance variables to the file.
-        get_languages() -- Determine the languages used in the document.
-        check_locale() -- Check the document's locale (language code and country code).
-
-    Public instance variables:
-        authorName -- str: author's name.
-        author bio -- str: information about the author.
-        fieldTitle1 -- str: scene rating field title 1.
-        fieldTitle2 -- str: scene rating field title 2.
-        fieldTitle3 -- str: scene rating field title 3.
-        fieldTitle4 -- str: scene rating field title 4.
-        chapters -- dict: (key: ID; value: chapter instance).
-        scenes -- dict: (key: ID, value: scene instance).
-        srtChapters -- list: the novel's sorted chapter IDs.
-        locations -- dict: (key: ID, value: WorldElement instance).
-        srtLocations -- list: the novel's sorted location IDs.
-        items -- dict: (key: ID, value: WorldElement instance).
-        srtItems -- list: the novel's sorted item IDs.
-        characters -- dict: (key: ID, value: character instance).
-        srtCharacters -- list: the novel's sorted character IDs.
-        projectNotes -- dict:  (key: ID, value: projectNote instance).
-        srtPrjNotes -- list: the novel's sorted project notes.
-        projectName -- str: URL-coded file name without suffix and extension. 
-        projectPath -- str: URL-coded path to the project directory. 
-        filePath -- str: path to the file (property with getter and setter). 
-    """
-    DESCRIPTION = _('Novel')
-    EXTENSION = None
-    SUFFIX = None
-    # To be extended by subclass methods.
-
-    CHAPTER_CLASS = Chapter
-    SCENE_CLASS = Scene
-    CHARACTER_CLASS = Character
-    WE_CLASS = WorldElement
-    PN_CLASS = BasicElement
-
-    _PRJ_KWVAR = ()
-    _CHP_KWVAR = ()
-    _SCN_KWVAR = ()
-    _CRT_KWVAR = ()
-    _LOC_KWVAR = ()
-    _ITM_KWVAR = ()
-    _PNT_KWVAR = ()
-    # Keyword variables for custom fields in the .yw7 XML file.
-
-    def __init__(self, filePath, **kwargs):
-        """Initialize instance variables.
-
-        Positional arguments:
-            filePath -- str: path to the file represented by the Novel instance.
-            
-        Optional arguments:
-            kwargs -- keyword arguments to be used by subclasses.  
-            
-        Extends the superclass constructor.          
-        """
-        super().__init__()
-
-        self.authorName = None
-        # str
-        # xml: <PROJECT><AuthorName>
-
-        self.authorBio = None
-        # str
-        # xml: <PROJECT><Bio>
-
-        self.fieldTitle1 = None
-        # str
-        # xml: <PROJECT><FieldTitle1>
-
-        self.fieldTitle2 = None
-        # str
-        # xml: <PROJECT><FieldTitle2>
-
-        self.fieldTitle3 = None
-        # str
-        # xml: <PROJECT><FieldTitle3>
-
-        self.fieldTitle4 = None
-        # str
-        # xml: <PROJECT><FieldTitle4>
-
-        self.chapters = {}
-        # dict
-        # xml: <CHAPTERS><CHAPTER><ID>
-        # key = chapter ID, value = Chapter instance.
-        # The order of the elements does not matter (the novel's order of the chapters is defined by srtChapters)
-
-        self.scenes = {}
-        # dict
-        # xml: <SCENES><SCENE><ID>
-        # key = scene ID, value = Scene instance.
-        # The order of the elements does not matter (the novel's order of the scenes is defined by
-        # the order of the chapters and the order of the scenes within the chapters)
-
-        self.languages = None
-        # list of str
-        # List of non-document languages occurring as scene markup.
-        # Format: ll-CC, where ll is the language code, and CC is the country code.
-
-        self.srtChapters = []
-        # list of str
-        # The novel's chapter IDs. The order of its elements corresponds to the novel's order of the chapters.
-
-        self.locations = {}
-        # dict
-        # xml: <LOCATIONS>
-        # key = location ID, value = WorldElement instance.
-        # The order of the elements does not matter.
-
-        self.srtLocations = []
-        # list of str
-        # The novel's location IDs. The order of its elements
-        # corresponds to the XML project file.
-
-        self.items = {}
-        # dict
-        # xml: <ITEMS>
-        # key = item ID, value = WorldElement instance.
-        # The order of the elements does not matter.
-
-        self.srtItems = []
-        # list of str
-        # The novel's item IDs. The order of its elements corresponds to the XML project file.
-
-        self.characters = {}
-        # dict
-        # xml: <CHARACTERS>
-        # key = character ID, value = Character instance.
-        # The order of the elements does not matter.
-
-        self.srtCharacters = []
-        # list of str
-        # The novel's character IDs. The order of its elements corresponds to the XML project file.
-
-        self.projectNotes = {}
-        # dict
-        # xml: <PROJECTNOTES>
-        # key = note ID, value = note instance.
-        # The order of the elements does not matter.
-
-        self.srtPrjNotes = []
-        # list of str
-        # The novel's projectNote IDs. The order of its elements corresponds to the XML project file.
-
-        self._filePath = None
-        # str
-        # Path to the file. The setter only accepts files of a supported type as specified by EXTENSION.
-
-        self.projectName = None
-        # str
-        # URL-coded file name without suffix and extension.
-
-        self.projectPath = None
-        # str
-        # URL-coded path to the project directory.
-
-        self.languageCode = None
-        self.countryCode = None
-
-        self.filePath = filePath
-
-    @property
-    def filePath(self):
-        return self._filePath
-
-    @filePath.setter
-    def filePath(self, filePath):
-        """Setter for the filePath instance variable.
-                
-        - Format the path string according to Python's requirements. 
-        - Accept only filenames with the right suffix and extension.
-        """
-        filePath = filePath.replace('\\', '/')
-        if self.SUFFIX is not None:
-            suffix = self.SUFFIX
-        else:
-            suffix = ''
-        if filePath.lower().endswith(f'{suffix}{self.EXTENSION}'.lower()):
-            self._filePath = filePath
-            head, tail = os.path.split(os.path.realpath(filePath))
-            self.projectPath = quote(head.replace('\\', '/'), '/:')
-            self.projectName = quote(tail.replace(f'{suffix}{self.EXTENSION}', ''))
-
-    def read(self):
-        """Parse the file and get the instance variables.
-        
-        Return a message beginning with the ERROR constant in case of error.
-        This is a stub to be overridden by subclass methods.
-        """
-        return f'{ERROR}Read method is not implemented.'
-
-    def merge(self, source):
-        """Update instance variables from a source instance.
-        
-        Positional arguments:
-            source -- Novel subclass instance to merge.
-        
-        Return a message beginning with the ERROR constant in case of error.
-        This is a stub to be overridden by subclass methods.
-        """
-        return f'{ERROR}Merge method is not implemented.'
-
-    def write(self):
-        """Write instance variables to the file.
-        
-        Return a message beginning with the ERROR constant in case of error.
-        This is a stub to be overridden by subclass methods.
-        """
-        return f'{ERROR}Write method is not implemented.'
-
-    def _convert_to_yw(self, text):
-        """Return text, converted from source format to yw7 markup.
-        
-        Positional arguments:
-            text -- string to convert.
-        
-        This is a stub to be overridden by subclass methods.
-        """
-        return text.rstrip()
-
-    def _convert_from_yw(self, text, quick=False):
-        """Return text, converted from yw7 markup to target format.
-        
-        Positional arguments:
-            text -- string to convert.
-        
-        Optional arguments:
-            quick -- bool: if True, apply a conversion mode for one-liners without formatting.
-        
-        This is a stub to be overridden by subclass methods.
-        """
-        return text.rstrip()
-
-    def get_languages(self):
-        """Determine the languages used in the document.
-        
-        Populate the self.languages list with all language codes found in the scene contents.        
-        Example:
-        - language markup: 'Standard text [lang=en-AU]Australian text[/lang=en-AU].'
-        - language code: 'en-AU'
-        """
-        self.languages = []
-        for scId in self.scenes:
-            text = self.scenes[scId].sceneContent
-            if text:
-                for language in get_languages(text):
-                    if not language in self.languages:
-                        self.languages.append(language)
-
-    def check_locale(self):
-        """Check the document's locale (language code and country code).
-        
-        If the locale is missing, set the system locale.  
-        If the locale doesn't look plausible, set "no language".        
-        """
-        if not self.languageCode or not self.countryCode:
-            # Language or country isn't set.
-            try:
-                sysLng, sysCtr = locale.getlocale()[0].split('_')
-            except:
-                # Fallback for old Windows versions.
-                sysLng, sysCtr = locale.getdefaultlocale()[0].split('_')
-            self.languageCode = sysLng
-            self.countryCode = sysCtr
-            return
-
-        try:
-            # Plausibility check: code must have two characters.
-            if len(self.languageCode) == 2:
-                if len(self.countryCode) == 2:
-                    return
-                    # keep the setting
-        except:
-            # code isn't a string
-            pass
-        # Existing language or country field looks not plausible
-        self.languageCode = 'zxx'
-        self.countryCode = 'none'
-
+"""Provide a generic class for yWriter project representation.
+
+All classes representing specific file formats inherit from this class.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from urllib.parse import quote
+import locale
+import os
+from pywriter.pywriter_globals import *
+from pywriter.model.basic_element import BasicElement
+from pywriter.model.chapter import Chapter
+from pywriter.model.scene import Scene
+from pywriter.model.character import Character
+from pywriter.model.world_element import WorldElement
+from pywriter.model.id_generator import IdAllocator
+from pywriter.model.novel_index import NovelIndex
+
+
+class Novel(BasicElement):
+    """Abstract yWriter project file representation.
+
+    This class represents a file containing a novel with additional 
+    attributes and structural information (a full set or a subset
+    of the information included in an yWriter project file).
+
+    Public methods:
+        read() -- Parse the file and get the instance variables.
+        merge(source) -- Update instance variables from a source instance.
+        write() -- Write instance variables to the file.
+        get_languages() -- Determine the languages used in the document.
+        check_locale() -- Check the document's locale (language code and country code).
+        reset_changes() -- Mark the project and all its elements as unchanged.
+        set_changed(name) -- Mark an instance variable or the whole project as changed.
+        invalidate_index() -- Have the structural indexes rebuilt on next access.
+
+    Public instance variables:
+        authorName -- str: author's name.
+        author bio -- str: information about the author.
+        fieldTitle1 -- str: scene rating field title 1.
+        fieldTitle2 -- str: scene rating field title 2.
+        fieldTitle3 -- str: scene rating field title 3.
+        fieldTitle4 -- str: scene rating field title 4.
+        chapters -- dict: (key: ID; value: chapter instance).
+        scenes -- dict: (key: ID, value: scene instance).
+        srtChapters -- list: the novel's sorted chapter IDs.
+        locations -- dict: (key: ID, value: WorldElement instance).
+        srtLocations -- list: the novel's sorted location IDs.
+        items -- dict: (key: ID, value: WorldElement instance).
+        srtItems -- list: the novel's sorted item IDs.
+        characters -- dict: (key: ID, value: character instance).
+        srtCharacters -- list: the novel's sorted character IDs.
+        projectNotes -- dict:  (key: ID, value: projectNote instance).
+        srtPrjNotes -- list: the novel's sorted project notes.
+        projectName -- str: URL-coded file name without suffix and extension. 
+        projectPath -- str: URL-coded path to the project directory. 
+        filePath -- str: path to the file (property with getter and setter). 
+        idAllocator -- IdAllocator instance: provides IDs for new elements.
+        index -- NovelIndex instance: structural indexes (read-only property; see invalidate_index()).
+    """
+    DESCRIPTION = _('Novel')
+    EXTENSION = None
+    SUFFIX = None
+    # To be extended by subclass methods.
+
+    CHAPTER_CLASS = Chapter
+    SCENE_CLASS = Scene
+    CHARACTER_CLASS = Character
+    WE_CLASS = WorldElement
+    PN_CLASS = BasicElement
+    ID_ALLOCATOR_CLASS = IdAllocator
+    INDEX_CLASS = NovelIndex
+
+    _UNTRACKED_VARS = BasicElement._UNTRACKED_VARS + (
+        'chapters', 'scenes', 'locations', 'items', 'characters', 'projectNotes',
+        'idAllocator', '_index')
+    # The elements track their own changes; adding or removing elements changes the sort order lists.
+
+    _PRJ_KWVAR = ()
+    _CHP_KWVAR = ()
+    _SCN_KWVAR = ()
+    _CRT_KWVAR = ()
+    _LOC_KWVAR = ()
+    _ITM_KWVAR = ()
+    _PNT_KWVAR = ()
+    # Keyword variables for custom fields in the .yw7 XML file.
+
+    def __init__(self, filePath, **kwargs):
+        """Initialize instance variables.
+
+        Positional arguments:
+            filePath -- str: path to the file represented by the Novel instance.
+            
+        Optional arguments:
+            kwargs -- keyword arguments to be used by subclasses.  
+            
+        Extends the superclass constructor.          
+        """
+        self._index = None
+        # NovelIndex instance
+        # None means that the index is to be rebuilt on access.
+
+        super().__init__()
+
+        self.authorName = None
+        # str
+        # xml: <PROJECT><AuthorName>
+
+        self.authorBio = None
+        # str
+        # xml: <PROJECT><Bio>
+
+        self.fieldTitle1 = None
+        # str
+        # xml: <PROJECT><FieldTitle1>
+
+        self.fieldTitle2 = None
+        # str
+        # xml: <PROJECT><FieldTitle2>
+
+        self.fieldTitle3 = None
+        # str
+        # xml: <PROJECT><FieldTitle3>
+
+        self.fieldTitle4 = None
+        # str
+        # xml: <PROJECT><FieldTitle4>
+
+        self.chapters = {}
+        # dict
+        # xml: <CHAPTERS><CHAPTER><ID>
+        # key = chapter ID, value = Chapter instance.
+        # The order of the elements does not matter (the novel's order of the chapters is defined by srtChapters)
+
+        self.scenes = {}
+        # dict
+        # xml: <SCENES><SCENE><ID>
+        # key = scene ID, value = Scene instance.
+        # The order of the elements does not matter (the novel's order of the scenes is defined by
+        # the order of the chapters and the order of the scenes within the chapters)
+
+        self.languages = None
+        # list of str
+        # List of non-document languages occurring as scene markup.
+        # Format: ll-CC, where ll is the language code, and CC is the country code.
+
+        self.srtChapters = []
+        # list of str
+        # The novel's chapter IDs. The order of its elements corresponds to the novel's order of the chapters.
+
+        self.locations = {}
+        # dict
+        # xml: <LOCATIONS>
+        # key = location ID, value = WorldElement instance.
+        # The order of the elements does not matter.
+
+        self.srtLocations = []
+        # list of str
+        # The novel's location IDs. The order of its elements
+        # corresponds to the XML project file.
+
+        self.items = {}
+        # dict
+        # xml: <ITEMS>
+        # key = item ID, value = WorldElement instance.
+        # The order of the elements does not matter.
+
+        self.srtItems = []
+        # list of str
+        # The novel's item IDs. The order of its elements corresponds to the XML project file.
+
+        self.characters = {}
+        # dict
+        # xml: <CHARACTERS>
+        # key = character ID, value = Character instance.
+        # The order of the elements does not matter.
+
+        self.srtCharacters = []
+        # list of str
+        # The novel's character IDs. The order of its elements corresponds to the XML project file.
+
+        self.projectNotes = {}
+        # dict
+        # xml: <PROJECTNOTES>
+        # key = note ID, value = note instance.
+        # The order of the elements does not matter.
+
+        self.srtPrjNotes = []
+        # list of str
+        # The novel's projectNote IDs. The order of its elements corresponds to the XML project file.
+
+        self._filePath = None
+        # str
+        # Path to the file. The setter only accepts files of a supported type as specified by EXTENSION.
+
+        self.projectName = None
+        # str
+        # URL-coded file name without suffix and extension.
+
+        self.projectPath = None
+        # str
+        # URL-coded path to the project directory.
+
+        self.languageCode = None
+        self.countryCode = None
+
+        self.idAllocator = self.ID_ALLOCATOR_CLASS(self)
+        # IdAllocator instance
+        # Call self.idAllocator.create_id(kind) to get the ID for a new chapter, scene, etc.
+
+        self.filePath = filePath
+
+    @property
+    def filePath(self):
+        return self._filePath
+
+    @filePath.setter
+    def filePath(self, filePath):
+        """Setter for the filePath instance variable.
+                
+        - Format the path string according to Python's requirements. 
+        - Accept only filenames with the right suffix and extension.
+        """
+        filePath = filePath.replace('\\', '/')
+        if self.SUFFIX is not None:
+            suffix = self.SUFFIX
+        else:
+            suffix = ''
+        if filePath.lower().endswith(f'{suffix}{self.EXTENSION}'.lower()):
+            self._filePath = filePath
+            head, tail = os.path.split(os.path.realpath(filePath))
+            self.projectPath = quote(head.replace('\\', '/'), '/:')
+            self.projectName = quote(tail.replace(f'{suffix}{self.EXTENSION}', ''))
+
+    def read(self):
+        """Parse the file and get the instance variables.
+        
+        Return a message beginning with the ERROR constant in case of error.
+        This is a stub to be overridden by subclass methods.
+        """
+        return f'{ERROR}Read method is not implemented.'
+
+    def merge(self, source):
+        """Update instance variables from a source instance.
+        
+        Positional arguments:
+            source -- Novel subclass instance to merge.
+        
+        Return a message beginning with the ERROR constant in case of error.
+        This is a stub to be overridden by subclass methods.
+        """
+        return f'{ERROR}Merge method is not implemented.'
+
+    def write(self):
+        """Write instance variables to the file.
+        
+        Return a message beginning with the ERROR constant in case of error.
+        This is a stub to be overridden by subclass methods.
+        """
+        return f'{ERROR}Write method is not implemented.'
+
+    @property
+    def index(self):
+        """Return the structural indexes, built on the first access after invalidate_index()."""
+        if self._index is None:
+            self._index = self.INDEX_CLASS(self)
+        return self._index
+
+    def invalidate_index(self):
+        """Have the structural indexes rebuilt on next access.
+        
+        Call this after changing the chapters or their order, 
+        or a chapter's chLevel, chType, isTrash, or srtScenes.
+        read(), merge(), and Splitter.split_scenes() call this method.
+        """
+        self._index = None
+
+    def reset_changes(self):
+        """Mark the project and all its elements as unchanged, and start tracking changes.
+        
+        Extends the superclass method.
+        """
+        super().reset_changes()
+        for elements in (self.chapters, self.scenes, self.locations, self.items, self.characters, self.projectNotes):
+            for element in elements.values():
+                element.reset_changes()
+
+    def set_changed(self, name=None):
+        """Mark an instance variable or the whole project as changed.
+        
+        Optional arguments:
+            name -- str: name of the instance variable. 
+                    If None, consider the project and all its elements changed.
+        
+        Extends the superclass method.
+        """
+        super().set_changed(name)
+        if name is None:
+            for elements in (self.chapters, self.scenes, self.locations, self.items, self.characters, self.projectNotes):
+                for element in elements.values():
+                    element.set_changed()
+
+    def _convert_to_yw(self, text):
+        """Return text, converted from source format to yw7 markup.
+        
+        Positional arguments:
+            text -- string to convert.
+        
+        This is a stub to be overridden by subclass methods.
+        """
+        return text.rstrip()
+
+    def _convert_from_yw(self, text, quick=False):
+        """Return text, converted from yw7 markup to target format.
+        
+        Positional arguments:
+            text -- string to convert.
+        
+        Optional arguments:
+            quick -- bool: if True, apply a conversion mode for one-liners without formatting.
+        
+        This is a stub to be overridden by subclass methods.
+        """
+        return text.rstrip()
+
+    def get_languages(self):
+        """Determine the languages used in the document.
+        
+        Populate the self.languages list with all language codes found in the scene contents.        
+        Example:
+        - language markup: 'Standard text [lang=en-AU]Australian text[/lang=en-AU].'
+        - language code: 'en-AU'
+        The scenes cache their language codes, so only changed scene contents are scanned again.
+        """
+        self.languages = []
+        found = set()
+        for scene in self.scenes.values():
+            for language in scene.languages:
+                if not language in found:
+                    found.add(language)
+                    self.languages.append(language)
+
+    def check_locale(self):
+        """Check the document's locale (language code and country code).
+        
+        If the locale is missing, set the system locale.  
+        If the locale doesn't look plausible, set "no language".        
+        """
+        if not self.languageCode or not self.countryCode:
+            # Language or country isn't set.
+            try:
+                sysLng, sysCtr = locale.getlocale()[0].split('_')
+            except:
+                # Fallback for old Windows versions.
+                sysLng, sysCtr = locale.getdefaultlocale()[0].split('_')
+            self.languageCode = sysLng
+            self.countryCode = sysCtr
+            return
+
+        try:
+            # Plausibility check: code must have two characters.
+            if len(self.languageCode) == 2:
+                if len(self.countryCode) == 2:
+                    return
+                    # keep the setting
+        except:
+            # code isn't a string
+            pass
+        # Existing language or country field looks not plausible
+        self.languageCode = 'zxx'
+        self.countryCode = 'none'
+
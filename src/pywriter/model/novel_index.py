@@ -0,0 +1,68 @@
+"""Provide a class for structural indexes of a novel.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+
+
+class NovelIndex:
+    """Structural indexes of a novel, built in a single pass over its chapters.
+
+    The index is a snapshot. Novel rebuilds it on access, after the structure has changed
+    (see Novel.invalidate_index()).
+
+    Public methods:
+        rebuild(novel) -- Build the indexes from the novel's chapters.
+
+    Public instance variables:
+        sceneChapters -- dict: (key: scene ID; value: ID of the chapter containing the scene).
+        chapterPositions -- dict: (key: chapter ID; value: position in the novel's srtChapters list).
+        partPositions -- list of int: srtChapters positions of the parts (chapters beginning a new section).
+        chaptersByType -- dict: (key: chapter type; value: list of chapter IDs in srtChapters order).
+        chaptersByLevel -- dict: (key: chapter level; value: list of chapter IDs in srtChapters order).
+        trashChapters -- list of str: IDs of the chapters marked as trash bin, in srtChapters order.
+    """
+
+    def __init__(self, novel=None):
+        """Initialize instance variables.
+
+        Optional arguments:
+            novel -- Novel instance to build the indexes from. If None, the indexes are empty.
+        """
+        self.sceneChapters = {}
+        self.chapterPositions = {}
+        self.partPositions = []
+        self.chaptersByType = {}
+        self.chaptersByLevel = {}
+        self.trashChapters = []
+        if novel is not None:
+            self.rebuild(novel)
+
+    def rebuild(self, novel):
+        """Build the indexes from the novel's chapters.
+
+        Positional arguments:
+            novel -- Novel instance.
+
+        Scenes are mapped to the first chapter containing them in the novel's chapters dictionary,
+        so chapters not listed in srtChapters are included.
+        """
+        self.sceneChapters = {}
+        self.chapterPositions = {}
+        self.partPositions = []
+        self.chaptersByType = {}
+        self.chaptersByLevel = {}
+        self.trashChapters = []
+        for chId, chapter in novel.chapters.items():
+            for scId in chapter.srtScenes:
+                self.sceneChapters.setdefault(scId, chId)
+        for position, chId in enumerate(novel.srtChapters):
+            chapter = novel.chapters[chId]
+            self.chapterPositions[chId] = position
+            self.chaptersByType.setdefault(chapter.chType, []).append(chId)
+            self.chaptersByLevel.setdefault(chapter.chLevel, []).append(chId)
+            if chapter.chLevel == 1:
+                self.partPositions.append(position)
+            if chapter.isTrash:
+                self.trashChapters.append(chId)
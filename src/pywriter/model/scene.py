@@ -1,229 +1,271 @@
-"""Provide a class for yWriter scene representation.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-import re
-from pywriter.model.basic_element import BasicElement
-from pywriter.pywriter_globals import *
-
-
-class Scene(BasicElement):
-    """yWriter scene representation.
-    
-    Public instance variables:
-        sceneContent -- str: scene content (property with getter and setter).
-        wordCount - int: word count (derived; updated by the sceneContent setter).
-        letterCount - int: letter count (derived; updated by the sceneContent setter).
-        scType -- int: Scene type (Normal/Notes/Todo/Unused).
-        doNotExport -- bool: True if the scene is not to be exported to RTF.
-        status -- int: scene status (Outline/Draft/1st Edit/2nd Edit/Done).
-        notes -- str: scene notes in a single string.
-        tags -- list of scene tags. 
-        field1 -- int: scene ratings field 1.
-        field2 -- int: scene ratings field 2.
-        field3 -- int: scene ratings field 3.
-        field4 -- int: scene ratings field 4.
-        appendToPrev -- bool: if True, append the scene without a divider to the previous scene.
-        isReactionScene -- bool: if True, the scene is "reaction". Otherwise, it's "action". 
-        isSubPlot -- bool: if True, the scene belongs to a sub-plot. Otherwise it's main plot.  
-        goal -- str: the main actor's scene goal. 
-        conflict -- str: what hinders the main actor to achieve his goal.
-        outcome -- str: what comes out at the end of the scene.
-        characters -- list of character IDs related to this scene.
-        locations -- list of location IDs related to this scene. 
-        items -- list of item IDs related to this scene.
-        date -- str: specific start date in ISO format (yyyy-mm-dd).
-        time -- str: specific start time in ISO format (hh:mm).
-        minute -- str: unspecific start time: minutes.
-        hour -- str: unspecific start time: hour.
-        day -- str: unspecific start time: day.
-        lastsMinutes -- str: scene duration: minutes.
-        lastsHours -- str: scene duration: hours.
-        lastsDays -- str: scene duration: days. 
-        image -- str:  path to an image related to the scene. 
-    """
-    STATUS = (None, 'Outline', 'Draft', '1st Edit', '2nd Edit', 'Done')
-    # Emulate an enumeration for the scene status
-    # Since the items are used to replace text,
-    # they may contain spaces. This is why Enum cannot be used here.
-
-    ACTION_MARKER = 'A'
-    REACTION_MARKER = 'R'
-    NULL_DATE = '0001-01-01'
-    NULL_TIME = '00:00:00'
-
-    def __init__(self):
-        """Initialize instance variables.
-        
-        Extends the superclass constructor.
-        """
-        super().__init__()
-
-        self._sceneContent = None
-        # str
-        # xml: <SceneContent>
-        # Scene text with yW7 raw markup.
-
-        self.wordCount = 0
-        # int # xml: <WordCount>
-        # To be updated by the sceneContent setter
-
-        self.letterCount = 0
-        # int
-        # xml: <LetterCount>
-        # To be updated by the sceneContent setter
-
-        self.scType = None
-        # Scene type (Normal/Notes/Todo/Unused).
-        #
-        # xml: <Unused>
-        # xml: <Fields><Field_SceneType>
-        #
-        # This is how yWriter 7.1.3.0 reads the scene type:
-        #
-        # Type   |<Unused>|Field_SceneType>|scType
-        #--------+--------+----------------+------
-        # Notes  | x      | 1              | 1
-        # Todo   | x      | 2              | 2
-        # Unused | -1     | N/A            | 3
-        # Unused | -1     | 0              | 3
-        # Normal | N/A    | N/A            | 0
-        # Normal | N/A    | 0              | 0
-        #
-        # This is how yWriter 7.1.3.0 writes the scene type:
-        #
-        # Type   |<Unused>|Field_SceneType>|scType
-        #--------+--------+----------------+------
-        # Normal | N/A    | N/A            | 0
-        # Notes  | -1     | 1              | 1
-        # Todo   | -1     | 2              | 2
-        # Unused | -1     | 0              | 3
-
-        self.doNotExport = None
-        # bool
-        # xml: <ExportCondSpecific><ExportWhenRTF>
-
-        self.status = None
-        # int
-        # xml: <Status>
-        # 1 - Outline
-        # 2 - Draft
-        # 3 - 1st Edit
-        # 4 - 2nd Edit
-        # 5 - Done
-        # See also the STATUS list for conversion.
-
-        self.notes = None
-        # str
-        # xml: <Notes>
-
-        self.tags = None
-        # list of str
-        # xml: <Tags>
-
-        self.field1 = None
-        # str
-        # xml: <Field1>
-
-        self.field2 = None
-        # str
-        # xml: <Field2>
-
-        self.field3 = None
-        # str
-        # xml: <Field3>
-
-        self.field4 = None
-        # str
-        # xml: <Field4>
-
-        self.appendToPrev = None
-        # bool
-        # xml: <AppendToPrev> -1
-
-        self.isReactionScene = None
-        # bool
-        # xml: <ReactionScene> -1
-
-        self.isSubPlot = None
-        # bool
-        # xml: <SubPlot> -1
-
-        self.goal = None
-        # str
-        # xml: <Goal>
-
-        self.conflict = None
-        # str
-        # xml: <Conflict>
-
-        self.outcome = None
-        # str
-        # xml: <Outcome>
-
-        self.characters = None
-        # list of str
-        # xml: <Characters><CharID>
-
-        self.locations = None
-        # list of str
-        # xml: <Locations><LocID>
-
-        self.items = None
-        # list of str
-        # xml: <Items><ItemID>
-
-        self.date = None
-        # str
-        # xml: <SpecificDateMode>-1
-        # xml: <SpecificDateTime>1900-06-01 20:38:00
-
-        self.time = None
-        # str
-        # xml: <SpecificDateMode>-1
-        # xml: <SpecificDateTime>1900-06-01 20:38:00
-
-        self.minute = None
-        # str
-        # xml: <Minute>
-
-        self.hour = None
-        # str
-        # xml: <Hour>
-
-        self.day = None
-        # str
-        # xml: <Day>
-
-        self.lastsMinutes = None
-        # str
-        # xml: <LastsMinutes>
-
-        self.lastsHours = None
-        # str
-        # xml: <LastsHours>
-
-        self.lastsDays = None
-        # str
-        # xml: <LastsDays>
-
-        self.image = None
-        # str
-        # xml: <ImageFile>
-
-    @property
-    def sceneContent(self):
-        return self._sceneContent
-
-    @sceneContent.setter
-    def sceneContent(self, text):
-        """Set sceneContent updating word count and letter count."""
-        self._sceneContent = text
-        text = ADDITIONAL_WORD_LIMITS.sub(' ', text)
-        text = NO_WORD_LIMITS.sub('', text)
-        wordList = text.split()
-        self.wordCount = len(wordList)
-        text = NON_LETTERS.sub('', self._sceneContent)
-        self.letterCount = len(text)
+"""Provide a class for yWriter scene representation.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import re
+from pywriter.model.basic_element import BasicElement
+from pywriter.pywriter_globals import *
+
+
+class Scene(BasicElement):
+    """yWriter scene representation.
+    
+    Public instance variables:
+        sceneContent -- str: scene content (property with getter and setter).
+        wordCount - int: word count (derived; computed on first access and cached).
+        letterCount - int: letter count (derived; computed on first access and cached).
+        languages -- list of str: language codes used in the scene content (derived; computed on first access and cached).
+        scType -- int: Scene type (Normal/Notes/Todo/Unused).
+        doNotExport -- bool: True if the scene is not to be exported to RTF.
+        status -- int: scene status (Outline/Draft/1st Edit/2nd Edit/Done).
+        notes -- str: scene notes in a single string.
+        tags -- list of scene tags. 
+        field1 -- int: scene ratings field 1.
+        field2 -- int: scene ratings field 2.
+        field3 -- int: scene ratings field 3.
+        field4 -- int: scene ratings field 4.
+        appendToPrev -- bool: if True, append the scene without a divider to the previous scene.
+        isReactionScene -- bool: if True, the scene is "reaction". Otherwise, it's "action". 
+        isSubPlot -- bool: if True, the scene belongs to a sub-plot. Otherwise it's main plot.  
+        goal -- str: the main actor's scene goal. 
+        conflict -- str: what hinders the main actor to achieve his goal.
+        outcome -- str: what comes out at the end of the scene.
+        characters -- list of character IDs related to this scene.
+        locations -- list of location IDs related to this scene. 
+        items -- list of item IDs related to this scene.
+        date -- str: specific start date in ISO format (yyyy-mm-dd).
+        time -- str: specific start time in ISO format (hh:mm).
+        minute -- str: unspecific start time: minutes.
+        hour -- str: unspecific start time: hour.
+        day -- str: unspecific start time: day.
+        lastsMinutes -- str: scene duration: minutes.
+        lastsHours -- str: scene duration: hours.
+        lastsDays -- str: scene duration: days. 
+        image -- str:  path to an image related to the scene. 
+    """
+    STATUS = (None, 'Outline', 'Draft', '1st Edit', '2nd Edit', 'Done')
+    # Emulate an enumeration for the scene status
+    # Since the items are used to replace text,
+    # they may contain spaces. This is why Enum cannot be used here.
+
+    ACTION_MARKER = 'A'
+    REACTION_MARKER = 'R'
+    NULL_DATE = '0001-01-01'
+    NULL_TIME = '00:00:00'
+
+    _UNTRACKED_VARS = BasicElement._UNTRACKED_VARS + ('_wordCount', '_letterCount', '_languages')
+    # Cached values derived from the scene content, computed on access.
+
+    def __init__(self):
+        """Initialize instance variables.
+        
+        Extends the superclass constructor.
+        """
+        super().__init__()
+
+        self._sceneContent = None
+        # str
+        # xml: <SceneContent>
+        # Scene text with yW7 raw markup.
+
+        self._wordCount = 0
+        # int
+        # xml: <WordCount>
+        # Cached value; None means that it is to be computed from the scene content.
+
+        self._letterCount = 0
+        # int
+        # xml: <LetterCount>
+        # Cached value; None means that it is to be computed from the scene content.
+
+        self._languages = None
+        # list of str
+        # Language codes in order of their first appearance in the scene content.
+        # Cached value; None means that it is to be computed from the scene content.
+
+        self.scType = None
+        # Scene type (Normal/Notes/Todo/Unused).
+        #
+        # xml: <Unused>
+        # xml: <Fields><Field_SceneType>
+        #
+        # This is how yWriter 7.1.3.0 reads the scene type:
+        #
+        # Type   |<Unused>|Field_SceneType>|scType
+        #--------+--------+----------------+------
+        # Notes  | x      | 1              | 1
+        # Todo   | x      | 2              | 2
+        # Unused | -1     | N/A            | 3
+        # Unused | -1     | 0              | 3
+        # Normal | N/A    | N/A            | 0
+        # Normal | N/A    | 0              | 0
+        #
+        # This is how yWriter 7.1.3.0 writes the scene type:
+        #
+        # Type   |<Unused>|Field_SceneType>|scType
+        #--------+--------+----------------+------
+        # Normal | N/A    | N/A            | 0
+        # Notes  | -1     | 1              | 1
+        # Todo   | -1     | 2              | 2
+        # Unused | -1     | 0              | 3
+
+        self.doNotExport = None
+        # bool
+        # xml: <ExportCondSpecific><ExportWhenRTF>
+
+        self.status = None
+        # int
+        # xml: <Status>
+        # 1 - Outline
+        # 2 - Draft
+        # 3 - 1st Edit
+        # 4 - 2nd Edit
+        # 5 - Done
+        # See also the STATUS list for conversion.
+
+        self.notes = None
+        # str
+        # xml: <Notes>
+
+        self.tags = None
+        # list of str
+        # xml: <Tags>
+
+        self.field1 = None
+        # str
+        # xml: <Field1>
+
+        self.field2 = None
+        # str
+        # xml: <Field2>
+
+        self.field3 = None
+        # str
+        # xml: <Field3>
+
+        self.field4 = None
+        # str
+        # xml: <Field4>
+
+        self.appendToPrev = None
+        # bool
+        # xml: <AppendToPrev> -1
+
+        self.isReactionScene = None
+        # bool
+        # xml: <ReactionScene> -1
+
+        self.isSubPlot = None
+        # bool
+        # xml: <SubPlot> -1
+
+        self.goal = None
+        # str
+        # xml: <Goal>
+
+        self.conflict = None
+        # str
+        # xml: <Conflict>
+
+        self.outcome = None
+        # str
+        # xml: <Outcome>
+
+        self.characters = None
+        # list of str
+        # xml: <Characters><CharID>
+
+        self.locations = None
+        # list of str
+        # xml: <Locations><LocID>
+
+        self.items = None
+        # list of str
+        # xml: <Items><ItemID>
+
+        self.date = None
+        # str
+        # xml: <SpecificDateMode>-1
+        # xml: <SpecificDateTime>1900-06-01 20:38:00
+
+        self.time = None
+        # str
+        # xml: <SpecificDateMode>-1
+        # xml: <SpecificDateTime>1900-06-01 20:38:00
+
+        self.minute = None
+        # str
+        # xml: <Minute>
+
+        self.hour = None
+        # str
+        # xml: <Hour>
+
+        self.day = None
+        # str
+        # xml: <Day>
+
+        self.lastsMinutes = None
+        # str
+        # xml: <LastsMinutes>
+
+        self.lastsHours = None
+        # str
+        # xml: <LastsHours>
+
+        self.lastsDays = None
+        # str
+        # xml: <LastsDays>
+
+        self.image = None
+        # str
+        # xml: <ImageFile>
+
+    @property
+    def sceneContent(self):
+        return self._sceneContent
+
+    @sceneContent.setter
+    def sceneContent(self, text):
+        """Set sceneContent, invalidating word count, letter count, and languages if the text has changed."""
+        if text != self._sceneContent:
+            self._wordCount = None
+            self._letterCount = None
+            self._languages = None
+        self._sceneContent = text
+
+    @property
+    def wordCount(self):
+        if self._wordCount is None:
+            if self._sceneContent:
+                text = ADDITIONAL_WORD_LIMITS.sub(' ', self._sceneContent)
+                text = NO_WORD_LIMITS.sub('', text)
+                self._wordCount = len(text.split())
+            else:
+                self._wordCount = 0
+        return self._wordCount
+
+    @wordCount.setter
+    def wordCount(self, count):
+        self._wordCount = count
+
+    @property
+    def letterCount(self):
+        if self._letterCount is None:
+            if self._sceneContent:
+                self._letterCount = len(NON_LETTERS.sub('', self._sceneContent))
+            else:
+                self._letterCount = 0
+        return self._letterCount
+
+    @letterCount.setter
+    def letterCount(self, count):
+        self._letterCount = count
+
+    @property
+    def languages(self):
+        if self._languages is None:
+            self._languages = list(dict.fromkeys(get_languages(self._sceneContent)))
+        return self._languages
@@ -1,203 +1,232 @@
-"""Provide a helper class for scene and chapter splitting.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-from pywriter.pywriter_globals import *
-
-
-class Splitter:
-    """Helper class for scene and chapter splitting.
-    
-    When importing scenes to yWriter, they may contain manually inserted scene and chapter dividers.
-    The Splitter class updates a Novel instance by splitting such scenes and creating new chapters and scenes. 
-    
-    Public methods:
-        split_scenes(novel) -- Split scenes by inserted chapter and scene dividers.
-        
-    Public class constants:
-        PART_SEPARATOR -- marker indicating the beginning of a new part, splitting a scene.
-        CHAPTER_SEPARATOR -- marker indicating the beginning of a new chapter, splitting a scene.
-        DESC_SEPARATOR -- marker separating title and description of a chapter or scene.
-    """
-    PART_SEPARATOR = '#'
-    CHAPTER_SEPARATOR = '##'
-    SCENE_SEPARATOR = '###'
-    DESC_SEPARATOR = '|'
-    _CLIP_TITLE = 20
-    # Maximum length of newly generated scene titles.
-
-    def split_scenes(self, novel):
-        """Split scenes by inserted chapter and scene dividers.
-        
-        Update a Novel instance by generating new chapters and scenes 
-        if there are dividers within the scene content.
-        
-        Positional argument: 
-            novel -- Novel instance to update.
-        
-        Return True if the sructure has changed, 
-        otherwise return False.        
-        """
-
-        def create_chapter(chapterId, title, desc, level):
-            """Create a new chapter and add it to the novel.
-            
-            Positional arguments:
-                chapterId -- str: ID of the chapter to create.
-                title -- str: title of the chapter to create.
-                desc -- str: description of the chapter to create.
-                level -- int: chapter level (part/chapter).           
-            """
-            newChapter = novel.CHAPTER_CLASS()
-            newChapter.title = title
-            newChapter.desc = desc
-            newChapter.chLevel = level
-            newChapter.chType = 0
-            novel.chapters[chapterId] = newChapter
-
-        def create_scene(sceneId, parent, splitCount, title, desc):
-            """Create a new scene and add it to the novel.
-            
-            Positional arguments:
-                sceneId -- str: ID of the scene to create.
-                parent -- Scene instance: parent scene.
-                splitCount -- int: number of parent's splittings.
-                title -- str: title of the scene to create.
-                desc -- str: description of the scene to create.
-            """
-            WARNING = '(!)'
-
-            # Mark metadata of split scenes.
-            newScene = novel.SCENE_CLASS()
-            if title:
-                newScene.title = title
-            elif parent.title:
-                if len(parent.title) > self._CLIP_TITLE:
-                    title = f'{parent.title[:self._CLIP_TITLE]}...'
-                else:
-                    title = parent.title
-                newScene.title = f'{title} Split: {splitCount}'
-            else:
-                newScene.title = f'_("New Scene") Split: {splitCount}'
-            if desc:
-                newScene.desc = desc
-            if parent.desc and not parent.desc.startswith(WARNING):
-                parent.desc = f'{WARNING}{parent.desc}'
-            if parent.goal and not parent.goal.startswith(WARNING):
-                parent.goal = f'{WARNING}{parent.goal}'
-            if parent.conflict and not parent.conflict.startswith(WARNING):
-                parent.conflict = f'{WARNING}{parent.conflict}'
-            if parent.outcome and not parent.outcome.startswith(WARNING):
-                parent.outcome = f'{WARNING}{parent.outcome}'
-
-            # Reset the parent's status to Draft, if not Outline.
-            if parent.status > 2:
-                parent.status = 2
-            newScene.status = parent.status
-            newScene.scType = parent.scType
-            newScene.date = parent.date
-            newScene.time = parent.time
-            newScene.day = parent.day
-            newScene.hour = parent.hour
-            newScene.minute = parent.minute
-            newScene.lastsDays = parent.lastsDays
-            newScene.lastsHours = parent.lastsHours
-            newScene.lastsMinutes = parent.lastsMinutes
-            novel.scenes[sceneId] = newScene
-
-        # Get the maximum chapter ID and scene ID.
-        chIdMax = 0
-        scIdMax = 0
-        for chId in novel.srtChapters:
-            if int(chId) > chIdMax:
-                chIdMax = int(chId)
-        for scId in novel.scenes:
-            if int(scId) > scIdMax:
-                scIdMax = int(scId)
-
-        # Process chapters and scenes.
-        scenesSplit = False
-        srtChapters = []
-        for chId in novel.srtChapters:
-            srtChapters.append(chId)
-            chapterId = chId
-            srtScenes = []
-            for scId in novel.chapters[chId].srtScenes:
-                srtScenes.append(scId)
-                if not novel.scenes[scId].sceneContent:
-                    continue
-
-                sceneId = scId
-                lines = novel.scenes[scId].sceneContent.split('\n')
-                newLines = []
-                inScene = True
-                sceneSplitCount = 0
-
-                # Search scene content for dividers.
-                for line in lines:
-                    heading = line.strip('# ').split(self.DESC_SEPARATOR)
-                    title = heading[0]
-                    try:
-                        desc = heading[1]
-                    except:
-                        desc = ''
-                    if line.startswith(self.SCENE_SEPARATOR):
-                        # Split the scene.
-                        novel.scenes[sceneId].sceneContent = '\n'.join(newLines)
-                        newLines = []
-                        sceneSplitCount += 1
-                        scIdMax += 1
-                        sceneId = str(scIdMax)
-                        create_scene(sceneId, novel.scenes[scId], sceneSplitCount, title, desc)
-                        srtScenes.append(sceneId)
-                        scenesSplit = True
-                        inScene = True
-                    elif line.startswith(self.CHAPTER_SEPARATOR):
-                        # Start a new chapter.
-                        if inScene:
-                            novel.scenes[sceneId].sceneContent = '\n'.join(newLines)
-                            newLines = []
-                            sceneSplitCount = 0
-                            inScene = False
-                        novel.chapters[chapterId].srtScenes = srtScenes
-                        srtScenes = []
-                        chIdMax += 1
-                        chapterId = str(chIdMax)
-                        if not title:
-                            title = _('New Chapter')
-                        create_chapter(chapterId, title, desc, 0)
-                        srtChapters.append(chapterId)
-                        scenesSplit = True
-                    elif line.startswith(self.PART_SEPARATOR):
-                        # start a new part.
-                        if inScene:
-                            novel.scenes[sceneId].sceneContent = '\n'.join(newLines)
-                            newLines = []
-                            sceneSplitCount = 0
-                            inScene = False
-                        novel.chapters[chapterId].srtScenes = srtScenes
-                        srtScenes = []
-                        chIdMax += 1
-                        chapterId = str(chIdMax)
-                        if not title:
-                            title = _('New Part')
-                        create_chapter(chapterId, title, desc, 1)
-                        srtChapters.append(chapterId)
-                    elif not inScene:
-                        # Append a scene without heading to a new chapter or part.
-                        newLines.append(line)
-                        sceneSplitCount += 1
-                        scIdMax += 1
-                        sceneId = str(scIdMax)
-                        create_scene(sceneId, novel.scenes[scId], sceneSplitCount, '', '')
-                        srtScenes.append(sceneId)
-                        scenesSplit = True
-                        inScene = True
-                    else:
-                        newLines.append(line)
-                novel.scenes[sceneId].sceneContent = '\n'.join(newLines)
-            novel.chapters[chapterId].srtScenes = srtScenes
-        novel.srtChapters = srtChapters
-        return scenesSplit
+"""Provide a helper class for scene and chapter splitting.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import re
+from pywriter.pywriter_globals import *
+
+
+class Splitter:
+    """Helper class for scene and chapter splitting.
+    
+    When importing scenes to yWriter, they may contain manually inserted scene and chapter dividers.
+    The Splitter class updates a Novel instance by splitting such scenes and creating new chapters and scenes. 
+    
+    Public methods:
+        split_scenes(novel) -- Split scenes by inserted chapter and scene dividers.
+        
+    Public class constants:
+        PART_SEPARATOR -- marker indicating the beginning of a new part, splitting a scene.
+        CHAPTER_SEPARATOR -- marker indicating the beginning of a new chapter, splitting a scene.
+        DESC_SEPARATOR -- marker separating title and description of a chapter or scene.
+    """
+    PART_SEPARATOR = '#'
+    CHAPTER_SEPARATOR = '##'
+    SCENE_SEPARATOR = '###'
+    DESC_SEPARATOR = '|'
+    _CLIP_TITLE = 20
+    # Maximum length of newly generated scene titles.
+
+    def split_scenes(self, novel):
+        """Split scenes by inserted chapter and scene dividers.
+        
+        Update a Novel instance by generating new chapters and scenes 
+        if there are dividers within the scene content.
+        
+        Positional argument: 
+            novel -- Novel instance to update.
+        
+        Return True if the sructure has changed, 
+        otherwise return False.        
+        """
+
+        def create_chapter(chapterId, title, desc, level):
+            """Create a new chapter and add it to the novel.
+            
+            Positional arguments:
+                chapterId -- str: ID of the chapter to create.
+                title -- str: title of the chapter to create.
+                desc -- str: description of the chapter to create.
+                level -- int: chapter level (part/chapter).           
+            """
+            newChapter = novel.CHAPTER_CLASS()
+            newChapter.title = title
+            newChapter.desc = desc
+            newChapter.chLevel = level
+            newChapter.chType = 0
+            novel.chapters[chapterId] = newChapter
+
+        def create_scene(sceneId, parent, splitCount, title, desc):
+            """Create a new scene and add it to the novel.
+            
+            Positional arguments:
+                sceneId -- str: ID of the scene to create.
+                parent -- Scene instance: parent scene.
+                splitCount -- int: number of parent's splittings.
+                title -- str: title of the scene to create.
+                desc -- str: description of the scene to create.
+            """
+            WARNING = '(!)'
+
+            # Mark metadata of split scenes.
+            newScene = novel.SCENE_CLASS()
+            if title:
+                newScene.title = title
+            elif parent.title:
+                if len(parent.title) > self._CLIP_TITLE:
+                    title = f'{parent.title[:self._CLIP_TITLE]}...'
+                else:
+                    title = parent.title
+                newScene.title = f'{title} Split: {splitCount}'
+            else:
+                newScene.title = f'_("New Scene") Split: {splitCount}'
+            if desc:
+                newScene.desc = desc
+            if parent.desc and not parent.desc.startswith(WARNING):
+                parent.desc = f'{WARNING}{parent.desc}'
+            if parent.goal and not parent.goal.startswith(WARNING):
+                parent.goal = f'{WARNING}{parent.goal}'
+            if parent.conflict and not parent.conflict.startswith(WARNING):
+                parent.conflict = f'{WARNING}{parent.conflict}'
+            if parent.outcome and not parent.outcome.startswith(WARNING):
+                parent.outcome = f'{WARNING}{parent.outcome}'
+
+            # Reset the parent's status to Draft, if not Outline.
+            if parent.status > 2:
+                parent.status = 2
+            newScene.status = parent.status
+            newScene.scType = parent.scType
+            newScene.date = parent.date
+            newScene.time = parent.time
+            newScene.day = parent.day
+            newScene.hour = parent.hour
+            newScene.minute = parent.minute
+            newScene.lastsDays = parent.lastsDays
+            newScene.lastsHours = parent.lastsHours
+            newScene.lastsMinutes = parent.lastsMinutes
+            novel.scenes[sceneId] = newScene
+
+        # Divider lines begin with one of the separators.
+        # Search them with the preceding line break, so the regex engine can skip quickly to the candidates.
+        # A divider in the first line is checked with startswith().
+        separators = (self.SCENE_SEPARATOR, self.CHAPTER_SEPARATOR, self.PART_SEPARATOR)
+        dividers = re.compile(f'\\n(?:{"|".join(re.escape(separator) for separator in separators)}).*')
+
+        # Process chapters and scenes.
+        scenesSplit = False
+        srtChapters = []
+        for chId in novel.srtChapters:
+            srtChapters.append(chId)
+            chapterId = chId
+            srtScenes = []
+            for scId in novel.chapters[chId].srtScenes:
+                srtScenes.append(scId)
+                content = novel.scenes[scId].sceneContent
+                if not content:
+                    continue
+
+                if not content.startswith(separators) and dividers.search(content) is None:
+                    continue
+
+                sceneId = scId
+                inScene = True
+                sceneSplitCount = 0
+
+                # Process the text sections between the dividers.
+                for text, hasLines, divider in self._get_sections(content, separators, dividers):
+                    if hasLines and not inScene:
+                        # Append a scene without heading to a new chapter or part.
+                        sceneSplitCount += 1
+                        sceneId = novel.idAllocator.create_id('scene')
+                        create_scene(sceneId, novel.scenes[scId], sceneSplitCount, '', '')
+                        srtScenes.append(sceneId)
+                        scenesSplit = True
+                        inScene = True
+                    if divider is None:
+                        break
+
+                    heading = divider.strip('# ').split(self.DESC_SEPARATOR)
+                    title = heading[0]
+                    try:
+                        desc = heading[1]
+                    except:
+                        desc = ''
+                    if divider.startswith(self.SCENE_SEPARATOR):
+                        # Split the scene.
+                        novel.scenes[sceneId].sceneContent = text
+                        sceneSplitCount += 1
+                        sceneId = novel.idAllocator.create_id('scene')
+                        create_scene(sceneId, novel.scenes[scId], sceneSplitCount, title, desc)
+                        srtScenes.append(sceneId)
+                        scenesSplit = True
+                        inScene = True
+                    elif divider.startswith(self.CHAPTER_SEPARATOR):
+                        # Start a new chapter.
+                        if inScene:
+                            novel.scenes[sceneId].sceneContent = text
+                            sceneSplitCount = 0
+                            inScene = False
+                        novel.chapters[chapterId].srtScenes = srtScenes
+                        srtScenes = []
+                        chapterId = novel.idAllocator.create_id('chapter')
+                        if not title:
+                            title = _('New Chapter')
+                        create_chapter(chapterId, title, desc, 0)
+                        srtChapters.append(chapterId)
+                        scenesSplit = True
+                    else:
+                        # start a new part.
+                        if inScene:
+                            novel.scenes[sceneId].sceneContent = text
+                            sceneSplitCount = 0
+                            inScene = False
+                        novel.chapters[chapterId].srtScenes = srtScenes
+                        srtScenes = []
+                        chapterId = novel.idAllocator.create_id('chapter')
+                        if not title:
+                            title = _('New Part')
+                        create_chapter(chapterId, title, desc, 1)
+                        srtChapters.append(chapterId)
+                novel.scenes[sceneId].sceneContent = text
+            novel.chapters[chapterId].srtScenes = srtScenes
+        novel.srtChapters = srtChapters
+        novel.invalidate_index()
+        return scenesSplit
+
+    def _get_sections(self, content, separators, dividers):
+        """Return a generator object with the text sections of content and the dividers following them.
+        
+        Positional arguments:
+            content -- str: scene content.
+            separators -- tuple of str: the separators a divider line begins with.
+            dividers -- compiled regular expression matching a line break followed by a divider line.
+        
+        Generate tuples (text, hasLines, divider):
+            text -- str: lines between the previous divider and the divider, without line breaks at the ends.
+            hasLines -- bool: True if there is at least one line, even an empty one, before the divider.
+            divider -- str: divider line; None for the last section.
+        
+        Only the divider lines are searched, then the text in between is sliced from content.
+        """
+        sectionStart = 0
+        searchStart = 0
+        if content.startswith(separators):
+            lineEnd = content.find('\n')
+            if lineEnd == -1:
+                lineEnd = len(content)
+            yield '', False, content[:lineEnd]
+            sectionStart = lineEnd + 1
+            searchStart = lineEnd
+        for divider in dividers.finditer(content, searchStart):
+            lineBreak = divider.start()
+            if lineBreak >= sectionStart:
+                yield content[sectionStart:lineBreak], True, divider.group()[1:]
+            else:
+                yield '', False, divider.group()[1:]
+            sectionStart = divider.end() + 1
+        if sectionStart <= len(content):
+            yield content[sectionStart:], True, None
+        else:
+            yield '', False, None
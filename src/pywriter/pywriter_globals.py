@@ -1,122 +1,119 @@
-"""Provide global variables and functions.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-import os
-import re
-import sys
-import gettext
-import locale
-
-ERROR = '!'
-
-__all__ = ['ERROR', '_',
-           'LOCALE_PATH',
-           'CURRENT_LANGUAGE',
-           'ADDITIONAL_WORD_LIMITS',
-           'NO_WORD_LIMITS',
-           'NON_LETTERS',
-           'string_to_list',
-           'list_to_string',
-           'get_languages',
-           ]
-
-#--- Initialize localization.
-LOCALE_PATH = f'{os.path.dirname(sys.argv[0])}/locale/'
-try:
-    CURRENT_LANGUAGE = locale.getlocale()[0][:2]
-except:
-    # Fallback for old Windows versions.
-    CURRENT_LANGUAGE = locale.getdefaultlocale()[0][:2]
-try:
-    t = gettext.translation('pywriter', LOCALE_PATH, languages=[CURRENT_LANGUAGE])
-    _ = t.gettext
-except:
-
-    def _(message):
-        return message
-
-#--- Regular expressions for counting words and characters like in LibreOffice.
-# See: https://help.libreoffice.org/latest/en-GB/text/swriter/guide/words_count.html
-
-ADDITIONAL_WORD_LIMITS = re.compile(r'--|—|–')
-# this is to be replaced by spaces, thus making dashes and dash replacements word limits
-
-NO_WORD_LIMITS = re.compile(r'\[.+?\]|\/\*.+?\*\/|-|^\>', re.MULTILINE)
-# this is to be replaced by empty strings, thus excluding markup and comments from
-# word counting, and making hyphens join words
-
-NON_LETTERS = re.compile(r'\[.+?\]|\/\*.+?\*\/|\n|\r')
-# this is to be replaced by empty strings, thus excluding markup, comments, and linefeeds
-# from letter counting
-
-
-def string_to_list(text, divider=';'):
-    """Convert a string into a list with unique elements.
-    
-    Positional arguments:
-        text -- string containing divider-separated substrings.
-        
-    Optional arguments:
-        divider -- string that divides the substrings.
-    
-    Split a string into a list of strings. Retain the order, but discard duplicates.
-    Remove leading and trailing spaces, if any.
-    Return a list of strings.
-    If an error occurs, return an empty list.
-    """
-    elements = []
-    try:
-        tempList = text.split(divider)
-        for element in tempList:
-            element = element.strip()
-            if element and not element in elements:
-                elements.append(element)
-        return elements
-
-    except:
-        return []
-
-
-def list_to_string(elements, divider=';'):
-    """Join strings from a list.
-    
-    Positional arguments:
-        elements -- list of elements to be concatenated.
-        
-    Optional arguments:
-        divider -- string that divides the substrings.
-    
-    Return a string which is the concatenation of the 
-    members of the list of strings "elements", separated by 
-    a comma plus a space. The space allows word wrap in 
-    spreadsheet cells.
-    If an error occurs, return an empty string.
-    """
-    try:
-        text = divider.join(elements)
-        return text
-
-    except:
-        return ''
-
-
-LANGUAGE_TAG = re.compile(r'\[lang=(.*?)\]')
-
-
-def get_languages(text):
-    """Return a generator object with the language codes appearing in text.
-    
-    Example:
-    - language markup: 'Standard text [lang=en-AU]Australian text[/lang=en-AU].'
-    - language code: 'en-AU'
-    """
-    if text:
-        m = LANGUAGE_TAG.search(text)
-        while m:
-            text = text[m.span()[1]:]
-            yield m.group(1)
-            m = LANGUAGE_TAG.search(text)
-
+"""Provide global variables and functions.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import re
+import sys
+import gettext
+import locale
+
+ERROR = '!'
+
+__all__ = ['ERROR', '_',
+           'LOCALE_PATH',
+           'CURRENT_LANGUAGE',
+           'ADDITIONAL_WORD_LIMITS',
+           'NO_WORD_LIMITS',
+           'NON_LETTERS',
+           'string_to_list',
+           'list_to_string',
+           'get_languages',
+           ]
+
+#--- Initialize localization.
+LOCALE_PATH = f'{os.path.dirname(sys.argv[0])}/locale/'
+try:
+    CURRENT_LANGUAGE = locale.getlocale()[0][:2]
+except:
+    # Fallback for old Windows versions.
+    CURRENT_LANGUAGE = locale.getdefaultlocale()[0][:2]
+try:
+    t = gettext.translation('pywriter', LOCALE_PATH, languages=[CURRENT_LANGUAGE])
+    _ = t.gettext
+except:
+
+    def _(message):
+        return message
+
+#--- Regular expressions for counting words and characters like in LibreOffice.
+# See: https://help.libreoffice.org/latest/en-GB/text/swriter/guide/words_count.html
+
+ADDITIONAL_WORD_LIMITS = re.compile(r'--|—|–')
+# this is to be replaced by spaces, thus making dashes and dash replacements word limits
+
+NO_WORD_LIMITS = re.compile(r'\[.+?\]|\/\*.+?\*\/|-|^\>', re.MULTILINE)
+# this is to be replaced by empty strings, thus excluding markup and comments from
+# word counting, and making hyphens join words
+
+NON_LETTERS = re.compile(r'\[.+?\]|\/\*.+?\*\/|\n|\r')
+# this is to be replaced by empty strings, thus excluding markup, comments, and linefeeds
+# from letter counting
+
+
+def string_to_list(text, divider=';'):
+    """Convert a string into a list with unique elements.
+    
+    Positional arguments:
+        text -- string containing divider-separated substrings.
+        
+    Optional arguments:
+        divider -- string that divides the substrings.
+    
+    Split a string into a list of strings. Retain the order, but discard duplicates.
+    Remove leading and trailing spaces, if any.
+    Return a list of strings.
+    If an error occurs, return an empty list.
+    """
+    elements = []
+    try:
+        tempList = text.split(divider)
+        for element in tempList:
+            element = element.strip()
+            if element and not element in elements:
+                elements.append(element)
+        return elements
+
+    except:
+        return []
+
+
+def list_to_string(elements, divider=';'):
+    """Join strings from a list.
+    
+    Positional arguments:
+        elements -- list of elements to be concatenated.
+        
+    Optional arguments:
+        divider -- string that divides the substrings.
+    
+    Return a string which is the concatenation of the 
+    members of the list of strings "elements", separated by 
+    a comma plus a space. The space allows word wrap in 
+    spreadsheet cells.
+    If an error occurs, return an empty string.
+    """
+    try:
+        text = divider.join(elements)
+        return text
+
+    except:
+        return ''
+
+
+LANGUAGE_TAG = re.compile(r'\[lang=(.*?)\]')
+
+
+def get_languages(text):
+    """Return a generator object with the language codes appearing in text.
+    
+    Example:
+    - language markup: 'Standard text [lang=en-AU]Australian text[/lang=en-AU].'
+    - language code: 'en-AU'
+    """
+    if text:
+        for m in LANGUAGE_TAG.finditer(text):
+            yield m.group(1)
+
@@ -0,0 +1,21 @@
+"""Provide a class for yWriter 7 project import and export with compact element classes.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.yw.yw7_file import Yw7File
+from pywriter.model.compact_elements import *
+
+
+class CompactYw7File(Yw7File):
+    """yWriter 7 project file representation using slotted element classes.
+    
+    Same as Yw7File, but with less memory used per chapter, scene, character, 
+    location, item, and project note. 
+    """
+    CHAPTER_CLASS = CompactChapter
+    SCENE_CLASS = CompactScene
+    CHARACTER_CLASS = CompactCharacter
+    WE_CLASS = CompactWorldElement
+    PN_CLASS = CompactBasicElement
@@ -0,0 +1,174 @@
+"""Provide a class for a persistent cache of parsed yWriter project data.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import hashlib
+import pickle
+import tempfile
+
+
+class ParseCache:
+    """Persistent on-disk cache for parsed yWriter project data.
+
+    Each cache entry holds the data of one project file,
+    together with the file's path, size, modification time, and content hash.
+    An entry is used only if all of them match the current file.
+    When the total size of the entries exceeds maxSize,
+    the least recently used entries are deleted.
+
+    Errors are not reported, because the cache is just an optimization.
+    Note: The entries are stored with pickle,
+    so the cache directory must not be writable by other users.
+
+    Public methods:
+        load(filePath, variant) -- Return the cached data of a file.
+        store(filePath, variant, data) -- Store the data of a file.
+        clear() -- Delete all cache entries.
+
+    Public instance variables:
+        cacheDir -- str: path to the cache directory.
+        maxSize -- int: maximum total size of the cache entries in bytes.
+    """
+    CACHE_DIR = os.path.join(os.path.expanduser('~'), '.pywriter', 'cache')
+    MAX_SIZE = 100 * 1024 * 1024
+
+    _FORMAT = 2
+    # To be incremented when the entry structure changes.
+
+    _EXTENSION = '.cache'
+
+    def __init__(self, cacheDir=None, maxSize=None):
+        """Initialize instance variables.
+
+        Optional arguments:
+            cacheDir -- str: path to the cache directory. Default: CACHE_DIR.
+            maxSize -- int: maximum total size of the cache entries in bytes. Default: MAX_SIZE.
+        """
+        if cacheDir is None:
+            cacheDir = self.CACHE_DIR
+        self.cacheDir = cacheDir
+        if maxSize is None:
+            maxSize = self.MAX_SIZE
+        self.maxSize = maxSize
+
+    def load(self, filePath, variant=''):
+        """Return the cached data of a file.
+
+        Positional arguments:
+            filePath -- str: path to the file the data was read from.
+
+        Optional arguments:
+            variant -- str: description of what data was read, and how.
+
+        Return None, if there is no valid cache entry.
+        """
+        entryPath = self._get_entry_path(filePath, variant)
+        try:
+            with open(entryPath, 'rb') as f:
+                header = pickle.load(f)
+                if header['key'] != self._get_key(filePath, variant):
+                    return None
+
+                if header['hash'] != self._get_hash(filePath):
+                    return None
+
+                data = pickle.load(f)
+            os.utime(entryPath)
+            # marking the entry as recently used
+        except:
+            return None
+
+        return data
+
+    def store(self, filePath, variant, data):
+        """Store the data of a file.
+
+        Positional arguments:
+            filePath -- str: path to the file the data was read from.
+            variant -- str: description of what data was read, and how.
+            data -- picklable data.
+
+        Return True on success, otherwise return False.
+        """
+        try:
+            header = dict(key=self._get_key(filePath, variant), hash=self._get_hash(filePath))
+            os.makedirs(self.cacheDir, exist_ok=True)
+            fd, tempPath = tempfile.mkstemp(suffix='.tmp', dir=self.cacheDir)
+            try:
+                with open(fd, 'wb') as f:
+                    pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tempPath, self._get_entry_path(filePath, variant))
+            except:
+                os.remove(tempPath)
+                raise
+
+        except:
+            return False
+
+        self._evict()
+        return True
+
+    def clear(self):
+        """Delete all cache entries."""
+        for entryPath, __ in self._get_entries():
+            try:
+                os.remove(entryPath)
+            except:
+                pass
+
+    def _get_key(self, filePath, variant):
+        """Return a tuple with the file's path, size, and modification time, and the variant.
+
+        Raise OSError, if the file cannot be accessed.
+        """
+        fileStat = os.stat(filePath)
+        return (self._FORMAT, os.path.realpath(filePath), fileStat.st_size, fileStat.st_mtime_ns, variant)
+
+    def _get_hash(self, filePath):
+        """Return the hash of the file's content.
+
+        Raise OSError, if the file cannot be read.
+        """
+        hasher = hashlib.blake2b(digest_size=20)
+        with open(filePath, 'rb') as f:
+            hasher.update(f.read())
+        return hasher.hexdigest()
+
+    def _get_entry_path(self, filePath, variant):
+        """Return the path of the cache entry for a file."""
+        name = hashlib.sha1(f'{os.path.realpath(filePath)}\n{variant}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.cacheDir, f'{name}{self._EXTENSION}')
+
+    def _get_entries(self):
+        """Return a list of (path, stat) tuples of the cache entries, least recently used first."""
+        entries = []
+        try:
+            with os.scandir(self.cacheDir) as it:
+                for entry in it:
+                    if entry.name.endswith(self._EXTENSION):
+                        try:
+                            entries.append((entry.path, entry.stat()))
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        entries.sort(key=lambda entry: entry[1].st_mtime_ns)
+        return entries
+
+    def _evict(self):
+        """Delete the least recently used entries until the total size is within maxSize."""
+        entries = self._get_entries()
+        totalSize = sum(entryStat.st_size for __, entryStat in entries)
+        for entryPath, entryStat in entries:
+            if totalSize <= self.maxSize:
+                break
+
+            try:
+                os.remove(entryPath)
+                totalSize -= entryStat.st_size
+            except OSError:
+                pass
@@ -0,0 +1,90 @@
+"""Provide classes for collecting timing statistics of file processing phases.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import time
+import json
+
+
+class PhaseTimer:
+    """Context manager measuring the duration of a processing phase.
+
+    The context manager returns the phase record, a dictionary with the keys
+    'phase', 'duration' (seconds), 'elements', and 'bytes'.
+    The code within the context may set the element and byte counts.
+    On exit, the duration is set, and the record is appended to the records list, if any.
+
+    Public instance variables:
+        record -- dict: the phase record.
+    """
+
+    def __init__(self, phase, records=None):
+        """Initialize instance variables.
+
+        Positional arguments:
+            phase -- str: name of the processing phase.
+
+        Optional arguments:
+            records -- list to append the phase record to. If None, the record is discarded.
+        """
+        self.record = dict(phase=phase, duration=None, elements=None, bytes=None)
+        self._records = records
+        self._startTime = None
+
+    def __enter__(self):
+        self._startTime = time.perf_counter()
+        return self.record
+
+    def __exit__(self, excType, excValue, traceback):
+        self.record['duration'] = time.perf_counter() - self._startTime
+        if self._records is not None:
+            self._records.append(self.record)
+        return False
+
+
+class PhaseStats:
+    """Statistics of file processing phases.
+
+    Public methods:
+        measure(phase) -- Return a context manager measuring a processing phase.
+        clear() -- Delete all phase records.
+        get_totals() -- Return the total duration of each phase.
+        to_json() -- Return the phase records as JSON text.
+
+    Public instance variables:
+        records -- list of dict: phase records in order of completion (see PhaseTimer).
+    """
+
+    def __init__(self):
+        """Initialize instance variables."""
+        self.records = []
+
+    def measure(self, phase):
+        """Return a context manager measuring a processing phase.
+
+        Positional arguments:
+            phase -- str: name of the processing phase.
+
+        Usage:
+            with stats.measure('parse') as record:
+                ...
+                record['bytes'] = fileSize
+        """
+        return PhaseTimer(phase, self.records)
+
+    def clear(self):
+        """Delete all phase records."""
+        self.records = []
+
+    def get_totals(self):
+        """Return a dictionary with the total duration of each phase in seconds."""
+        totals = {}
+        for record in self.records:
+            totals[record['phase']] = totals.get(record['phase'], 0.0) + record['duration']
+        return totals
+
+    def to_json(self):
+        """Return the phase records and the totals as JSON text."""
+        return json.dumps(dict(phases=self.records, totals=self.get_totals()), indent=2)
@@ -0,0 +1,92 @@
+"""Provide a function for replacing files without risking data loss.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import secrets
+import shutil
+
+# Flags as used by tempfile.mkstemp(); O_BINARY prevents newline translation on Windows.
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOINHERIT', 0)
+
+
+def replace_file(filePath, text, newline=None):
+    """Write text to a file, keeping the previous file as backup.
+
+    Positional arguments:
+        filePath -- str: path to the file to be written.
+        text -- str: the new file content.
+
+    Optional arguments:
+        newline -- newline mode of the file, as for open().
+
+    Write the text to a temporary file in the same directory,
+    and move it into place when it is completely on disk.
+    The previous file is kept as .bak by hard link, or by copy
+    where the file system does not support hard links.
+    So the file is complete at any time, and its data is written only once.
+    A new file gets the permissions of files created with open(), i.e. 0o666 reduced by the umask;
+    an existing file keeps its permissions.
+
+    Return the size of the file written in bytes.
+    Raise an exception in case of error; the temporary file is removed then.
+    """
+    directory, fileName = os.path.split(os.path.abspath(filePath))
+    fd, tempPath = _create_temp_file(directory, fileName)
+    try:
+        with open(fd, 'w', encoding='utf-8', newline=newline) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+            size = os.fstat(f.fileno()).st_size
+        if os.path.isfile(filePath):
+            shutil.copymode(filePath, tempPath)
+            bakPath = f'{filePath}.bak'
+            if os.path.lexists(bakPath):
+                os.remove(bakPath)
+            try:
+                os.link(filePath, bakPath)
+            except OSError:
+                shutil.copy2(filePath, bakPath)
+        os.replace(tempPath, filePath)
+    except:
+        try:
+            os.remove(tempPath)
+        except OSError:
+            pass
+        raise
+
+    _sync_directory(directory)
+    return size
+
+
+def _create_temp_file(directory, fileName):
+    """Create a new file with a unique name next to fileName; return its descriptor and path.
+
+    Unlike tempfile.mkstemp(), create the file with mode 0o666,
+    so the kernel applies the umask without changing it process-wide.
+    """
+    while True:
+        tempPath = os.path.join(directory, f'.{fileName}.{secrets.token_hex(4)}.tmp')
+        try:
+            return os.open(tempPath, _TEMP_FLAGS, 0o666), tempPath
+        except FileExistsError:
+            continue
+
+
+def _sync_directory(directory):
+    """Make the renaming durable by flushing the directory entry, where the platform supports it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on Windows.
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -1,27 +1,66 @@
-"""Helper module for xml pretty printing.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/PyWriter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-
-
-def indent(elem, level=0):
-    """xml pretty printer
-
-    Kudos to to Fredrik Lundh. 
-    Source: http://effbot.org/zone/element-lib.htm#prettyprint
-    """
-    i = f'\n{level * "  "}'
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = f'{i}  '
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-        for elem in elem:
-            indent(elem, level + 1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+"""Helper module for xml pretty printing.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+_INDENTS = ['\n']
+# Indentation strings by nesting level: line break and two spaces per level.
+
+
+def indent(elem, level=0, preserve=False):
+    """xml pretty printer
+
+    Positional arguments:
+        elem -- xml element to be indented along with its subelements.
+
+    Optional arguments:
+        level -- int: nesting level of elem.
+        preserve -- bool: if True, keep the whitespace present, e.g. in a tree read from a file;
+                    add indentation only where it is missing.
+
+    Put each element on a separate line, indented with two spaces per nesting level.
+    Text and tails containing anything but whitespace are not changed.
+    Text and tails that are already indented are not rewritten.
+    In preserve mode, elements added or removed behind the former last child are taken into account,
+    so the closing tag of the parent element stays in place.
+    The tree is processed iteratively, using precomputed indentation strings.
+
+    Kudos to to Fredrik Lundh for the original recursive version.
+    Source: http://effbot.org/zone/element-lib.htm#prettyprint
+    """
+    indents = _INDENTS
+    if len(elem) or level:
+        while len(indents) <= level:
+            indents.append(f'{indents[-1]}  ')
+        tail = elem.tail
+        if tail != indents[level] and (not tail or not preserve and not tail.strip()):
+            elem.tail = indents[level]
+    if not len(elem):
+        return
+
+    stack = [(elem, level)]
+    while stack:
+        parent, level = stack.pop()
+        childLevel = level + 1
+        while len(indents) <= childLevel:
+            indents.append(f'{indents[-1]}  ')
+        parentIndent = indents[level]
+        childIndent = indents[childLevel]
+        text = parent.text
+        if text != childIndent and (not text or not preserve and not text.strip()):
+            parent.text = childIndent
+        lastIndex = len(parent) - 1
+        for index, child in enumerate(parent):
+            if index < lastIndex:
+                tail = child.tail
+                if tail != childIndent:
+                    if not tail or not preserve and not tail.strip() or preserve and tail == parentIndent:
+                        child.tail = childIndent
+            else:
+                tail = child.tail
+                if tail != parentIndent:
+                    if not tail or not preserve and not tail.strip() or preserve and tail == childIndent:
+                        child.tail = parentIndent
+            if len(child):
+                stack.append((child, childLevel))
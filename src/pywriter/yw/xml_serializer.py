@@ -0,0 +1,79 @@
+"""Helper module for writing yWriter xml files in a single pass.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/PyWriter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>'
+CDATA_START = '<![CDATA['
+CDATA_END = ']]>'
+
+
+def serialize(root, cdataTags):
+    """Return the xml element tree as yWriter xml text.
+
+    Positional arguments:
+        root -- xml root element.
+        cdataTags -- collection of the tag names whose text is to be enclosed in CDATA sections.
+
+    The result is the same as writing the tree with ElementTree.write()
+    and post-processing the file with Yw7File._post_xml_file():
+    - The xml header is put on top.
+    - Text is written without escaping xml entities.
+    - Line breaks are normalized to '\\n'.
+    - The text of elements listed in cdataTags is enclosed in CDATA sections,
+      removing a leading ' \\n' and a trailing '\\n'.
+    """
+    cdataTags = set(cdataTags)
+    pieces = [XML_HEADER, '\n']
+
+    def fix_text(text, afterCdataStart=False, beforeCdataEnd=False):
+        # Apply the post-processing replacements in the same order as _post_xml_file().
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if afterCdataStart:
+            if text.startswith((' \n', 'CDATA[ \n')) or '[CDATA[ \n' in text:
+                text = f'[CDATA[{text}'.replace('[CDATA[ \n', '[CDATA[')[7:]
+        elif '[CDATA[ \n' in text:
+            text = text.replace('[CDATA[ \n', '[CDATA[')
+        if beforeCdataEnd:
+            if text.endswith(('\n', '\n]')) or '\n]]' in text:
+                text = f'{text}]]'.replace('\n]]', ']]')[:-2]
+        elif '\n]]' in text:
+            text = text.replace('\n]]', ']]')
+        return text
+
+    def serialize_element(elem):
+        tag = elem.tag
+        pieces.append(f'<{tag}')
+        for key, value in elem.items():
+            pieces.append(f' {key}="{value}"')
+        text = elem.text
+        if text or len(elem):
+            if tag in cdataTags:
+                pieces.append(f'>{CDATA_START}')
+                if text:
+                    pieces.append(fix_text(text, True, not len(elem)))
+                lastChild = len(elem) - 1
+                for i, child in enumerate(elem):
+                    serialize_child(child, i == lastChild)
+                pieces.append(f'{CDATA_END}</{tag}>')
+            else:
+                pieces.append('>')
+                if text:
+                    pieces.append(fix_text(text))
+                for child in elem:
+                    serialize_child(child)
+                pieces.append(f'</{tag}>')
+        else:
+            pieces.append(' />')
+
+    def serialize_child(elem, isLastInCdata=False):
+        serialize_element(elem)
+        if elem.tail:
+            pieces.append(fix_text(elem.tail, False, isLastInCdata))
+
+    serialize_element(root)
+    if root.tail:
+        pieces.append(fix_text(root.tail))
+    return ''.join(pieces)
@@ -15,21 +15,49 @@ from pywriter.model.novel import Novel
 from pywriter.model.id_generator import create_id
 from pywriter.model.splitter import Splitter
 from pywriter.yw.xml_indent import indent
+from pywriter.yw.xml_serializer import serialize
+from pywriter.yw.safe_write import replace_file
+from pywriter.yw.parse_cache import ParseCache
+from pywriter.yw.phase_stats import PhaseStats
+from pywriter.yw.phase_stats import PhaseTimer
+
+
+class ControlCharFilter:
+    """Binary file wrapper that removes ASCII control characters not allowed in XML.
+    
+    Public methods:
+        read(size) -- return the next chunk of data without control characters.
+    """
+    _CONTROL_CHARS = bytes(range(0x00, 0x09)) + b'\x0b\x0c' + bytes(range(0x0e, 0x20))
+
+    def __init__(self, file):
+        """Initialize instance variables.
+        
+        Positional arguments:
+            file -- binary file object to read from. UTF-8 encoding is assumed.
+        """
+        self._file = file
+
+    def read(self, size=-1):
+        """Return the next chunk of data without control characters."""
+        return self._file.read(size).translate(None, self._CONTROL_CHARS)
 
 
 class Yw7File(Novel):
     """yWriter 7 project file representation.
 
     Public methods: 
-        read() -- parse the yWriter xml file and get the instance variables.
+        read(sections=None, streaming=False) -- parse the yWriter xml file and get the instance variables.
         merge(source) -- update instance variables from a source instance.
         write() -- write instance variables to the yWriter xml file.
         is_locked() -- check whether the yw7 file is locked by yWriter.
+        is_modified() -- check whether the yw7 file has changed since it was read or written.
         remove_custom_fields() -- Remove custom fields from the yWriter file.
 
     Public instance variables:
         tree -- xml element tree of the yWriter project
         scenesSplit -- bool: True, if a scene or chapter is split during merging.
+        stats -- PhaseStats instance collecting the duration of the read and write phases, or None.
     """
     DESCRIPTION = _('yWriter 7 project')
     EXTENSION = '.yw7'
@@ -47,6 +75,36 @@ class Yw7File(Novel):
         'Field_CountryCode',
         )
 
+    SECTIONS = ('project', 'locations', 'items', 'characters',
+                'projectvars', 'projectnotes', 'scenes', 'chapters')
+    # Sections of the yWriter xml file that can be read in selectively.
+
+    _SECTION_DEPENDENCIES = {
+        'scenes': ('locations', 'items', 'characters'),
+        }
+    # Sections that must be read in along with a section, because it refers to their IDs.
+
+    _SECTION_VARS = {
+        'project': ('title', 'desc', 'kwVar', 'authorName', 'authorBio',
+                    'fieldTitle1', 'fieldTitle2', 'fieldTitle3', 'fieldTitle4',
+                    'languageCode', 'countryCode'),
+        'locations': ('locations', 'srtLocations'),
+        'items': ('items', 'srtItems'),
+        'characters': ('characters', 'srtCharacters'),
+        'projectvars': ('languages', 'languageCode', 'countryCode'),
+        'projectnotes': ('projectNotes', 'srtPrjNotes'),
+        'scenes': ('scenes',),
+        'chapters': ('chapters', 'srtChapters'),
+        }
+    # Instance variables read in with each section; to be stored in the parse cache.
+
+    CACHE_CLASS = ParseCache
+    STATS_CLASS = PhaseStats
+
+    _UNTRACKED_VARS = Novel._UNTRACKED_VARS + (
+        'tree', '_fileStat', '_sections', '_isStreamed', '_isCached', '_cache', 'stats')
+    # The change tracking snapshot must not keep the xml tree alive.
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
         
@@ -54,28 +112,61 @@ class Yw7File(Novel):
             filePath -- str: path to the yw7 file.
             
         Optional arguments:
-            kwargs -- keyword arguments (not used here).            
+            kwargs -- keyword arguments.            
+
+        Optional keyword arguments:
+            parse_cache -- bool: if True, keep the parsed project data in a persistent cache.
+            phase_stats -- bool: if True, collect the duration of the read and write phases in stats.
         
         Extends the superclass constructor.
         """
         super().__init__(filePath)
         self.tree = None
         self.scenesSplit = False
+        self._fileStat = None
+        # (modification time, size) of the yw7 file when it was last read or written.
+
+        self._sections = set(self.SECTIONS)
+        # Sections represented by the instance variables.
+        # When writing, the other sections of the xml element tree remain untouched.
+
+        self._isStreamed = False
+        # True, if the file has been read in streaming mode, so there is no element tree to write back.
+
+        self._isCached = False
+        # True, if the project data has been read from the parse cache, so the element tree is yet to be parsed.
+
+        self._cache = None
+        # ParseCache instance, if the parse cache is used.
+        if kwargs.get('parse_cache', False):
+            self._cache = self.CACHE_CLASS()
+
+        self.stats = None
+        if kwargs.get('phase_stats', False):
+            self.stats = self.STATS_CLASS()
 
         #--- Initialize custom keyword variables.
         for field in self._PRJ_KWVAR:
             self.kwVar[field] = None
 
-    def read(self):
+    def read(self, sections=None, streaming=False):
         """Parse the yWriter xml file and get the instance variables.
         
+        Optional arguments:
+            sections -- iterable of section names (see SECTIONS) to read in. Default: all sections.
+            streaming -- bool: if True, parse the file incrementally, discarding processed elements.
+        
+        Sections not read in are written back unchanged by write().
+        If only the chapters are read in, their scene lists refer to the scene IDs found in the file.
+        In streaming mode, no element tree is kept, so the project cannot be written back.
+        If the parse cache is used, the project data of an unchanged file is read from the cache,
+        and the element tree is parsed when writing.
         Return a message beginning with the ERROR constant in case of error.
         Overrides the superclass method.
         """
 
-        def read_project(root):
+        def read_project(prj):
             #--- Read attributes at project level from the xml element tree.
-            prj = root.find('PROJECT')
 
             if prj.find('Title') is not None:
                 self.title = prj.find('Title').text
@@ -118,473 +209,579 @@ class Yw7File(Novel):
             if self.kwVar['Field_CountryCode']:
                 self.countryCode = self.kwVar['Field_CountryCode']
 
-        def read_locations(root):
-            #--- Read locations from the xml element tree.
-            self.srtLocations = []
-            # This is necessary for re-reading.
-            for loc in root.iter('LOCATION'):
-                lcId = loc.find('ID').text
-                self.srtLocations.append(lcId)
-                self.locations[lcId] = self.WE_CLASS()
+        def read_location(loc):
+            #--- Read a location from the xml element tree.
+            lcId = loc.find('ID').text
+            self.srtLocations.append(lcId)
+            self.locations[lcId] = self.WE_CLASS()
+
+            if loc.find('Title') is not None:
+                self.locations[lcId].title = loc.find('Title').text
 
-                if loc.find('Title') is not None:
-                    self.locations[lcId].title = loc.find('Title').text
+            if loc.find('ImageFile') is not None:
+                self.locations[lcId].image = loc.find('ImageFile').text
 
-                if loc.find('ImageFile') is not None:
-                    self.locations[lcId].image = loc.find('ImageFile').text
+            if loc.find('Desc') is not None:
+                self.locations[lcId].desc = loc.find('Desc').text
 
-                if loc.find('Desc') is not None:
-                    self.locations[lcId].desc = loc.find('Desc').text
+            if loc.find('AKA') is not None:
+                self.locations[lcId].aka = loc.find('AKA').text
 
-                if loc.find('AKA') is not None:
-                    self.locations[lcId].aka = loc.find('AKA').text
+            if loc.find('Tags') is not None:
+                if loc.find('Tags').text is not None:
+                    tags = string_to_list(loc.find('Tags').text)
+                    self.locations[lcId].tags = self._strip_spaces(tags)
 
-                if loc.find('Tags') is not None:
-                    if loc.find('Tags').text is not None:
-                        tags = string_to_list(loc.find('Tags').text)
-                        self.locations[lcId].tags = self._strip_spaces(tags)
+            #--- Initialize custom keyword variables.
+            for fieldName in self._LOC_KWVAR:
+                self.locations[lcId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            #--- Read location custom fields.
+            for lcFields in loc.findall('Fields'):
                 for fieldName in self._LOC_KWVAR:
-                    self.locations[lcId].kwVar[fieldName] = None
+                    field = lcFields.find(fieldName)
+                    if field is not None:
+                        self.locations[lcId].kwVar[fieldName] = field.text
 
-                #--- Read location custom fields.
-                for lcFields in loc.findall('Fields'):
-                    for fieldName in self._LOC_KWVAR:
-                        field = lcFields.find(fieldName)
-                        if field is not None:
-                            self.locations[lcId].kwVar[fieldName] = field.text
+        def read_item(itm):
+            #--- Read an item from the xml element tree.
+            itId = itm.find('ID').text
+            self.srtItems.append(itId)
+            self.items[itId] = self.WE_CLASS()
 
-        def read_items(root):
-            #--- Read items from the xml element tree.
-            self.srtItems = []
-            # This is necessary for re-reading.
-            for itm in root.iter('ITEM'):
-                itId = itm.find('ID').text
-                self.srtItems.append(itId)
-                self.items[itId] = self.WE_CLASS()
+            if itm.find('Title') is not None:
+                self.items[itId].title = itm.find('Title').text
 
-                if itm.find('Title') is not None:
-                    self.items[itId].title = itm.find('Title').text
+            if itm.find('ImageFile') is not None:
+                self.items[itId].image = itm.find('ImageFile').text
 
-                if itm.find('ImageFile') is not None:
-                    self.items[itId].image = itm.find('ImageFile').text
+            if itm.find('Desc') is not None:
+                self.items[itId].desc = itm.find('Desc').text
 
-                if itm.find('Desc') is not None:
-                    self.items[itId].desc = itm.find('Desc').text
+            if itm.find('AKA') is not None:
+                self.items[itId].aka = itm.find('AKA').text
 
-                if itm.find('AKA') is not None:
-                    self.items[itId].aka = itm.find('AKA').text
+            if itm.find('Tags') is not None:
+                if itm.find('Tags').text is not None:
+                    tags = string_to_list(itm.find('Tags').text)
+                    self.items[itId].tags = self._strip_spaces(tags)
 
-                if itm.find('Tags') is not None:
-                    if itm.find('Tags').text is not None:
-                        tags = string_to_list(itm.find('Tags').text)
-                        self.items[itId].tags = self._strip_spaces(tags)
+            #--- Initialize custom keyword variables.
+            for fieldName in self._ITM_KWVAR:
+                self.items[itId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            #--- Read item custom fields.
+            for itFields in itm.findall('Fields'):
                 for fieldName in self._ITM_KWVAR:
-                    self.items[itId].kwVar[fieldName] = None
+                    field = itFields.find(fieldName)
+                    if field is not None:
+                        self.items[itId].kwVar[fieldName] = field.text
 
-                #--- Read item custom fields.
-                for itFields in itm.findall('Fields'):
-                    for fieldName in self._ITM_KWVAR:
-                        field = itFields.find(fieldName)
-                        if field is not None:
-                            self.items[itId].kwVar[fieldName] = field.text
+        def read_character(crt):
+            #--- Read a character from the xml element tree.
+            crId = crt.find('ID').text
+            self.srtCharacters.append(crId)
+            self.characters[crId] = self.CHARACTER_CLASS()
 
-        def read_characters(root):
-            #--- Read characters from the xml element tree.
-            self.srtCharacters = []
-            # This is necessary for re-reading.
-            for crt in root.iter('CHARACTER'):
-                crId = crt.find('ID').text
-                self.srtCharacters.append(crId)
-                self.characters[crId] = self.CHARACTER_CLASS()
+            if crt.find('Title') is not None:
+                self.characters[crId].title = crt.find('Title').text
 
-                if crt.find('Title') is not None:
-                    self.characters[crId].title = crt.find('Title').text
+            if crt.find('ImageFile') is not None:
+                self.characters[crId].image = crt.find('ImageFile').text
 
-                if crt.find('ImageFile') is not None:
-                    self.characters[crId].image = crt.find('ImageFile').text
+            if crt.find('Desc') is not None:
+                self.characters[crId].desc = crt.find('Desc').text
 
-                if crt.find('Desc') is not None:
-                    self.characters[crId].desc = crt.find('Desc').text
+            if crt.find('AKA') is not None:
+                self.characters[crId].aka = crt.find('AKA').text
 
-                if crt.find('AKA') is not None:
-                    self.characters[crId].aka = crt.find('AKA').text
+            if crt.find('Tags') is not None:
+                if crt.find('Tags').text is not None:
+                    tags = string_to_list(crt.find('Tags').text)
+                    self.characters[crId].tags = self._strip_spaces(tags)
 
-                if crt.find('Tags') is not None:
-                    if crt.find('Tags').text is not None:
-                        tags = string_to_list(crt.find('Tags').text)
-                        self.characters[crId].tags = self._strip_spaces(tags)
+            if crt.find('Notes') is not None:
+                self.characters[crId].notes = crt.find('Notes').text
 
-                if crt.find('Notes') is not None:
-                    self.characters[crId].notes = crt.find('Notes').text
+            if crt.find('Bio') is not None:
+                self.characters[crId].bio = crt.find('Bio').text
 
-                if crt.find('Bio') is not None:
-                    self.characters[crId].bio = crt.find('Bio').text
+            if crt.find('Goals') is not None:
+                self.characters[crId].goals = crt.find('Goals').text
 
-                if crt.find('Goals') is not None:
-                    self.characters[crId].goals = crt.find('Goals').text
+            if crt.find('FullName') is not None:
+                self.characters[crId].fullName = crt.find('FullName').text
 
-                if crt.find('FullName') is not None:
-                    self.characters[crId].fullName = crt.find('FullName').text
+            if crt.find('Major') is not None:
+                self.characters[crId].isMajor = True
+            else:
+                self.characters[crId].isMajor = False
 
-                if crt.find('Major') is not None:
-                    self.characters[crId].isMajor = True
-                else:
-                    self.characters[crId].isMajor = False
+            #--- Initialize custom keyword variables.
+            for fieldName in self._CRT_KWVAR:
+                self.characters[crId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            #--- Read character custom fields.
+            for crFields in crt.findall('Fields'):
                 for fieldName in self._CRT_KWVAR:
-                    self.characters[crId].kwVar[fieldName] = None
-
-                #--- Read character custom fields.
-                for crFields in crt.findall('Fields'):
-                    for fieldName in self._CRT_KWVAR:
-                        field = crFields.find(fieldName)
-                        if field is not None:
-                            self.characters[crId].kwVar[fieldName] = field.text
+                    field = crFields.find(fieldName)
+                    if field is not None:
+                        self.characters[crId].kwVar[fieldName] = field.text
 
-        def read_projectnotes(root):
-            #--- Read project notes from the xml element tree.
-            self.srtPrjNotes = []
-            # This is necessary for re-reading.
+        def read_projectnote(pnt):
+            #--- Read a project note from the xml element tree.
+            if pnt.find('ID') is not None:
+                pnId = pnt.find('ID').text
+                self.srtPrjNotes.append(pnId)
+                self.projectNotes[pnId] = self.PN_CLASS()
+                if pnt.find('Title') is not None:
+                    self.projectNotes[pnId].title = pnt.find('Title').text
+                if pnt.find('Desc') is not None:
+                    self.projectNotes[pnId].desc = pnt.find('Desc').text
+
+            #--- Initialize project note custom fields.
+            for fieldName in self._PNT_KWVAR:
+                self.projectNotes[pnId].kwVar[fieldName] = None
+
+            #--- Read project note custom fields.
+            for pnFields in pnt.findall('Fields'):
+                field = pnFields.find(fieldName)
+                if field is not None:
+                    self.projectNotes[pnId].kwVar[fieldName] = field.text
+
+        def read_projectvar(projectvar):
+            #--- Read a relevant project variable from the xml element tree.
+            if projectvar.find('Title') is not None:
+                title = projectvar.find('Title').text
+                if title == 'Language':
+                    if projectvar.find('Desc') is not None:
+                        self.languageCode = projectvar.find('Desc').text
 
-            try:
-                for pnt in root.find('PROJECTNOTES'):
-                    if pnt.find('ID') is not None:
-                        pnId = pnt.find('ID').text
-                        self.srtPrjNotes.append(pnId)
-                        self.projectNotes[pnId] = self.PN_CLASS()
-                        if pnt.find('Title') is not None:
-                            self.projectNotes[pnId].title = pnt.find('Title').text
-                        if pnt.find('Desc') is not None:
-                            self.projectNotes[pnId].desc = pnt.find('Desc').text
-
-                    #--- Initialize project note custom fields.
-                    for fieldName in self._PNT_KWVAR:
-                        self.projectNotes[pnId].kwVar[fieldName] = None
-
-                    #--- Read project note custom fields.
-                    for pnFields in pnt.findall('Fields'):
-                        field = pnFields.find(fieldName)
-                        if field is not None:
-                            self.projectNotes[pnId].kwVar[fieldName] = field.text
-            except:
-                pass
+                elif title == 'Country':
+                    if projectvar.find('Desc') is not None:
+                        self.countryCode = projectvar.find('Desc').text
 
-        def read_projectvars(root):
-            #--- Read relevant project variables from the xml element tree.
-            try:
-                for projectvar in root.find('PROJECTVARS'):
-                    if projectvar.find('Title') is not None:
-                        title = projectvar.find('Title').text
-                        if title == 'Language':
-                            if projectvar.find('Desc') is not None:
-                                self.languageCode = projectvar.find('Desc').text
-
-                        elif title == 'Country':
-                            if projectvar.find('Desc') is not None:
-                                self.countryCode = projectvar.find('Desc').text
-
-                        elif title.startswith('lang='):
-                            try:
-                                __, langCode = title.split('=')
-                                if self.languages is None:
-                                    self.languages = []
-                                self.languages.append(langCode)
-                            except:
-                                pass
-            except:
-                pass
+                elif title.startswith('lang='):
+                    try:
+                        __, langCode = title.split('=')
+                        if self.languages is None:
+                            self.languages = []
+                        self.languages.append(langCode)
+                    except:
+                        pass
 
-        def read_scenes(root):
+        def read_scene(scn):
             #--- Read attributes at scene level from the xml element tree.
-            for scn in root.iter('SCENE'):
-                scId = scn.find('ID').text
-                self.scenes[scId] = self.SCENE_CLASS()
-
-                if scn.find('Title') is not None:
-                    self.scenes[scId].title = scn.find('Title').text
-
-                if scn.find('Desc') is not None:
-                    self.scenes[scId].desc = scn.find('Desc').text
-
-                if scn.find('SceneContent') is not None:
-                    sceneContent = scn.find('SceneContent').text
-                    if sceneContent is not None:
-                        self.scenes[scId].sceneContent = sceneContent
-
-                #--- Read scene type.
-
-                # This is how yWriter 7.1.3.0 reads the scene type:
-                #
-                # Type   |<Unused>|Field_SceneType>|scType
-                #--------+--------+----------------+------
-                # Notes  | x      | 1              | 1
-                # Todo   | x      | 2              | 2
-                # Unused | -1     | N/A            | 3
-                # Unused | -1     | 0              | 3
-                # Normal | N/A    | N/A            | 0
-                # Normal | N/A    | 0              | 0
-
-                self.scenes[scId].scType = 0
-
-                #--- Initialize custom keyword variables.
-                for fieldName in self._SCN_KWVAR:
-                    self.scenes[scId].kwVar[fieldName] = None
-
-                for scFields in scn.findall('Fields'):
-                    #--- Read scene custom fields.
-                    for fieldName in self._SCN_KWVAR:
-                        field = scFields.find(fieldName)
-                        if field is not None:
-                            self.scenes[scId].kwVar[fieldName] = field.text
-
-                    # Read scene type, if any.
-                    if scFields.find('Field_SceneType') is not None:
-                        if scFields.find('Field_SceneType').text == '1':
-                            self.scenes[scId].scType = 1
-                        elif scFields.find('Field_SceneType').text == '2':
-                            self.scenes[scId].scType = 2
-                if scn.find('Unused') is not None:
-                    if self.scenes[scId].scType == 0:
-                        self.scenes[scId].scType = 3
-
-                #--- Export when RTF.
-                if scn.find('ExportCondSpecific') is None:
-                    self.scenes[scId].doNotExport = False
-                elif scn.find('ExportWhenRTF') is not None:
-                    self.scenes[scId].doNotExport = False
-                else:
-                    self.scenes[scId].doNotExport = True
-
-                if scn.find('Status') is not None:
-                    self.scenes[scId].status = int(scn.find('Status').text)
-
-                if scn.find('Notes') is not None:
-                    self.scenes[scId].notes = scn.find('Notes').text
-
-                if scn.find('Tags') is not None:
-                    if scn.find('Tags').text is not None:
-                        tags = string_to_list(scn.find('Tags').text)
-                        self.scenes[scId].tags = self._strip_spaces(tags)
-
-                if scn.find('Field1') is not None:
-                    self.scenes[scId].field1 = scn.find('Field1').text
-
-                if scn.find('Field2') is not None:
-                    self.scenes[scId].field2 = scn.find('Field2').text
-
-                if scn.find('Field3') is not None:
-                    self.scenes[scId].field3 = scn.find('Field3').text
-
-                if scn.find('Field4') is not None:
-                    self.scenes[scId].field4 = scn.find('Field4').text
+            scId = scn.find('ID').text
+            self.scenes[scId] = self.SCENE_CLASS()
 
-                if scn.find('AppendToPrev') is not None:
-                    self.scenes[scId].appendToPrev = True
-                else:
-                    self.scenes[scId].appendToPrev = False
-
-                if scn.find('SpecificDateTime') is not None:
-                    dateTime = scn.find('SpecificDateTime').text.split(' ')
-                    for dt in dateTime:
-                        if '-' in dt:
-                            self.scenes[scId].date = dt
-                        elif ':' in dt:
-                            self.scenes[scId].time = dt
-                else:
-                    if scn.find('Day') is not None:
-                        self.scenes[scId].day = scn.find('Day').text
+            if scn.find('Title') is not None:
+                self.scenes[scId].title = scn.find('Title').text
 
-                    if scn.find('Hour') is not None:
-                        self.scenes[scId].hour = scn.find('Hour').text
+            if scn.find('Desc') is not None:
+                self.scenes[scId].desc = scn.find('Desc').text
 
-                    if scn.find('Minute') is not None:
-                        self.scenes[scId].minute = scn.find('Minute').text
+            if scn.find('SceneContent') is not None:
+                sceneContent = scn.find('SceneContent').text
+                if sceneContent is not None:
+                    self.scenes[scId].sceneContent = sceneContent
 
-                if scn.find('LastsDays') is not None:
-                    self.scenes[scId].lastsDays = scn.find('LastsDays').text
+            #--- Read scene type.
 
-                if scn.find('LastsHours') is not None:
-                    self.scenes[scId].lastsHours = scn.find('LastsHours').text
+            # This is how yWriter 7.1.3.0 reads the scene type:
+            #
+            # Type   |<Unused>|Field_SceneType>|scType
+            #--------+--------+----------------+------
+            # Notes  | x      | 1              | 1
+            # Todo   | x      | 2              | 2
+            # Unused | -1     | N/A            | 3
+            # Unused | -1     | 0              | 3
+            # Normal | N/A    | N/A            | 0
+            # Normal | N/A    | 0              | 0
 
-                if scn.find('LastsMinutes') is not None:
-                    self.scenes[scId].lastsMinutes = scn.find('LastsMinutes').text
+            self.scenes[scId].scType = 0
 
-                if scn.find('ReactionScene') is not None:
-                    self.scenes[scId].isReactionScene = True
-                else:
-                    self.scenes[scId].isReactionScene = False
+            #--- Initialize custom keyword variables.
+            for fieldName in self._SCN_KWVAR:
+                self.scenes[scId].kwVar[fieldName] = None
 
-                if scn.find('SubPlot') is not None:
-                    self.scenes[scId].isSubPlot = True
-                else:
-                    self.scenes[scId].isSubPlot = False
-
-                if scn.find('Goal') is not None:
-                    self.scenes[scId].goal = scn.find('Goal').text
-
-                if scn.find('Conflict') is not None:
-                    self.scenes[scId].conflict = scn.find('Conflict').text
-
-                if scn.find('Outcome') is not None:
-                    self.scenes[scId].outcome = scn.find('Outcome').text
-
-                if scn.find('ImageFile') is not None:
-                    self.scenes[scId].image = scn.find('ImageFile').text
-
-                if scn.find('Characters') is not None:
-                    for characters in scn.find('Characters').iter('CharID'):
-                        crId = characters.text
-                        if crId in self.srtCharacters:
-                            if self.scenes[scId].characters is None:
-                                self.scenes[scId].characters = []
-                            self.scenes[scId].characters.append(crId)
-
-                if scn.find('Locations') is not None:
-                    for locations in scn.find('Locations').iter('LocID'):
-                        lcId = locations.text
-                        if lcId in self.srtLocations:
-                            if self.scenes[scId].locations is None:
-                                self.scenes[scId].locations = []
-                            self.scenes[scId].locations.append(lcId)
-
-                if scn.find('Items') is not None:
-                    for items in scn.find('Items').iter('ItemID'):
-                        itId = items.text
-                        if itId in self.srtItems:
-                            if self.scenes[scId].items is None:
-                                self.scenes[scId].items = []
-                            self.scenes[scId].items.append(itId)
-
-        def read_chapters(root):
+            for scFields in scn.findall('Fields'):
+                #--- Read scene custom fields.
+                for fieldName in self._SCN_KWVAR:
+                    field = scFields.find(fieldName)
+                    if field is not None:
+                        self.scenes[scId].kwVar[fieldName] = field.text
+
+                # Read scene type, if any.
+                if scFields.find('Field_SceneType') is not None:
+                    if scFields.find('Field_SceneType').text == '1':
+                        self.scenes[scId].scType = 1
+                    elif scFields.find('Field_SceneType').text == '2':
+                        self.scenes[scId].scType = 2
+            if scn.find('Unused') is not None:
+                if self.scenes[scId].scType == 0:
+                    self.scenes[scId].scType = 3
+
+            #--- Export when RTF.
+            if scn.find('ExportCondSpecific') is None:
+                self.scenes[scId].doNotExport = False
+            elif scn.find('ExportWhenRTF') is not None:
+                self.scenes[scId].doNotExport = False
+            else:
+                self.scenes[scId].doNotExport = True
+
+            if scn.find('Status') is not None:
+                self.scenes[scId].status = int(scn.find('Status').text)
+
+            if scn.find('Notes') is not None:
+                self.scenes[scId].notes = scn.find('Notes').text
+
+            if scn.find('Tags') is not None:
+                if scn.find('Tags').text is not None:
+                    tags = string_to_list(scn.find('Tags').text)
+                    self.scenes[scId].tags = self._strip_spaces(tags)
+
+            if scn.find('Field1') is not None:
+                self.scenes[scId].field1 = scn.find('Field1').text
+
+            if scn.find('Field2') is not None:
+                self.scenes[scId].field2 = scn.find('Field2').text
+
+            if scn.find('Field3') is not None:
+                self.scenes[scId].field3 = scn.find('Field3').text
+
+            if scn.find('Field4') is not None:
+                self.scenes[scId].field4 = scn.find('Field4').text
+
+            if scn.find('AppendToPrev') is not None:
+                self.scenes[scId].appendToPrev = True
+            else:
+                self.scenes[scId].appendToPrev = False
+
+            if scn.find('SpecificDateTime') is not None:
+                dateTime = scn.find('SpecificDateTime').text.split(' ')
+                for dt in dateTime:
+                    if '-' in dt:
+                        self.scenes[scId].date = dt
+                    elif ':' in dt:
+                        self.scenes[scId].time = dt
+            else:
+                if scn.find('Day') is not None:
+                    self.scenes[scId].day = scn.find('Day').text
+
+                if scn.find('Hour') is not None:
+                    self.scenes[scId].hour = scn.find('Hour').text
+
+                if scn.find('Minute') is not None:
+                    self.scenes[scId].minute = scn.find('Minute').text
+
+            if scn.find('LastsDays') is not None:
+                self.scenes[scId].lastsDays = scn.find('LastsDays').text
+
+            if scn.find('LastsHours') is not None:
+                self.scenes[scId].lastsHours = scn.find('LastsHours').text
+
+            if scn.find('LastsMinutes') is not None:
+                self.scenes[scId].lastsMinutes = scn.find('LastsMinutes').text
+
+            if scn.find('ReactionScene') is not None:
+                self.scenes[scId].isReactionScene = True
+            else:
+                self.scenes[scId].isReactionScene = False
+
+            if scn.find('SubPlot') is not None:
+                self.scenes[scId].isSubPlot = True
+            else:
+                self.scenes[scId].isSubPlot = False
+
+            if scn.find('Goal') is not None:
+                self.scenes[scId].goal = scn.find('Goal').text
+
+            if scn.find('Conflict') is not None:
+                self.scenes[scId].conflict = scn.find('Conflict').text
+
+            if scn.find('Outcome') is not None:
+                self.scenes[scId].outcome = scn.find('Outcome').text
+
+            if scn.find('ImageFile') is not None:
+                self.scenes[scId].image = scn.find('ImageFile').text
+
+            # Character/location/item IDs are checked after reading, see filter_references().
+            if scn.find('Characters') is not None:
+                for characters in scn.find('Characters').iter('CharID'):
+                    if self.scenes[scId].characters is None:
+                        self.scenes[scId].characters = []
+                    self.scenes[scId].characters.append(characters.text)
+
+            if scn.find('Locations') is not None:
+                for locations in scn.find('Locations').iter('LocID'):
+                    if self.scenes[scId].locations is None:
+                        self.scenes[scId].locations = []
+                    self.scenes[scId].locations.append(locations.text)
+
+            if scn.find('Items') is not None:
+                for items in scn.find('Items').iter('ItemID'):
+                    if self.scenes[scId].items is None:
+                        self.scenes[scId].items = []
+                    self.scenes[scId].items.append(items.text)
+
+        def read_chapter(chp):
             #--- Read attributes at chapter level from the xml element tree.
-            self.srtChapters = []
-            # This is necessary for re-reading.
-            for chp in root.iter('CHAPTER'):
-                chId = chp.find('ID').text
-                self.chapters[chId] = self.CHAPTER_CLASS()
-                self.srtChapters.append(chId)
+            chId = chp.find('ID').text
+            self.chapters[chId] = self.CHAPTER_CLASS()
+            self.srtChapters.append(chId)
 
-                if chp.find('Title') is not None:
-                    self.chapters[chId].title = chp.find('Title').text
+            if chp.find('Title') is not None:
+                self.chapters[chId].title = chp.find('Title').text
 
-                if chp.find('Desc') is not None:
-                    self.chapters[chId].desc = chp.find('Desc').text
+            if chp.find('Desc') is not None:
+                self.chapters[chId].desc = chp.find('Desc').text
 
-                if chp.find('SectionStart') is not None:
-                    self.chapters[chId].chLevel = 1
-                else:
-                    self.chapters[chId].chLevel = 0
-
-                # This is how yWriter 7.1.3.0 reads the chapter type:
-                #
-                # Type   |<Unused>|<Type>|<ChapterType>|chType
-                # -------+--------+------+--------------------
-                # Normal | N/A    | N/A  | N/A         | 0
-                # Normal | N/A    | 0    | N/A         | 0
-                # Notes  | x      | 1    | N/A         | 1
-                # Unused | -1     | 0    | N/A         | 3
-                # Normal | N/A    | x    | 0           | 0
-                # Notes  | x      | x    | 1           | 1
-                # Todo   | x      | x    | 2           | 2
-                # Unused | -1     | x    | x           | 3
-
-                self.chapters[chId].chType = 0
-                if chp.find('Unused') is not None:
-                    yUnused = True
-                else:
-                    yUnused = False
-                if chp.find('ChapterType') is not None:
-                    # The file may be created with yWriter version 7.0.7.2+
-                    yChapterType = chp.find('ChapterType').text
-                    if yChapterType == '2':
-                        self.chapters[chId].chType = 2
-                    elif yChapterType == '1':
+            if chp.find('SectionStart') is not None:
+                self.chapters[chId].chLevel = 1
+            else:
+                self.chapters[chId].chLevel = 0
+
+            # This is how yWriter 7.1.3.0 reads the chapter type:
+            #
+            # Type   |<Unused>|<Type>|<ChapterType>|chType
+            # -------+--------+------+--------------------
+            # Normal | N/A    | N/A  | N/A         | 0
+            # Normal | N/A    | 0    | N/A         | 0
+            # Notes  | x      | 1    | N/A         | 1
+            # Unused | -1     | 0    | N/A         | 3
+            # Normal | N/A    | x    | 0           | 0
+            # Notes  | x      | x    | 1           | 1
+            # Todo   | x      | x    | 2           | 2
+            # Unused | -1     | x    | x           | 3
+
+            self.chapters[chId].chType = 0
+            if chp.find('Unused') is not None:
+                yUnused = True
+            else:
+                yUnused = False
+            if chp.find('ChapterType') is not None:
+                # The file may be created with yWriter version 7.0.7.2+
+                yChapterType = chp.find('ChapterType').text
+                if yChapterType == '2':
+                    self.chapters[chId].chType = 2
+                elif yChapterType == '1':
+                    self.chapters[chId].chType = 1
+                elif yUnused:
+                    self.chapters[chId].chType = 3
+            else:
+                # The file may be created with a yWriter version prior to 7.0.7.2
+                if chp.find('Type') is not None:
+                    yType = chp.find('Type').text
+                    if yType == '1':
                         self.chapters[chId].chType = 1
                     elif yUnused:
                         self.chapters[chId].chType = 3
-                else:
-                    # The file may be created with a yWriter version prior to 7.0.7.2
-                    if chp.find('Type') is not None:
-                        yType = chp.find('Type').text
-                        if yType == '1':
-                            self.chapters[chId].chType = 1
-                        elif yUnused:
-                            self.chapters[chId].chType = 3
-
-                self.chapters[chId].suppressChapterTitle = False
-                if self.chapters[chId].title is not None:
-                    if self.chapters[chId].title.startswith('@'):
+
+            self.chapters[chId].suppressChapterTitle = False
+            if self.chapters[chId].title is not None:
+                if self.chapters[chId].title.startswith('@'):
+                    self.chapters[chId].suppressChapterTitle = True
+
+            #--- Initialize custom keyword variables.
+            for fieldName in self._CHP_KWVAR:
+                self.chapters[chId].kwVar[fieldName] = None
+
+            #--- Read chapter fields.
+            for chFields in chp.findall('Fields'):
+                if chFields.find('Field_SuppressChapterTitle') is not None:
+                    if chFields.find('Field_SuppressChapterTitle').text == '1':
                         self.chapters[chId].suppressChapterTitle = True
+                self.chapters[chId].isTrash = False
+                if chFields.find('Field_IsTrash') is not None:
+                    if chFields.find('Field_IsTrash').text == '1':
+                        self.chapters[chId].isTrash = True
+                self.chapters[chId].suppressChapterBreak = False
+                if chFields.find('Field_SuppressChapterBreak') is not None:
+                    if chFields.find('Field_SuppressChapterBreak').text == '1':
+                        self.chapters[chId].suppressChapterBreak = True
 
-                #--- Initialize custom keyword variables.
+                #--- Read chapter custom fields.
                 for fieldName in self._CHP_KWVAR:
-                    self.chapters[chId].kwVar[fieldName] = None
-
-                #--- Read chapter fields.
-                for chFields in chp.findall('Fields'):
-                    if chFields.find('Field_SuppressChapterTitle') is not None:
-                        if chFields.find('Field_SuppressChapterTitle').text == '1':
-                            self.chapters[chId].suppressChapterTitle = True
-                    self.chapters[chId].isTrash = False
-                    if chFields.find('Field_IsTrash') is not None:
-                        if chFields.find('Field_IsTrash').text == '1':
-                            self.chapters[chId].isTrash = True
-                    self.chapters[chId].suppressChapterBreak = False
-                    if chFields.find('Field_SuppressChapterBreak') is not None:
-                        if chFields.find('Field_SuppressChapterBreak').text == '1':
-                            self.chapters[chId].suppressChapterBreak = True
-
-                    #--- Read chapter custom fields.
-                    for fieldName in self._CHP_KWVAR:
-                        field = chFields.find(fieldName)
-                        if field is not None:
-                            self.chapters[chId].kwVar[fieldName] = field.text
-
-                #--- Read chapter's scene list.
-                self.chapters[chId].srtScenes = []
-                if chp.find('Scenes') is not None:
-                    for scn in chp.find('Scenes').findall('ScID'):
-                        scId = scn.text
-                        if scId in self.scenes:
-                            self.chapters[chId].srtScenes.append(scId)
+                    field = chFields.find(fieldName)
+                    if field is not None:
+                        self.chapters[chId].kwVar[fieldName] = field.text
+
+            #--- Read chapter's scene list.
+            # Scene IDs are checked after reading, see filter_references().
+            self.chapters[chId].srtScenes = []
+            if chp.find('Scenes') is not None:
+                for scn in chp.find('Scenes').findall('ScID'):
+                    self.chapters[chId].srtScenes.append(scn.text)
+
+        def filter_references(scIds):
+            #--- Remove references to elements that do not exist.
+            if 'scenes' in self._sections:
+                crIds = set(self.srtCharacters)
+                lcIds = set(self.srtLocations)
+                itIds = set(self.srtItems)
+                for scId in self.scenes:
+                    scene = self.scenes[scId]
+                    if scene.characters is not None:
+                        scene.characters = [crId for crId in scene.characters if crId in crIds] or None
+                    if scene.locations is not None:
+                        scene.locations = [lcId for lcId in scene.locations if lcId in lcIds] or None
+                    if scene.items is not None:
+                        scene.items = [itId for itId in scene.items if itId in itIds] or None
+            if 'chapters' in self._sections:
+                for chId in self.srtChapters:
+                    self.chapters[chId].srtScenes = [scId for scId in self.chapters[chId].srtScenes if scId in scIds]
+
+        def read_element(sectionTag, elem):
+            """Read a child element of a section, if the section is to be read in.
+            
+            Return the element's ID, if it is a scene.
+            """
+            if sectionTag == 'LOCATIONS':
+                if 'locations' in self._sections:
+                    read_location(elem)
+            elif sectionTag == 'ITEMS':
+                if 'items' in self._sections:
+                    read_item(elem)
+            elif sectionTag == 'CHARACTERS':
+                if 'characters' in self._sections:
+                    read_character(elem)
+            elif sectionTag == 'PROJECTVARS':
+                if 'projectvars' in self._sections:
+                    try:
+                        read_projectvar(elem)
+                    except:
+                        pass
+            elif sectionTag == 'PROJECTNOTES':
+                if 'projectnotes' in self._sections:
+                    try:
+                        read_projectnote(elem)
+                    except:
+                        pass
+            elif sectionTag == 'SCENES':
+                if 'scenes' in self._sections:
+                    read_scene(elem)
+                return elem.find('ID').text
+
+            elif sectionTag == 'CHAPTERS':
+                if 'chapters' in self._sections:
+                    read_chapter(elem)
+            return None
+
+        def read_stream():
+            """Parse the file incrementally and read the elements as soon as they are complete.
+            
+            Return a set of the scene IDs found in the file.
+            """
+            scIds = set()
+            elements = []
+            # Stack of the elements currently open.
+            with open(self.filePath, 'rb') as f:
+                for event, elem in ET.iterparse(ControlCharFilter(f), events=('start', 'end')):
+                    if event == 'start':
+                        elements.append(elem)
+                        continue
+
+                    elements.pop()
+                    if len(elements) == 2 and elements[1].tag != 'PROJECT':
+                        # elem is a child of a section, e.g. <YWRITER7><SCENES><SCENE>
+                        scId = read_element(elements[1].tag, elem)
+                        if scId is not None:
+                            scIds.add(scId)
+                        elements[1].remove(elem)
+                    elif len(elements) == 1 and elem.tag == 'PROJECT':
+                        if 'project' in self._sections:
+                            read_project(elem)
+                        elements[0].remove(elem)
+            return scIds
 
         #--- Begin reading.
         if self.is_locked():
             return f'{ERROR}{_("yWriter seems to be open. Please close first")}.'
-        try:
+        self._fileStat = self._get_file_stat()
+        if sections is None:
+            sections = self.SECTIONS
+        self._sections = set(sections)
+        for section in sections:
+            self._sections.update(self._SECTION_DEPENDENCIES.get(section, ()))
+
+        # This is necessary for re-reading.
+        self.invalidate_index()
+        if 'locations' in self._sections:
+            self.srtLocations = []
+        if 'items' in self._sections:
+            self.srtItems = []
+        if 'characters' in self._sections:
+            self.srtCharacters = []
+        if 'projectnotes' in self._sections:
+            self.srtPrjNotes = []
+        if 'chapters' in self._sections:
+            self.srtChapters = []
+
+        self._isStreamed = False
+        self._isCached = False
+        if self._cache is not None and not streaming:
+            with self._measure('cache_load') as record:
+                data = self._cache.load(self.filePath, self._get_cache_variant())
+                if data is not None:
+                    self._set_cache_data(data)
+                    record['elements'] = self._count_elements()
+                    record['bytes'] = self._fileStat[1]
+            if data is not None:
+                self.tree = None
+                self._isCached = True
+                self.reset_changes()
+                return 'yWriter project data read in.'
+
+        if streaming:
             try:
-                with open(self.filePath, 'r', encoding='utf-8') as f:
-                    xmlText = f.read()
+                with open(self.filePath, 'rb') as f:
+                    bom = f.read(2)
             except:
-                # yw7 file may be UTF-16 encoded, with a wrong XML header (yWriter for iOS)
-                with open(self.filePath, 'r', encoding='utf-16') as f:
-                    xmlText = f.read()
-        except:
+                bom = b''
+            if not bom in (b'\xff\xfe', b'\xfe\xff'):
+                # Otherwise, the file is UTF-16 encoded, and the control characters cannot be filtered bytewise.
+                with self._measure('parse_stream') as record:
+                    try:
+                        scIds = read_stream()
+                    except Exception as ex:
+                        return f'{ERROR}{_("Can not process file")} - {str(ex)}'
+
+                    self.tree = None
+                    self._isStreamed = True
+                    filter_references(scIds)
+                    self.adjust_scene_types()
+                    record['elements'] = self._count_elements()
+                    record['bytes'] = self._fileStat[1]
+                self.reset_changes()
+                return 'yWriter project data read in.'
+
+        with self._measure('parse') as record:
             try:
-                self.tree = ET.parse(self.filePath)
+                root = self._parse_file()
             except Exception as ex:
                 return f'{ERROR}{_("Can not process file")} - {str(ex)}'
 
-        xmlText = re.sub('[\x00-\x08|\x0b-\x0c|\x0e-\x1f]', '', xmlText)
-        root = ET.fromstring(xmlText)
-        xmlText = None
-        # saving memory
+            record['bytes'] = self._fileStat[1]
         self.tree = ET.ElementTree(root)
 
-        read_project(root)
-        read_locations(root)
-        read_items(root)
-        read_characters(root)
-        read_projectvars(root)
-        read_projectnotes(root)
-        read_scenes(root)
-        read_chapters(root)
-        self.adjust_scene_types()
+        with self._measure('read_elements') as record:
+            if 'project' in self._sections:
+                read_project(root.find('PROJECT'))
+            scIds = set()
+            for section in root:
+                for elem in section:
+                    scId = read_element(section.tag, elem)
+                    if scId is not None:
+                        scIds.add(scId)
+            filter_references(scIds)
+            self.adjust_scene_types()
+            record['elements'] = self._count_elements()
+        if self._cache is not None and self._get_file_stat() == self._fileStat:
+            # Storing the data before the change tracking snapshots are taken.
+            with self._measure('cache_store'):
+                self._cache.store(self.filePath, self._get_cache_variant(), self._get_cache_data())
+        self.reset_changes()
         return 'yWriter project data read in.'
 
     def merge(self, source):
@@ -599,14 +796,37 @@ class Yw7File(Novel):
 
         def merge_lists(srcLst, tgtLst):
             """Insert srcLst items to tgtLst, if missing.
+            
+            A missing item is inserted right behind the preceding srcLst item, 
+            or at the beginning of tgtLst.
+            Link the items via a position map, and rebuild tgtLst in linear time.
             """
-            j = 0
+            items = [None]
+            items.extend(tgtLst)
+            # Node 0 is the list head; node n is tgtLst[n - 1].
+            following = list(range(1, len(items) + 1))
+            following[-1] = 0
+            # Index of the following node; 0 marks the end of the list.
+            positions = {}
+            for i in range(len(items) - 1, 0, -1):
+                positions[items[i]] = i
+            # key: item, value: index of the node with the item's first occurrence.
+            current = 0
             for item in srcLst:
-                if not item in tgtLst:
-                    tgtLst.insert(j, item)
-                    j += 1
-                else:
-                    j = tgtLst.index(item) + 1
+                i = positions.get(item)
+                if i is None:
+                    i = len(items)
+                    items.append(item)
+                    following.append(following[current])
+                    following[current] = i
+                    positions[item] = i
+                current = i
+            merged = []
+            i = following[0]
+            while i:
+                merged.append(items[i])
+                i = following[i]
+            tgtLst[:] = merged
 
         if os.path.isfile(self.filePath):
             message = self.read()
@@ -775,7 +995,7 @@ class Yw7File(Novel):
                 else:
                     self.projectNotes[pnId].desc = tempPrjn[pnId].desc
 
-                for fieldName in self._prn_KWVAR:
+                for fieldName in self._PNT_KWVAR:
                     try:
                         self.projectNotes[pnId].kwVar[fieldName] = source.projectNotes[pnId].kwVar[fieldName]
                     except:
@@ -930,8 +1150,9 @@ class Yw7File(Novel):
 
             # Remove scenes that have been moved to another chapter from the scene list.
             srtScenes = []
+            sourceScenes = set(source.chapters[chId].srtScenes)
             for scId in self.chapters[chId].srtScenes:
-                if scId in source.chapters[chId].srtScenes or not scId in source.scenes:
+                if scId in sourceScenes or not scId in source.scenes:
                     # The scene has not moved to another chapter or isn't imported
                     srtScenes.append(scId)
             self.chapters[chId].srtScenes = srtScenes
@@ -984,6 +1205,7 @@ class Yw7File(Novel):
         # Deletion of chapters is not considered.
         # The sort order of chapters may not change.
         merge_lists(source.srtChapters, self.srtChapters)
+        self.invalidate_index()
 
         # Split scenes by inserted part/chapter/scene dividers.
         # This must be done after regular merging
@@ -992,6 +1214,9 @@ class Yw7File(Novel):
             sceneSplitter = Splitter()
             self.scenesSplit = sceneSplitter.split_scenes(self)
         self.adjust_scene_types()
+
+        # Lists and dictionaries have been modified in place, so consider everything changed.
+        self.set_changed()
         return 'yWriter project data updated or created.'
 
     def write(self):
@@ -1005,14 +1230,41 @@ class Yw7File(Novel):
         if self.is_locked():
             return f'{ERROR}{_("yWriter seems to be open. Please close first")}.'
 
-        if self.languages is None:
-            self.get_languages()
-        self._build_element_tree()
+        if self._isStreamed:
+            return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(self.filePath)}" was read in streaming mode.'
+
+        if self._isCached:
+            # The element tree is needed for writing back the sections not read in.
+            if self.is_modified():
+                return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(self.filePath)}" has changed since it was read.'
+
+            with self._measure('parse') as record:
+                try:
+                    self.tree = ET.ElementTree(self._parse_file())
+                except Exception as ex:
+                    return f'{ERROR}{_("Can not process file")} - {str(ex)}'
+
+                record['bytes'] = self._fileStat[1]
+            self._isCached = False
+
+        if self.languages is None and 'scenes' in self._sections:
+            with self._measure('get_languages') as record:
+                self.get_languages()
+                record['elements'] = len(self.scenes)
+        with self._measure('build_tree') as record:
+            self._build_element_tree()
+            record['elements'] = self._count_elements()
+        with self._measure('indent') as record:
+            indent(self.tree.getroot(), preserve=True)
+            if self.stats is not None:
+                record['elements'] = sum(1 for __ in self.tree.iter())
         message = self._write_element_tree(self)
         if message.startswith(ERROR):
             return message
 
-        return self._post_xml_file(self.filePath)
+        self._fileStat = self._get_file_stat()
+        self.reset_changes()
+        return f'{_("File written")}: "{os.path.normpath(self.filePath)}".'
 
     def is_locked(self):
         """Check whether the yw7 file is locked by yWriter.
@@ -1022,6 +1274,134 @@ class Yw7File(Novel):
         """
         return os.path.isfile(f'{self.filePath}.lock')
 
+    def is_modified(self):
+        """Check whether the yw7 file has changed since it was read or written.
+        
+        Return True if the file's modification time or size differs from
+        the state recorded by read() or write(), or if nothing is recorded. 
+        Otherwise, return False. 
+        """
+        if self._fileStat is None:
+            return True
+
+        return self._get_file_stat() != self._fileStat
+
+    def _get_file_stat(self):
+        """Return a tuple with the yw7 file's modification time and size.
+        
+        Return None if the file cannot be accessed.
+        """
+        try:
+            fileStat = os.stat(self.filePath)
+        except:
+            return None
+
+        return (fileStat.st_mtime_ns, fileStat.st_size)
+
+    def _measure(self, phase):
+        """Return a context manager measuring a read or write phase.
+        
+        Positional arguments:
+            phase -- str: name of the phase.
+
+        The phase is recorded only if stats is set.
+        """
+        if self.stats is None:
+            return PhaseTimer(phase)
+
+        return self.stats.measure(phase)
+
+    def _count_elements(self):
+        """Return the number of chapters, scenes, characters, locations, items, and project notes."""
+        return (len(self.chapters) + len(self.scenes) + len(self.characters)
+                + len(self.locations) + len(self.items) + len(self.projectNotes))
+
+    def _parse_file(self):
+        """Parse the yw7 file and return the root of the xml element tree.
+        
+        Remove control characters that are not allowed in xml.
+        Raise an exception in case of error.
+        """
+        try:
+            try:
+                with open(self.filePath, 'r', encoding='utf-8') as f:
+                    xmlText = f.read()
+            except:
+                # yw7 file may be UTF-16 encoded, with a wrong XML header (yWriter for iOS)
+                with open(self.filePath, 'r', encoding='utf-16') as f:
+                    xmlText = f.read()
+        except:
+            return ET.parse(self.filePath).getroot()
+
+        xmlText = re.sub('[\x00-\x08|\x0b-\x0c|\x0e-\x1f]', '', xmlText)
+        return ET.fromstring(xmlText)
+
+    def _get_cache_variant(self):
+        """Return a string describing the project data to be cached.
+        
+        The cache entries depend on the sections read in, the custom fields, 
+        and the instance variables of the element classes.
+        """
+        schema = [type(self).__name__, ','.join(sorted(self._sections))]
+        for fields in (self._PRJ_KWVAR, self._CHP_KWVAR, self._SCN_KWVAR, self._CRT_KWVAR,
+                       self._LOC_KWVAR, self._ITM_KWVAR, self._PNT_KWVAR):
+            schema.append(','.join(fields))
+        for elementClass in (self.CHAPTER_CLASS, self.SCENE_CLASS, self.CHARACTER_CLASS, self.WE_CLASS, self.PN_CLASS):
+            schema.append(f'{elementClass.__name__}:{",".join(sorted(self._get_element_state(elementClass())))}')
+        return '|'.join(schema)
+
+    def _get_element_state(self, element):
+        """Return a dictionary with the element's instance variables, including the private ones."""
+        slots = getattr(type(element), '__slots__', None)
+        if slots is None:
+            return vars(element)
+
+        # Element class with __slots__
+        return {name: getattr(element, name) for name in slots}
+
+    def _get_element_classes(self):
+        """Return a dictionary with the element classes of the element dictionaries."""
+        return dict(
+            chapters=self.CHAPTER_CLASS,
+            scenes=self.SCENE_CLASS,
+            characters=self.CHARACTER_CLASS,
+            locations=self.WE_CLASS,
+            items=self.WE_CLASS,
+            projectNotes=self.PN_CLASS,
+            )
+
+    def _get_cache_data(self):
+        """Return the instance variables of the sections read in as a dictionary of built-in types."""
+        elementClasses = self._get_element_classes()
+        data = {}
+        for section in self._sections:
+            for name in self._SECTION_VARS[section]:
+                value = getattr(self, name)
+                if name in elementClasses:
+                    value = {elemId: self._get_element_state(element) for elemId, element in value.items()}
+                data[name] = value
+        return data
+
+    def _set_cache_data(self, data):
+        """Set the instance variables from a dictionary created by _get_cache_data()."""
+        elementClasses = self._get_element_classes()
+        for name in data:
+            value = data[name]
+            if name in elementClasses:
+                elementClass = elementClasses[name]
+                elements = {}
+                isSlotted = hasattr(elementClass, '__slots__')
+                for elemId in value:
+                    element = elementClass.__new__(elementClass)
+                    if isSlotted:
+                        for stateName, stateValue in value[elemId].items():
+                            object.__setattr__(element, stateName, stateValue)
+                    else:
+                        element.__dict__.update(value[elemId])
+                    elements[elemId] = element
+                value = elements
+            setattr(self, name, value)
+
     def _build_element_tree(self):
         """Modify the yWriter project attributes of an existing xml element tree."""
 
@@ -1032,10 +1412,9 @@ class Yw7File(Novel):
                 except(AttributeError):
                     ET.SubElement(xmlScn, 'Title').text = prjScn.title
             if xmlScn.find('BelongsToChID') is None:
-                for chId in self.chapters:
-                    if scId in self.chapters[chId].srtScenes:
-                        ET.SubElement(xmlScn, 'BelongsToChID').text = chId
-                        break
+                chId = sceneChapters.get(scId)
+                if chId is not None:
+                    ET.SubElement(xmlScn, 'BelongsToChID').text = chId
 
             if prjScn.desc is not None:
                 try:
@@ -1098,13 +1477,13 @@ class Yw7File(Novel):
 
             #--- Write scene custom fields.
             for field in self._SCN_KWVAR:
-                if self.scenes[scId].kwVar.get(field, None):
+                if prjScn.kwVar.get(field, None):
                     if scFields is None:
                         scFields = ET.SubElement(xmlScn, 'Fields')
                     try:
-                        scFields.find(field).text = self.scenes[scId].kwVar[field]
+                        scFields.find(field).text = prjScn.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(scFields, field).text = self.scenes[scId].kwVar[field]
+                        ET.SubElement(scFields, field).text = prjScn.kwVar[field]
                 elif scFields is not None:
                     try:
                         scFields.remove(scFields.find(field))
@@ -1422,13 +1801,13 @@ class Yw7File(Novel):
             #--- Write location custom fields.
             lcFields = xmlLoc.find('Fields')
             for field in self._LOC_KWVAR:
-                if self.locations[lcId].kwVar.get(field, None):
+                if prjLoc.kwVar.get(field, None):
                     if lcFields is None:
                         lcFields = ET.SubElement(xmlLoc, 'Fields')
                     try:
-                        lcFields.find(field).text = self.locations[lcId].kwVar[field]
+                        lcFields.find(field).text = prjLoc.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(lcFields, field).text = self.locations[lcId].kwVar[field]
+                        ET.SubElement(lcFields, field).text = prjLoc.kwVar[field]
                 elif lcFields is not None:
                     try:
                         lcFields.remove(lcFields.find(field))
@@ -1477,13 +1856,13 @@ class Yw7File(Novel):
             #--- Write item custom fields.
             itFields = xmlItm.find('Fields')
             for field in self._ITM_KWVAR:
-                if self.items[itId].kwVar.get(field, None):
+                if prjItm.kwVar.get(field, None):
                     if itFields is None:
                         itFields = ET.SubElement(xmlItm, 'Fields')
                     try:
-                        itFields.find(field).text = self.items[itId].kwVar[field]
+                        itFields.find(field).text = prjItm.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(itFields, field).text = self.items[itId].kwVar[field]
+                        ET.SubElement(itFields, field).text = prjItm.kwVar[field]
                 elif itFields is not None:
                     try:
                         itFields.remove(itFields.find(field))
@@ -1526,19 +1905,41 @@ class Yw7File(Novel):
             #--- Write character custom fields.
             crFields = xmlCrt.find('Fields')
             for field in self._CRT_KWVAR:
-                if self.characters[crId].kwVar.get(field, None):
+                if prjCrt.kwVar.get(field, None):
                     if crFields is None:
                         crFields = ET.SubElement(xmlCrt, 'Fields')
                     try:
-                        crFields.find(field).text = self.characters[crId].kwVar[field]
+                        crFields.find(field).text = prjCrt.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(crFields, field).text = self.characters[crId].kwVar[field]
+                        ET.SubElement(crFields, field).text = prjCrt.kwVar[field]
                 elif crFields is not None:
                     try:
                         crFields.remove(crFields.find(field))
                     except:
                         pass
 
+        def update_section(xmlSection, tag, srtIds, elements, build_subtree):
+            # Rebuild the subtrees of new, changed, or moved elements.
+            # Keep the unchanged subtrees, and the children that are not elements of the section.
+            xmlElements = {}
+            otherChildren = []
+            for xmlElem in xmlSection:
+                if xmlElem.tag == tag:
+                    xmlElements[xmlElem.findtext('ID')] = xmlElem
+                else:
+                    otherChildren.append(xmlElem)
+            newChildren = []
+            sortOrder = 0
+            for elemId in srtIds:
+                sortOrder += 1
+                xmlElem = xmlElements.get(elemId, None)
+                if xmlElem is None or elements[elemId].is_changed() or xmlElem.findtext('SortOrder') != str(sortOrder):
+                    xmlElem = ET.Element(tag)
+                    ET.SubElement(xmlElem, 'ID').text = elemId
+                    build_subtree(xmlElem, elements[elemId], sortOrder)
+                newChildren.append(xmlElem)
+            xmlSection[:] = otherChildren + newChildren
+
         def build_project_subtree(xmlPrj):
             VER = '7'
             try:
@@ -1646,76 +2047,37 @@ class Yw7File(Novel):
             chapters = ET.SubElement(root, 'CHAPTERS')
 
         #--- Process project attributes.
-
-        build_project_subtree(xmlPrj)
+        if 'project' in self._sections:
+            build_project_subtree(xmlPrj)
 
         #--- Process locations.
-
-        # Remove LOCATION entries in order to rewrite
-        # the LOCATIONS section in a modified sort order.
-        for xmlLoc in locations.findall('LOCATION'):
-            locations.remove(xmlLoc)
-
-        # Add the new XML location subtrees to the project tree.
-        sortOrder = 0
-        for lcId in self.srtLocations:
-            sortOrder += 1
-            xmlLoc = ET.SubElement(locations, 'LOCATION')
-            ET.SubElement(xmlLoc, 'ID').text = lcId
-            build_location_subtree(xmlLoc, self.locations[lcId], sortOrder)
+        # Only new, changed, or moved elements are rewritten.
+        if 'locations' in self._sections:
+            update_section(locations, 'LOCATION', self.srtLocations, self.locations, build_location_subtree)
 
         #--- Process items.
-
-        # Remove ITEM entries in order to rewrite
-        # the ITEMS section in a modified sort order.
-        for xmlItm in items.findall('ITEM'):
-            items.remove(xmlItm)
-
-        # Add the new XML item subtrees to the project tree.
-        sortOrder = 0
-        for itId in self.srtItems:
-            sortOrder += 1
-            xmlItm = ET.SubElement(items, 'ITEM')
-            ET.SubElement(xmlItm, 'ID').text = itId
-            build_item_subtree(xmlItm, self.items[itId], sortOrder)
+        if 'items' in self._sections:
+            update_section(items, 'ITEM', self.srtItems, self.items, build_item_subtree)
 
         #--- Process characters.
-
-        # Remove CHARACTER entries in order to rewrite
-        # the CHARACTERS section in a modified sort order.
-        for xmlCrt in characters.findall('CHARACTER'):
-            characters.remove(xmlCrt)
-
-        # Add the new XML character subtrees to the project tree.
-        sortOrder = 0
-        for crId in self.srtCharacters:
-            sortOrder += 1
-            xmlCrt = ET.SubElement(characters, 'CHARACTER')
-            ET.SubElement(xmlCrt, 'ID').text = crId
-            build_character_subtree(xmlCrt, self.characters[crId], sortOrder)
+        if 'characters' in self._sections:
+            update_section(characters, 'CHARACTER', self.srtCharacters, self.characters, build_character_subtree)
 
         #--- Process project notes.
-
-        # Remove PROJECTNOTE entries in order to rewrite
-        # the PROJECTNOTES section in a modified sort order.
-        if prjNotes is not None:
-            for xmlPnt in prjNotes.findall('PROJECTNOTE'):
-                prjNotes.remove(xmlPnt)
-            if not self.srtPrjNotes:
-                root.remove(prjNotes)
-        elif self.srtPrjNotes:
-            prjNotes = ET.SubElement(root, 'PROJECTNOTES')
-        if self.srtPrjNotes:
-            # Add the new XML prjNote subtrees to the project tree.
-            sortOrder = 0
-            for pnId in self.srtPrjNotes:
-                sortOrder += 1
-                xmlPnt = ET.SubElement(prjNotes, 'PROJECTNOTE')
-                ET.SubElement(xmlPnt, 'ID').text = pnId
-                build_prjNote_subtree(xmlPnt, self.projectNotes[pnId], sortOrder)
+        if 'projectnotes' in self._sections:
+            if prjNotes is not None:
+                if self.srtPrjNotes:
+                    update_section(prjNotes, 'PROJECTNOTE', self.srtPrjNotes, self.projectNotes, build_prjNote_subtree)
+                else:
+                    root.remove(prjNotes)
+            elif self.srtPrjNotes:
+                prjNotes = ET.SubElement(root, 'PROJECTNOTES')
+                update_section(prjNotes, 'PROJECTNOTE', self.srtPrjNotes, self.projectNotes, build_prjNote_subtree)
 
         #--- Process project variables.
-        if self.languages or self.languageCode or self.countryCode:
+        # This requires the locale and the languages used in the scenes.
+        hasLocale = {'project', 'projectvars', 'scenes'} <= self._sections
+        if hasLocale and (self.languages or self.languageCode or self.countryCode):
             self.check_locale()
             projectvars = root.find('PROJECTVARS')
             if projectvars is None:
@@ -1768,72 +2130,82 @@ class Yw7File(Novel):
                 # adding new IDs to the prjVars list
 
         #--- Process scenes.
-
-        # Save the original XML scene subtrees
-        # and remove them from the project tree.
-        for xmlScn in scenes.findall('SCENE'):
-            scId = xmlScn.find('ID').text
-            xmlScenes[scId] = xmlScn
-            scenes.remove(xmlScn)
-
-        # Add the new XML scene subtrees to the project tree.
-        for scId in self.scenes:
-            if not scId in xmlScenes:
-                xmlScenes[scId] = ET.Element('SCENE')
-                ET.SubElement(xmlScenes[scId], 'ID').text = scId
-            build_scene_subtree(xmlScenes[scId], self.scenes[scId])
-            scenes.append(xmlScenes[scId])
+        # The existing scene subtrees are updated in place, if the scene has changed.
+        if 'scenes' in self._sections:
+            sceneChapters = self.index.sceneChapters
+            otherChildren = []
+            for xmlScn in scenes:
+                if xmlScn.tag == 'SCENE':
+                    xmlScenes[xmlScn.findtext('ID')] = xmlScn
+                else:
+                    otherChildren.append(xmlScn)
+            newChildren = []
+            for scId in self.scenes:
+                prjScn = self.scenes[scId]
+                xmlScn = xmlScenes.get(scId, None)
+                if xmlScn is None:
+                    xmlScn = ET.Element('SCENE')
+                    ET.SubElement(xmlScn, 'ID').text = scId
+                    build_scene_subtree(xmlScn, prjScn)
+                elif prjScn.is_changed():
+                    build_scene_subtree(xmlScn, prjScn)
+
+                    # Keep the original word and letter counts, if the scene content is unchanged.
+                    if prjScn.sceneContent is not None:
+                        if xmlScn.find('SceneContent').text != prjScn.sceneContent:
+                            xmlScn.find('SceneContent').text = prjScn.sceneContent
+                            xmlScn.find('WordCount').text = str(prjScn.wordCount)
+                            xmlScn.find('LetterCount').text = str(prjScn.letterCount)
+                try:
+                    xmlScn.remove(xmlScn.find('RTFFile'))
+                except:
+                    pass
+                newChildren.append(xmlScn)
+            scenes[:] = otherChildren + newChildren
 
         #--- Process chapters.
+        # The existing chapter subtrees are updated in place, if the chapter has changed or moved.
+        if 'chapters' in self._sections:
+            otherChildren = []
+            for xmlChp in chapters:
+                if xmlChp.tag == 'CHAPTER':
+                    xmlChapters[xmlChp.findtext('ID')] = xmlChp
+                else:
+                    otherChildren.append(xmlChp)
+            newChildren = []
+            sortOrder = 0
+            for chId in self.srtChapters:
+                sortOrder += 1
+                xmlChp = xmlChapters.get(chId, None)
+                if xmlChp is None:
+                    xmlChp = ET.Element('CHAPTER')
+                    ET.SubElement(xmlChp, 'ID').text = chId
+                    build_chapter_subtree(xmlChp, self.chapters[chId], sortOrder)
+                elif self.chapters[chId].is_changed() or xmlChp.findtext('SortOrder') != str(sortOrder):
+                    build_chapter_subtree(xmlChp, self.chapters[chId], sortOrder)
+                newChildren.append(xmlChp)
+            chapters[:] = otherChildren + newChildren
 
-        # Save the original XML chapter subtree
-        # and remove it from the project tree.
-        for xmlChp in chapters.findall('CHAPTER'):
-            chId = xmlChp.find('ID').text
-            xmlChapters[chId] = xmlChp
-            chapters.remove(xmlChp)
-
-        # Add the new XML chapter subtrees to the project tree.
-        sortOrder = 0
-        for chId in self.srtChapters:
-            sortOrder += 1
-            if not chId in xmlChapters:
-                xmlChapters[chId] = ET.Element('CHAPTER')
-                ET.SubElement(xmlChapters[chId], 'ID').text = chId
-            build_chapter_subtree(xmlChapters[chId], self.chapters[chId], sortOrder)
-            chapters.append(xmlChapters[chId])
-
-        # Modify the scene contents of an existing xml element tree.
-        for scn in root.iter('SCENE'):
-            scId = scn.find('ID').text
-            if self.scenes[scId].sceneContent is not None:
-                scn.find('SceneContent').text = self.scenes[scId].sceneContent
-                scn.find('WordCount').text = str(self.scenes[scId].wordCount)
-                scn.find('LetterCount').text = str(self.scenes[scId].letterCount)
-            try:
-                scn.remove(scn.find('RTFFile'))
-            except:
-                pass
-
-        indent(root)
         self.tree = ET.ElementTree(root)
 
     def _write_element_tree(self, ywProject):
         """Write back the xml element tree to a .yw7 xml file located at filePath.
         
+        Serialize the tree in a single pass, with the xml header on top, 
+        CDATA sections inserted, and xml entities replaced by plain text.
+        The result is the same as with ElementTree.write() followed by _post_xml_file().
+
+        Replace the file via a temporary file, keeping the previous file as .bak (see replace_file()).
         Return a message beginning with the ERROR constant in case of error.
         """
-        if os.path.isfile(ywProject.filePath):
-            os.replace(ywProject.filePath, f'{ywProject.filePath}.bak')
-            backedUp = True
-        else:
-            backedUp = False
+        filePath = ywProject.filePath
+        with self._measure('serialize'):
+            text = serialize(ywProject.tree.getroot(), self._CDATA_TAGS)
         try:
-            ywProject.tree.write(ywProject.filePath, xml_declaration=False, encoding='utf-8')
+            with self._measure('write_file') as record:
+                record['bytes'] = replace_file(filePath, text)
         except:
-            if backedUp:
-                os.replace(f'{ywProject.filePath}.bak', ywProject.filePath)
-            return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(ywProject.filePath)}".'
+            return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(filePath)}".'
 
         return 'yWriter XML tree written.'
 
@@ -1895,24 +2267,29 @@ class Yw7File(Novel):
         for field in self._PRJ_KWVAR:
             if self.kwVar.get(field, None):
                 self.kwVar[field] = ''
+                self.set_changed('kwVar')
                 hasChanged = True
         for chId in self.chapters:
             # Deliberatey not iterate srtChapters: make sure to get all chapters.
             for field in self._CHP_KWVAR:
                 if self.chapters[chId].kwVar.get(field, None):
                     self.chapters[chId].kwVar[field] = ''
+                    self.chapters[chId].set_changed('kwVar')
                     hasChanged = True
         for scId in self.scenes:
             for field in self._SCN_KWVAR:
                 if self.scenes[scId].kwVar.get(field, None):
                     self.scenes[scId].kwVar[field] = ''
+                    self.scenes[scId].set_changed('kwVar')
                     hasChanged = True
         return hasChanged
 
     def adjust_scene_types(self):
         """Make sure that scenes in non-"Normal" chapters inherit the chapter's type."""
-        for chId in self.srtChapters:
-            if self.chapters[chId].chType != 0:
-                for scId in self.chapters[chId].srtScenes:
-                    self.scenes[scId].scType = self.chapters[chId].chType
+        for chType, chIds in self.index.chaptersByType.items():
+            if chType != 0:
+                for chId in chIds:
+                    for scId in self.chapters[chId].srtScenes:
+                        if scId in self.scenes:
+                            self.scenes[scId].scType = chType
 
@@ -1,93 +1,171 @@
-#!/usr/bin/python3
-"""Renumber yWriter chapters. 
-
-Version @release
-Requires Python 3.6+
-Copyright (c) 2021 Peter Triesberger
-For further information see https://github.com/peter88213/yw-renumber
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-import os
-import sys
-import argparse
-from pathlib import Path
-from pywriter.config.configuration import Configuration
-from pywriter.ui.ui import Ui
-from ywrenumberlib.yw_rn import YwRn
-from ywrenumberlib.yw_renumber_tk import YwRenumberTk
-
-SUFFIX = '_report'
-APPNAME = 'yw-renumber'
-SETTINGS = dict(
-    yw_last_open='',
-    root_geometry='',
-    numbering_style='0',
-    numbering_case='0',
-    heading_prefix='||',
-    heading_suffix='||',
-)
-OPTIONS = dict(
-    ren_regular=True,
-    ren_unused=False,
-    ren_parts=False,
-    ren_within_parts=False,
-)
-
-
-def run(sourcePath, silentMode=True, installDir='.'):
-
-    #--- Load configuration
-    iniFile = f'{installDir}/{APPNAME}.ini'
-    configuration = Configuration(SETTINGS, OPTIONS)
-    configuration.read(iniFile)
-    kwargs = dict(
-        suffix=SUFFIX,
-    )
-    kwargs.update(configuration.settings)
-    kwargs.update(configuration.options)
-    converter = YwRn()
-    if silentMode:
-        converter.ui = Ui('')
-        converter.run(sourcePath, **kwargs)
-    else:
-        converter.ui = YwRenumberTk('Renumber yWriter chapters @release', converter, **kwargs)
-
-        #--- Get initial project path.
-        if not sourcePath or not os.path.isfile(sourcePath):
-            sourcePath = kwargs['yw_last_open']
-
-        #--- Instantiate the viewer object.
-        converter.ui.open_project(sourcePath)
-        converter.ui.start()
-
-        #--- Save project specific configuration
-        for keyword in converter.ui.kwargs:
-            if keyword in configuration.options:
-                configuration.options[keyword] = converter.ui.kwargs[keyword]
-            elif keyword in configuration.settings:
-                configuration.settings[keyword] = converter.ui.kwargs[keyword]
-        configuration.write(iniFile)
-
-
-if __name__ == '__main__':
-    try:
-        homeDir = str(Path.home()).replace('\\', '/')
-        installDir = f'{homeDir}/.pywriter/{APPNAME}/config'
-    except:
-        installDir = '.'
-    os.makedirs(installDir, exist_ok=True)
-    if len(sys.argv) == 1:
-        run('', False, installDir)
-    else:
-        parser = argparse.ArgumentParser(
-            description='Renumber yWriter chapters',
-            epilog='')
-        parser.add_argument('sourcePath',
-                            metavar='Sourcefile',
-                            help='The path of the yWriter project file.')
-
-        parser.add_argument('--silent',
-                            action="store_true",
-                            help='operation without grphical user interface; suppress error messages')
-        args = parser.parse_args()
-        run(args.sourcePath, args.silent, installDir)
+#!/usr/bin/python3
+"""Renumber yWriter chapters. 
+
+Version @release
+Requires Python 3.6+
+Copyright (c) 2021 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+from pywriter.config.configuration import Configuration
+from pywriter.ui.ui import Ui
+from ywrenumberlib.yw_rn import YwRn
+from ywrenumberlib.yw_rn_batch import YwRnBatch
+from ywrenumberlib.yw_renumber_tk import YwRenumberTk
+
+SUFFIX = '_report'
+APPNAME = 'yw-renumber'
+SETTINGS = dict(
+    yw_last_open='',
+    root_geometry='',
+    numbering_style='0',
+    numbering_case='0',
+    heading_prefix='||',
+    heading_suffix='||',
+)
+OPTIONS = dict(
+    ren_regular=True,
+    ren_unused=False,
+    ren_parts=False,
+    ren_within_parts=False,
+    title_only=False,
+    parse_cache=False,
+)
+
+
+def run(sourcePath, silentMode=True, installDir='.', statsPath=None):
+
+    #--- Load configuration
+    iniFile = f'{installDir}/{APPNAME}.ini'
+    configuration = Configuration(SETTINGS, OPTIONS)
+    configuration.read(iniFile)
+    kwargs = dict(
+        suffix=SUFFIX,
+    )
+    kwargs.update(configuration.settings)
+    kwargs.update(configuration.options)
+    if statsPath:
+        kwargs['phase_stats'] = True
+    converter = YwRn()
+    if silentMode:
+        converter.ui = Ui('')
+        converter.run(sourcePath, **kwargs)
+    else:
+        converter.ui = YwRenumberTk('Renumber yWriter chapters @release', converter, **kwargs)
+
+        #--- Get initial project path.
+        if not sourcePath or not os.path.isfile(sourcePath):
+            sourcePath = kwargs['yw_last_open']
+
+        #--- Instantiate the viewer object.
+        converter.ui.open_project(sourcePath)
+        converter.ui.start()
+
+        #--- Save project specific configuration
+        for keyword in converter.ui.kwargs:
+            if keyword in configuration.options:
+                configuration.options[keyword] = converter.ui.kwargs[keyword]
+            elif keyword in configuration.settings:
+                configuration.settings[keyword] = converter.ui.kwargs[keyword]
+        configuration.write(iniFile)
+
+    if statsPath and converter.stats is not None:
+        write_stats(converter.stats, statsPath)
+
+
+def write_stats(stats, statsPath):
+    """Print the phase statistics as JSON, or write them to a JSON file.
+
+    Positional arguments:
+        stats -- PhaseStats instance.
+        statsPath -- str: path of the JSON file, or '-' for printing.
+    """
+    if statsPath == '-':
+        print(stats.to_json())
+    else:
+        with open(statsPath, 'w', encoding='utf-8') as f:
+            f.write(stats.to_json())
+
+
+def run_batch(sources, maxWorkers=None, installDir='.'):
+    """Renumber the chapters of many projects in a process pool.
+
+    Positional arguments:
+        sources -- list of str: file paths, directories, or glob patterns.
+
+    Optional arguments:
+        maxWorkers -- int: maximum number of worker processes (None: number of processors).
+        installDir -- str: directory of the configuration file.
+
+    Print the result table and return it as a list of BatchResult tuples.
+    """
+
+    #--- Load configuration once for all projects
+    iniFile = f'{installDir}/{APPNAME}.ini'
+    configuration = Configuration(SETTINGS, OPTIONS)
+    configuration.read(iniFile)
+    kwargs = dict(
+        suffix=SUFFIX,
+    )
+    kwargs.update(configuration.settings)
+    kwargs.update(configuration.options)
+    converter = YwRnBatch(maxWorkers)
+    results = converter.run(sources, **kwargs)
+    print(converter.format_results(results))
+    return results
+
+
+if __name__ == '__main__':
+    try:
+        homeDir = str(Path.home()).replace('\\', '/')
+        installDir = f'{homeDir}/.pywriter/{APPNAME}/config'
+    except:
+        installDir = '.'
+    os.makedirs(installDir, exist_ok=True)
+    if len(sys.argv) == 1:
+        run('', False, installDir)
+    else:
+        parser = argparse.ArgumentParser(
+            description='Renumber yWriter chapters',
+            epilog='')
+        parser.add_argument('sourcePath',
+                            metavar='Sourcefile',
+                            nargs='+',
+                            help='The path of the yWriter project file. With --batch: files, directories, or glob patterns.')
+
+        parser.add_argument('--silent',
+                            action="store_true",
+                            help='operation without grphical user interface; suppress error messages')
+        parser.add_argument('--batch',
+                            action="store_true",
+                            help='renumber many projects in parallel without graphical user interface; print a result table')
+        parser.add_argument('--workers',
+                            type=int,
+                            default=None,
+                            help='maximum number of worker processes in batch mode (default: number of processors)')
+        parser.add_argument('--stats',
+                            action="store_true",
+                            help='print the duration of the read and write phases as JSON')
+        parser.add_argument('--stats-file',
+                            default=None,
+                            metavar='FILE',
+                            help='write the duration of the read and write phases as JSON to FILE')
+        args = parser.parse_args()
+        if args.stats_file:
+            statsPath = args.stats_file
+        elif args.stats:
+            statsPath = '-'
+        else:
+            statsPath = None
+        if args.batch:
+            if statsPath:
+                parser.error('--stats is not supported with --batch')
+            run_batch(args.sourcePath, args.workers, installDir)
+        elif len(args.sourcePath) > 1:
+            parser.error('multiple source files require --batch')
+        else:
+            run(args.sourcePath[0], args.silent, installDir, statsPath)
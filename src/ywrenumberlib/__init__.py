@@ -1,11 +1,14 @@
-"""Package for yWriter chapter renumbering.
-
-Modules:
-
-yw_rn -- Provide a report generator class for yWriter projects.
-yw_renumber_tk -- Provide a tkinter GUI class for yWriter chapter renumbering.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/yw-reporter
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
+"""Package for yWriter chapter renumbering.
+
+Modules:
+
+yw_rn -- Provide a report generator class for yWriter projects.
+yw_rn_batch -- Provide a class for batch renumbering of yWriter projects.
+yw_renumber_tk -- Provide a tkinter GUI class for yWriter chapter renumbering.
+yw7_title_patcher -- Provide a class for fast chapter title patching of yWriter 7 projects.
+number_formatter -- Provide a class for formatting chapter numbers.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-reporter
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
@@ -1,119 +1,223 @@
-#!/usr/bin/python3
-""""Provide a tkinter configurator dialog for chapter renumbering.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/yw-renumber
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-import tkinter as tk
-from tkinter import ttk
-
-
-class ConfigRenumber:
-    """A tkinter window for configuring chapter renumbering.
-    
-    Public methods:
-        show_configuration(window, kwargs) -- Show a configuration dialog.
-        update_configuration(self, kwargs) -- Write options and settings to the applicaton's keyword arguments.
-    """
-
-    def show_configuration(self, window, kwargs):
-        """Show a configuration dialog.
-        
-        Positional arguments:
-            window -- tk window for the configuration dialog.      
-        
-        Required keyword arguments:
-            ren_unused -- bool: include chapters marked "Unused" in yWriter.
-            ren_parts -- bool: include chapters marked "This chapter begins a new section" in yWriter.
-            ren_regular -- bool: start numbering with the chapter marked as "start of novel" in yWriter.
-            ren_within_parts -- bool: Reset the chapter number after section beginnings.
-            numbering_style -- str: '0'=Arabic numbers; '1'= Roman numbers; '2'= Written out in English.
-            numbering_case -- str: '0'=Uppercase; '1'=Capitalized; '2'=Lowercase.
-            heading_prefix -- str: a string preceding each number.
-            heading_suffix -- str: a string following each number.
-        """
-        #--- Row 1: Chapters (parts, unused)
-        row1Cnt = 1
-        hdTypes = tk.Label(window, text='Chapters')
-        hdTypes.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
-        row1Cnt += 1
-        self._renRegular = tk.BooleanVar(value=kwargs['ren_regular'])
-        startCheckbox = ttk.Checkbutton(window, text='Include regular chapters',
-                                         variable=self._renRegular, onvalue=True, offvalue=False)
-        startCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
-        row1Cnt += 1
-        self._renParts = tk.BooleanVar(value=kwargs['ren_parts'])
-        partsCheckbox = ttk.Checkbutton(window, text='Include section beginnings',
-                                        variable=self._renParts, onvalue=True, offvalue=False)
-        partsCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
-        row1Cnt += 1
-        self._renUnused = tk.BooleanVar(value=kwargs['ren_unused'])
-        unusedCheckbox = ttk.Checkbutton(window, text='Include unused chapters',
-                                         variable=self._renUnused, onvalue=True, offvalue=False)
-        unusedCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
-        row1Cnt += 1
-        self._partWise = tk.BooleanVar(value=kwargs['ren_within_parts'])
-        partWiseCheckbox = ttk.Checkbutton(window, text='Reset number after section beginnings',
-                                         variable=self._partWise, onvalue=True, offvalue=False)
-        partWiseCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
-
-        #--- Row 2: Numbering style (numbers, case)
-        row2Cnt = 1
-        hdOptions = tk.Label(window, text='Numbering style')
-        hdOptions.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-        row2Cnt += 1
-        self._numberingStyle = tk.IntVar(value=kwargs['numbering_style'])
-        arabicCheckbox = ttk.Radiobutton(window, text='Arabic numbers', variable=self._numberingStyle, value=0)
-        arabicCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-        row2Cnt += 1
-        romanCheckbox = ttk.Radiobutton(window, text='Roman numbers', variable=self._numberingStyle, value=1)
-        romanCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-        row2Cnt += 1
-        englishCheckbox = ttk.Radiobutton(window, text='Written out in English',
-                                          variable=self._numberingStyle, value=2)
-        englishCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-        row2Cnt += 1
-        self._numberingCase = tk.IntVar(value=kwargs['numbering_case'])
-        upcaseCheckbox = ttk.Radiobutton(window, text='Uppercase', variable=self._numberingCase, value=0)
-        upcaseCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-        row2Cnt += 1
-        capitalizeCheckbox = ttk.Radiobutton(window, text='Capitalized', variable=self._numberingCase, value=1)
-        capitalizeCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-        row2Cnt += 1
-        lowercaseCheckbox = ttk.Radiobutton(window, text='Lowercase', variable=self._numberingCase, value=2)
-        lowercaseCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
-
-        #--- Row 3: "Add to number" (Prefix, Suffix)
-        row3Cnt = 1
-        hdAdd = tk.Label(window, text='Add to number')
-        hdAdd.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
-        row3Cnt += 1
-        hdPrefix = tk.Label(window, text='Prefix')
-        hdPrefix.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
-        row3Cnt += 1
-        self._headingPrefix = tk.StringVar(value=kwargs['heading_prefix'].replace('|', ''))
-        prefixEntry = tk.Entry(window, textvariable=self._headingPrefix)
-        prefixEntry.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
-        row3Cnt += 1
-        hdSuffix = tk.Label(window, text='Suffix')
-        hdSuffix.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
-        row3Cnt += 1
-        self._headingSuffix = tk.StringVar(value=kwargs['heading_suffix'].replace('|', ''))
-        suffixEntry = tk.Entry(window, textvariable=self._headingSuffix)
-        suffixEntry.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
-
-    def update_configuration(self, kwargs):
-        """Write options and settings to the applicaton's keyword arguments.
-        
-        Positional arguments:
-            kwargs -- reference to the ui kwargs dictionary.
-        """
-        kwargs['ren_regular'] = self._renRegular.get()
-        kwargs['ren_unused'] = self._renUnused.get()
-        kwargs['ren_parts'] = self._renParts.get()
-        kwargs['ren_within_parts'] = self._partWise.get()
-        kwargs['numbering_style'] = str(self._numberingStyle.get())
-        kwargs['numbering_case'] = str(self._numberingCase.get())
-        kwargs['heading_prefix'] = f'|{self._headingPrefix.get()}|'
-        kwargs['heading_suffix'] = f'|{self._headingSuffix.get()}|'
+#!/usr/bin/python3
+""""Provide a tkinter configurator dialog for chapter renumbering.
+
+tkinter is imported when the dialog is shown,
+so applications can import this module without loading the GUI stack.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+
+
+class ConfigRenumber:
+    """A tkinter window for configuring chapter renumbering.
+    
+    Public methods:
+        show_configuration(window, kwargs) -- Show a configuration dialog.
+        update_configuration(self, kwargs) -- Write options and settings to the applicaton's keyword arguments.
+        show_preview(window, get_new_titles) -- Show a preview list of the old and new chapter titles.
+        set_project(novel) -- Set the project to be previewed.
+    """
+    PREVIEW_DELAY = 300
+    # Milliseconds between the last change of the configuration and the update of the preview.
+
+    def __init__(self):
+        """Initialize instance variables."""
+        self._window = None
+        self._preview = None
+        self._getNewTitles = None
+        self._novel = None
+        self._previewJob = None
+        self._previewTitles = {}
+        # Titles shown in the preview list; key: chapter ID, value: (old title, new title).
+
+    def show_configuration(self, window, kwargs):
+        """Show a configuration dialog.
+        
+        Positional arguments:
+            window -- tk window for the configuration dialog.      
+        
+        Required keyword arguments:
+            ren_unused -- bool: include chapters marked "Unused" in yWriter.
+            ren_parts -- bool: include chapters marked "This chapter begins a new section" in yWriter.
+            ren_regular -- bool: start numbering with the chapter marked as "start of novel" in yWriter.
+            ren_within_parts -- bool: Reset the chapter number after section beginnings.
+            numbering_style -- str: '0'=Arabic numbers; '1'= Roman numbers; '2'= Written out in English.
+            numbering_case -- str: '0'=Uppercase; '1'=Capitalized; '2'=Lowercase.
+            heading_prefix -- str: a string preceding each number.
+            heading_suffix -- str: a string following each number.
+        """
+        import tkinter as tk
+        from tkinter import ttk
+
+        #--- Row 1: Chapters (parts, unused)
+        row1Cnt = 1
+        hdTypes = tk.Label(window, text='Chapters')
+        hdTypes.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
+        row1Cnt += 1
+        self._renRegular = tk.BooleanVar(value=kwargs['ren_regular'])
+        startCheckbox = ttk.Checkbutton(window, text='Include regular chapters',
+                                         variable=self._renRegular, onvalue=True, offvalue=False)
+        startCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
+        row1Cnt += 1
+        self._renParts = tk.BooleanVar(value=kwargs['ren_parts'])
+        partsCheckbox = ttk.Checkbutton(window, text='Include section beginnings',
+                                        variable=self._renParts, onvalue=True, offvalue=False)
+        partsCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
+        row1Cnt += 1
+        self._renUnused = tk.BooleanVar(value=kwargs['ren_unused'])
+        unusedCheckbox = ttk.Checkbutton(window, text='Include unused chapters',
+                                         variable=self._renUnused, onvalue=True, offvalue=False)
+        unusedCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
+        row1Cnt += 1
+        self._partWise = tk.BooleanVar(value=kwargs['ren_within_parts'])
+        partWiseCheckbox = ttk.Checkbutton(window, text='Reset number after section beginnings',
+                                         variable=self._partWise, onvalue=True, offvalue=False)
+        partWiseCheckbox.grid(row=row1Cnt, column=1, sticky=tk.W, padx=20)
+
+        #--- Row 2: Numbering style (numbers, case)
+        row2Cnt = 1
+        hdOptions = tk.Label(window, text='Numbering style')
+        hdOptions.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+        row2Cnt += 1
+        self._numberingStyle = tk.IntVar(value=kwargs['numbering_style'])
+        arabicCheckbox = ttk.Radiobutton(window, text='Arabic numbers', variable=self._numberingStyle, value=0)
+        arabicCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+        row2Cnt += 1
+        romanCheckbox = ttk.Radiobutton(window, text='Roman numbers', variable=self._numberingStyle, value=1)
+        romanCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+        row2Cnt += 1
+        englishCheckbox = ttk.Radiobutton(window, text='Written out in English',
+                                          variable=self._numberingStyle, value=2)
+        englishCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+        row2Cnt += 1
+        self._numberingCase = tk.IntVar(value=kwargs['numbering_case'])
+        upcaseCheckbox = ttk.Radiobutton(window, text='Uppercase', variable=self._numberingCase, value=0)
+        upcaseCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+        row2Cnt += 1
+        capitalizeCheckbox = ttk.Radiobutton(window, text='Capitalized', variable=self._numberingCase, value=1)
+        capitalizeCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+        row2Cnt += 1
+        lowercaseCheckbox = ttk.Radiobutton(window, text='Lowercase', variable=self._numberingCase, value=2)
+        lowercaseCheckbox.grid(row=row2Cnt, column=2, sticky=tk.W, padx=20)
+
+        #--- Row 3: "Add to number" (Prefix, Suffix)
+        row3Cnt = 1
+        hdAdd = tk.Label(window, text='Add to number')
+        hdAdd.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
+        row3Cnt += 1
+        hdPrefix = tk.Label(window, text='Prefix')
+        hdPrefix.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
+        row3Cnt += 1
+        self._headingPrefix = tk.StringVar(value=kwargs['heading_prefix'].replace('|', ''))
+        prefixEntry = tk.Entry(window, textvariable=self._headingPrefix)
+        prefixEntry.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
+        row3Cnt += 1
+        hdSuffix = tk.Label(window, text='Suffix')
+        hdSuffix.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
+        row3Cnt += 1
+        self._headingSuffix = tk.StringVar(value=kwargs['heading_suffix'].replace('|', ''))
+        suffixEntry = tk.Entry(window, textvariable=self._headingSuffix)
+        suffixEntry.grid(row=row3Cnt, column=3, sticky=tk.W, padx=20)
+
+        #--- Update the preview, if any, when the configuration changes.
+        self._window = window
+        for variable in (self._renRegular, self._renParts, self._renUnused, self._partWise,
+                         self._numberingStyle, self._numberingCase, self._headingPrefix, self._headingSuffix):
+            variable.trace_add('write', self._schedule_preview)
+
+    def update_configuration(self, kwargs):
+        """Write options and settings to the applicaton's keyword arguments.
+        
+        Positional arguments:
+            kwargs -- reference to the ui kwargs dictionary.
+        """
+        kwargs['ren_regular'] = self._renRegular.get()
+        kwargs['ren_unused'] = self._renUnused.get()
+        kwargs['ren_parts'] = self._renParts.get()
+        kwargs['ren_within_parts'] = self._partWise.get()
+        kwargs['numbering_style'] = str(self._numberingStyle.get())
+        kwargs['numbering_case'] = str(self._numberingCase.get())
+        kwargs['heading_prefix'] = f'|{self._headingPrefix.get()}|'
+        kwargs['heading_suffix'] = f'|{self._headingSuffix.get()}|'
+
+    def show_preview(self, window, get_new_titles):
+        """Show a preview list of the old and new chapter titles.
+        
+        Positional arguments:
+            window -- tk window for the preview list.
+            get_new_titles -- function taking a Novel instance and the keyword arguments,
+                              returning a dictionary of new chapter titles (see YwRn.get_new_titles).
+
+        The preview list is placed below the configuration dialog shown by show_configuration().
+        """
+        import tkinter as tk
+        from tkinter import ttk
+        window.rowconfigure(10, weight=1)
+        for column in (1, 2, 3):
+            window.columnconfigure(column, weight=1)
+        hdPreview = tk.Label(window, text='Preview')
+        hdPreview.grid(row=9, column=1, sticky=tk.W, padx=20, pady=(10, 0))
+        frame = tk.Frame(window)
+        frame.grid(row=10, column=1, columnspan=3, sticky=tk.NSEW, padx=20, pady=(0, 10))
+        self._preview = ttk.Treeview(frame, columns=('old', 'new'), show='headings', height=10)
+        self._preview.heading('old', text='Chapter title')
+        self._preview.heading('new', text='Renumbered')
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self._preview.yview)
+        self._preview.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._preview.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self._getNewTitles = get_new_titles
+        self._update_preview()
+
+    def set_project(self, novel):
+        """Set the project to be previewed.
+        
+        Positional arguments:
+            novel -- Novel instance with the chapters read in, or None. 
+            
+        The project is only read, never written.
+        """
+        self._novel = novel
+        self._schedule_preview()
+
+    def _schedule_preview(self, *args):
+        """Update the preview when the configuration has not changed for PREVIEW_DELAY milliseconds."""
+        if self._preview is None:
+            return
+
+        if self._previewJob is not None:
+            self._window.after_cancel(self._previewJob)
+        self._previewJob = self._window.after(self.PREVIEW_DELAY, self._update_preview)
+
+    def _update_preview(self):
+        """Show the old and new titles of the project's chapters.
+        
+        Only the rows that have changed are updated.
+        """
+        self._previewJob = None
+        if self._novel is None:
+            srtChapters = []
+        else:
+            srtChapters = self._novel.srtChapters
+        if list(self._previewTitles) != srtChapters:
+            self._preview.delete(*self._preview.get_children())
+            self._previewTitles = {}
+            for chId in srtChapters:
+                self._preview.insert('', 'end', iid=chId)
+                self._previewTitles[chId] = (None, None)
+        if not srtChapters:
+            return
+
+        kwargs = {}
+        self.update_configuration(kwargs)
+        newTitles = self._getNewTitles(self._novel, **kwargs)
+        for chId in srtChapters:
+            oldTitle = self._novel.chapters[chId].title
+            if oldTitle is None:
+                oldTitle = ''
+            titles = (oldTitle, newTitles.get(chId, oldTitle))
+            if titles != self._previewTitles[chId]:
+                self._preview.item(chId, values=titles)
+                self._previewTitles[chId] = titles
@@ -0,0 +1,146 @@
+"""Provide a class for formatting chapter numbers.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+
+
+class NumberFormatter:
+    """Format chapter numbers as Arabic, Roman, or English numbers.
+
+    The formatted numbers are memoized per style and case,
+    and shared by all instances, so subsequent runs reuse them.
+
+    Public methods:
+        format(n) -- Return the formatted number.
+        get_labels(count) -- Return a list of the formatted numbers from 1 to count.
+
+    Public instance variables:
+        style -- str: '0'=Arabic numbers; '1'= Roman numbers; '2'= Written out in English.
+        case -- str: '0'=Uppercase; '1'=Capitalized; '2'=Lowercase.
+    """
+    _ROMAN = (
+        (1000, 'm'),
+        (900, 'cm'),
+        (500, 'd'),
+        (400, 'cd'),
+        (100, 'c'),
+        (90, 'xc'),
+        (50, 'l'),
+        (40, 'xl'),
+        (10, 'x'),
+        (9, 'ix'),
+        (5, 'v'),
+        (4, 'iv'),
+        (1, 'i'),
+    )
+    _ZERO_TO_NINETEEN = (
+        'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+        'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen',
+    )
+    _TENS = ('', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+    _SCALES = ((1000000000, 'billion'), (1000000, 'million'), (1000, 'thousand'))
+
+    _labels = {}
+    # Memoized formatted numbers; key: (style, case), value: list with the formatted number at index n.
+
+    def __init__(self, style='0', case='0'):
+        """Initialize instance variables.
+
+        Optional arguments:
+            style -- str: '0'=Arabic numbers; '1'= Roman numbers; '2'= Written out in English.
+            case -- str: '0'=Uppercase; '1'=Capitalized; '2'=Lowercase.
+        """
+        self.style = style
+        self.case = case
+
+    def format(self, n):
+        """Return the formatted number.
+
+        Positional arguments:
+            n -- int: a number >= 1.
+        """
+        labels = self._labels.get((self.style, self.case), ())
+        if n < len(labels):
+            return labels[n]
+
+        return self._apply_case(self._to_text(n))
+
+    def get_labels(self, count):
+        """Return a list of the formatted numbers from 1 to count.
+
+        Positional arguments:
+            count -- int: number of labels.
+        """
+        key = (self.style, self.case)
+        labels = self._labels.setdefault(key, [''])
+        for n in range(len(labels), count + 1):
+            labels.append(self._apply_case(self._to_text(n)))
+        return labels[1:count + 1]
+
+    def _to_text(self, n):
+        """Return n as text in the number style, not case-converted."""
+        if self.style == '1':
+            return self._to_roman(n)
+
+        if self.style == '2':
+            return self._to_english(n)
+
+        return str(n)
+
+    def _apply_case(self, text):
+        """Return the text converted to the number case."""
+        if self.case == '0':
+            return text.upper()
+
+        if self.case == '1':
+            return text.capitalize()
+
+        return text
+
+    def _to_roman(self, n):
+        """Return n as a Roman number.
+
+        Numbers above 3999 are written with repeated 'm'.
+        """
+        result = []
+        for arabic, roman in self._ROMAN:
+            factor, n = divmod(n, arabic)
+            result.append(roman * factor)
+            if n == 0:
+                break
+
+        return ''.join(result)
+
+    def _to_english(self, n):
+        """Return n as a number written out in English, e.g. 'one thousand two hundred thirty four'."""
+        if n < 1000:
+            return self._hundreds_to_english(n)
+
+        words = []
+        for scale, name in self._SCALES:
+            if n >= scale:
+                factor, n = divmod(n, scale)
+                words.append(f'{self._to_english(factor)} {name}')
+        if n:
+            words.append(self._hundreds_to_english(n))
+        return ' '.join(words)
+
+    def _hundreds_to_english(self, n):
+        """Return n < 1000 as a number written out in English."""
+        if n < 20:
+            return self._ZERO_TO_NINETEEN[n]
+
+        if n < 100:
+            tens, units = divmod(n, 10)
+            if units:
+                return f'{self._TENS[tens]} {self._ZERO_TO_NINETEEN[units]}'
+
+            return self._TENS[tens]
+
+        hundreds, rest = divmod(n, 100)
+        if rest:
+            return f'{self._ZERO_TO_NINETEEN[hundreds]} hundred {self._hundreds_to_english(rest)}'
+
+        return f'{self._ZERO_TO_NINETEEN[hundreds]} hundred'
@@ -0,0 +1,282 @@
+"""Provide a class for fast chapter title patching of yWriter 7 projects.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import re
+import xml.etree.ElementTree as ET
+from pywriter.pywriter_globals import *
+from pywriter.model.novel import Novel
+from pywriter.yw.phase_stats import PhaseStats
+from pywriter.yw.phase_stats import PhaseTimer
+from pywriter.yw.safe_write import replace_file
+
+
+class Yw7TitlePatcher(Novel):
+    """yWriter 7 project representation for chapter title patching.
+
+    Read only the <CHAPTERS> section of a .yw7 file,
+    and write back only the chapter titles that have changed.
+    All other bytes of the file are copied through unchanged.
+
+    Public methods:
+        read() -- parse the <CHAPTERS> section and get the chapter instance variables.
+        write() -- replace the changed chapter titles in the yWriter xml file.
+        is_locked() -- check whether the yw7 file is locked by yWriter.
+
+    Public instance variables:
+        stats -- PhaseStats instance collecting the duration of the read and write phases, or None.
+    """
+    DESCRIPTION = _('yWriter 7 project')
+    EXTENSION = '.yw7'
+    STATS_CLASS = PhaseStats
+
+    _MARKUP = (('<![CDATA[', ']]>'), ('<!--', '-->'))
+    # Text sections that may contain tags that are not part of the xml structure.
+
+    _TOKEN = re.compile(r'<!\[CDATA\[.*?\]\]>|<!--.*?-->|<(/?)([A-Za-z_][\w.\-]*)[^>]*?(/?)>', re.DOTALL)
+    # CDATA sections and comments are matched as a whole, so their content is never mistaken for tags.
+
+    _CONTROL_CHARS = re.compile('[\x00-\x08|\x0b-\x0c|\x0e-\x1f]')
+
+    def __init__(self, filePath, **kwargs):
+        """Initialize instance variables.
+
+        Positional arguments:
+            filePath -- str: path to the yw7 file.
+
+        Optional arguments:
+            kwargs -- keyword arguments.
+
+        Optional keyword arguments:
+            phase_stats -- bool: if True, collect the duration of the read and write phases in stats.
+
+        Extends the superclass constructor.
+        """
+        super().__init__(filePath)
+        self._xmlText = None
+        self._titleSpans = {}
+        # key: chapter ID, value: (start, end, template) of the title within self._xmlText.
+        # The template is a format string for the replacement, taking the title as argument.
+        self._originalTitles = {}
+        self.stats = None
+        if kwargs.get('phase_stats', False):
+            self.stats = self.STATS_CLASS()
+
+    def read(self):
+        """Parse the <CHAPTERS> section and get the chapter instance variables.
+
+        Return a message beginning with the ERROR constant in case of error.
+        Overrides the superclass method.
+        """
+        if self.is_locked():
+            return f'{ERROR}{_("yWriter seems to be open. Please close first")}.'
+        with self._measure('read_file') as record:
+            try:
+                with open(self.filePath, 'r', encoding='utf-8', newline='') as f:
+                    self._xmlText = f.read()
+                    record['bytes'] = os.fstat(f.fileno()).st_size
+            except:
+                return f'{ERROR}{_("Can not process file")}: "{os.path.normpath(self.filePath)}".'
+
+        self.srtChapters = []
+        self.chapters = {}
+        self._titleSpans = {}
+        self._originalTitles = {}
+        self.invalidate_index()
+        sectionStart = self._find_tag('<CHAPTERS>', 0)
+        if sectionStart < 0:
+            return 'yWriter chapter data read in.'
+
+        sectionEnd = self._find_tag('</CHAPTERS>', sectionStart)
+        if sectionEnd < 0:
+            return f'{ERROR}{_("Can not process file")}: "{os.path.normpath(self.filePath)}".'
+
+        sectionEnd += len('</CHAPTERS>')
+
+        #--- Read the chapter attributes needed for renumbering.
+        with self._measure('parse') as record:
+            try:
+                xmlChapters = ET.fromstring(self._CONTROL_CHARS.sub('', self._xmlText[sectionStart:sectionEnd]))
+            except Exception as ex:
+                return f'{ERROR}{_("Can not process file")} - {str(ex)}'
+
+            record['elements'] = len(xmlChapters)
+
+        for chp in xmlChapters.iter('CHAPTER'):
+            chId = chp.find('ID').text
+            self.chapters[chId] = self.CHAPTER_CLASS()
+            self.srtChapters.append(chId)
+            if chp.find('Title') is not None:
+                self.chapters[chId].title = chp.find('Title').text
+            self._originalTitles[chId] = self.chapters[chId].title
+            if chp.find('SectionStart') is not None:
+                self.chapters[chId].chLevel = 1
+            else:
+                self.chapters[chId].chLevel = 0
+
+            # See Yw7File.read() for the chapter type encoding.
+            self.chapters[chId].chType = 0
+            yUnused = chp.find('Unused') is not None
+            if chp.find('ChapterType') is not None:
+                yChapterType = chp.find('ChapterType').text
+                if yChapterType == '2':
+                    self.chapters[chId].chType = 2
+                elif yChapterType == '1':
+                    self.chapters[chId].chType = 1
+                elif yUnused:
+                    self.chapters[chId].chType = 3
+            elif chp.find('Type') is not None:
+                yType = chp.find('Type').text
+                if yType == '1':
+                    self.chapters[chId].chType = 1
+                elif yUnused:
+                    self.chapters[chId].chType = 3
+
+            for chFields in chp.findall('Fields'):
+                self.chapters[chId].isTrash = False
+                if chFields.find('Field_IsTrash') is not None:
+                    if chFields.find('Field_IsTrash').text == '1':
+                        self.chapters[chId].isTrash = True
+
+        #--- Locate the chapter titles within the raw xml text.
+        depth = 0
+        chId = None
+        idStart = None
+        idIndent = ''
+        titleStart = None
+        for token in self._TOKEN.finditer(self._xmlText, sectionStart, sectionEnd):
+            closing, tag, empty = token.group(1, 2, 3)
+            if tag is None:
+                # CDATA section or comment
+                continue
+
+            if closing:
+                depth -= 1
+                if depth == 1:
+                    if tag == 'ID' and idStart is not None:
+                        chId = self._xmlText[idStart:token.start()].strip()
+                        idStart = None
+                        idEnd = token.end()
+                    elif tag == 'Title' and titleStart is not None:
+                        titleSpan = (titleStart, token.start(), '<![CDATA[{}]]>')
+                        titleStart = None
+                elif depth == 0 and tag == 'CHAPTER':
+                    if titleSpan is None and idEnd is not None:
+                        # No <Title> element: insert it after the <ID> element, with the same indentation.
+                        titleSpan = (idEnd, idEnd, idIndent + '<Title><![CDATA[{}]]></Title>')
+                    if chId in self.chapters:
+                        self._titleSpans[chId] = titleSpan
+                    chId = None
+                continue
+
+            if depth == 0 and tag == 'CHAPTER':
+                titleSpan = None
+                idEnd = None
+            elif depth == 1 and tag == 'ID' and not empty:
+                idStart = token.end()
+                idIndent = self._xmlText[self._xmlText.rfind('>', 0, token.start()) + 1:token.start()]
+                if idIndent.strip():
+                    idIndent = ''
+            elif depth == 1 and tag == 'Title':
+                if empty:
+                    titleSpan = (token.start(), token.end(), '<Title><![CDATA[{}]]></Title>')
+                else:
+                    titleStart = token.end()
+            if not empty and tag != 'CHAPTERS':
+                depth += 1
+        return 'yWriter chapter data read in.'
+
+    def write(self):
+        """Replace the changed chapter titles in the yWriter xml file.
+
+        The file is replaced via a temporary file, keeping the previous file as .bak (see replace_file()).
+        Return a message beginning with the ERROR constant in case of error.
+        Overrides the superclass method.
+        """
+        if self.is_locked():
+            return f'{ERROR}{_("yWriter seems to be open. Please close first")}.'
+
+        if self._xmlText is None:
+            return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(self.filePath)}".'
+
+        patches = []
+        for chId in self.srtChapters:
+            title = self.chapters[chId].title
+            if title == self._originalTitles.get(chId, None):
+                continue
+
+            if not chId in self._titleSpans or self._titleSpans[chId] is None:
+                return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(self.filePath)}".'
+
+            start, end, template = self._titleSpans[chId]
+            if title is None:
+                title = ''
+            patches.append((start, end, template.format(title)))
+        patches.sort()
+        newText = []
+        position = 0
+        for start, end, replacement in patches:
+            newText.append(self._xmlText[position:start])
+            newText.append(replacement)
+            position = end
+        newText.append(self._xmlText[position:])
+
+        try:
+            with self._measure('write_file') as record:
+                record['bytes'] = replace_file(self.filePath, ''.join(newText), newline='')
+                record['elements'] = len(patches)
+        except:
+            return f'{ERROR}{_("Cannot write file")}: "{os.path.normpath(self.filePath)}".'
+
+        return f'{_("File written")}: "{os.path.normpath(self.filePath)}".'
+
+    def is_locked(self):
+        """Check whether the yw7 file is locked by yWriter.
+
+        Return True if a .lock file placed by yWriter exists.
+        Otherwise, return False.
+        """
+        return os.path.isfile(f'{self.filePath}.lock')
+
+    def _find_tag(self, tag, start):
+        """Return the position of the first occurrence of a tag that is not within a CDATA section or comment.
+
+        Positional arguments:
+            tag -- str: the tag to find, e.g. '<CHAPTERS>'.
+            start -- int: position within self._xmlText to start searching at.
+
+        Return -1, if the tag is not found.
+        """
+        position = self._xmlText.find(tag, start)
+        while position >= 0:
+            for markupStart, markupEnd in self._MARKUP:
+                openPosition = self._xmlText.rfind(markupStart, 0, position)
+                if openPosition >= 0 and self._xmlText.rfind(markupEnd, openPosition, position) < 0:
+                    # The tag is within the markup; continue searching behind its end.
+                    closePosition = self._xmlText.find(markupEnd, position)
+                    if closePosition < 0:
+                        return -1
+
+                    position = self._xmlText.find(tag, closePosition + len(markupEnd))
+                    break
+
+            else:
+                return position
+
+        return -1
+
+    def _measure(self, phase):
+        """Return a context manager measuring a read or write phase.
+
+        Positional arguments:
+            phase -- str: name of the phase.
+
+        The phase is recorded only if stats is set.
+        """
+        if self.stats is None:
+            return PhaseTimer(phase)
+
+        return self.stats.measure(phase)
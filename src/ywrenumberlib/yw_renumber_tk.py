@@ -1,68 +1,92 @@
-""""Provide a tkinter GUI class for yWriter chapter renumbering.
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/yw-renumber
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-from pywriter.ui.main_tk import MainTk
-from ywrenumberlib.config_renumber import ConfigRenumber
-
-
-class YwRenumberTk(MainTk):
-    """A tkinter GUI class for yWriter chapter renumbering."""
-
-    def __init__(self, title, converter, **kwargs):
-        """Add widgets for options and settings to the GUI main window.
-        
-        Positional arguments:
-            title -- Application title to be displayed at the window frame.
-            converter -- Reference to the YwRn instance.
-
-        optional arguments:
-            kwargs -- Keyword argument dictionary containing the configuration.
-        Extends the superclass constructor.
-        """
-        super().__init__(title, **kwargs)
-        self.converter = converter
-        self._configurator = ConfigRenumber()
-        self._configurator.show_configuration(self.mainWindow, kwargs)
-
-    def _build_main_menu(self):
-        """Add main menu entries.
-        
-        Extends the superclass template method. 
-        """
-        super()._build_main_menu()
-        self.mainMenu.add_command(label='Renumber chapters', command=self.convert_file)
-        self.mainMenu.entryconfig('Renumber chapters', state='disabled')
-
-    def disable_menu(self):
-        """Disable menu entries when no project is open.
-        
-        Extends the superclass method.      
-        """
-        super().disable_menu()
-        self.mainMenu.entryconfig('Renumber chapters', state='disabled')
-
-    def enable_menu(self):
-        """Enable menu entries when a project is open.
-        
-        Extends the superclass method.
-        """
-        super().enable_menu()
-        self.mainMenu.entryconfig('Renumber chapters', state='normal')
-
-    def convert_file(self):
-        """Call the converter's conversion method.
-        
-        Write selected options and settings to the keyword arguments.
-        Overrides the superclass method.
-        """
-        self.kwargs['yw_last_open'] = self.ywPrj.filePath
-        self._configurator.update_configuration(self.kwargs)
-        self.converter.run(self.ywPrj.filePath, **self.kwargs)
-
-    def on_quit(self, event=None):
-        """Save keyword arguments before exiting the program."""
-        self._configurator.update_configuration(self.kwargs)
-        super().on_quit(self)
+""""Provide a tkinter GUI class for yWriter chapter renumbering.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.ui.main_tk import MainTk
+from ywrenumberlib.config_renumber import ConfigRenumber
+
+
+class YwRenumberTk(MainTk):
+    """A tkinter GUI class for yWriter chapter renumbering."""
+
+    def __init__(self, title, converter, **kwargs):
+        """Add widgets for options and settings to the GUI main window.
+        
+        Positional arguments:
+            title -- Application title to be displayed at the window frame.
+            converter -- Reference to the YwRn instance.
+
+        optional arguments:
+            kwargs -- Keyword argument dictionary containing the configuration.
+        Extends the superclass constructor.
+        """
+        super().__init__(title, **kwargs)
+        self.converter = converter
+        self._configurator = ConfigRenumber()
+        self._configurator.show_configuration(self.mainWindow, kwargs)
+        self._configurator.show_preview(self.mainWindow, self.converter.get_new_titles)
+
+    def _build_main_menu(self):
+        """Add main menu entries.
+        
+        Extends the superclass template method. 
+        """
+        super()._build_main_menu()
+        self.mainMenu.add_command(label='Renumber chapters', command=self.convert_file)
+        self.mainMenu.entryconfig('Renumber chapters', state='disabled')
+
+    def disable_menu(self):
+        """Disable menu entries when no project is open.
+        
+        Extends the superclass method.      
+        """
+        super().disable_menu()
+        self.mainMenu.entryconfig('Renumber chapters', state='disabled')
+
+    def enable_menu(self):
+        """Enable menu entries when a project is open.
+        
+        Extends the superclass method.
+        """
+        super().enable_menu()
+        self.mainMenu.entryconfig('Renumber chapters', state='normal')
+
+    def convert_file(self):
+        """Call the converter's conversion method on the worker thread.
+        
+        Write selected options and settings to the keyword arguments.
+        The preview is suspended while the converter changes the project.
+        Overrides the superclass method.
+        """
+        if self.is_busy():
+            return
+
+        self.kwargs['yw_last_open'] = self.ywPrj.filePath
+        self._configurator.update_configuration(self.kwargs)
+        kwargs = dict(self.kwargs)
+        self._configurator.set_project(None)
+        self.run_task('Renumbering chapters', lambda: self.converter.run(self.ywPrj, **kwargs),
+                      lambda result: self._configurator.set_project(self.ywPrj))
+
+    def _on_project_read(self, message):
+        """Update the user interface after reading the project file.
+
+        Extends the superclass method.
+        """
+        super()._on_project_read(message)
+        self._configurator.set_project(self.ywPrj)
+
+    def close_project(self, event=None):
+        """Close the yWriter project without saving and reset the user interface.
+        
+        Extends the superclass method.
+        """
+        super().close_project()
+        self._configurator.set_project(None)
+
+    def on_quit(self, event=None):
+        """Save keyword arguments before exiting the program."""
+        self._configurator.update_configuration(self.kwargs)
+        super().on_quit(self)
@@ -1,157 +1,163 @@
-"""Provide a report generator class for yWriter projects. 
-
-Copyright (c) 2022 Peter Triesberger
-For further information see https://github.com/peter88213/yw-renumber
-Published under the MIT License (https://opensource.org/licenses/mit-license.php)
-"""
-import os
-from pywriter.pywriter_globals import ERROR
-from pywriter.yw.yw7_file import Yw7File
-
-
-class YwRn():
-    """Renumber chapters.
-    
-    Public methods:
-        run(sourcePath, **kwargs) -- Modify chapter headings.
-        
-    Public instance variables:
-        ui -- Ui or YwRenumberTk instance: user interface.
-    """
-
-    def __init__(self):
-        """Initialize instance variables."""
-        self.ui = None
-
-    def run(self, sourcePath, **kwargs):
-        """Modify chapter headings.
-        
-        Positional arguments:
-            sourcePath -- str: path to the yWriter project file.
-        
-        Required keyword arguments:
-            ren_regular -- bool: include regular chapters.
-            ren_unused -- bool: include chapters marked "Unused" in yWriter.
-            ren_parts -- bool: include chapters marked "This chapter begins a new section" in yWriter.
-            ren_within_parts -- bool: Reset the chapter number after section beginnings.
-            numbering_style -- str: '0'=Arabic numbers; '1'= Roman numbers; '2'= Written out in English.
-            numbering_case -- str: '0'=Uppercase; '1'=Capitalized; '2'=Lowercase.
-            heading_prefix -- str: a string preceding each number.
-            heading_suffix -- str: a string following each number.
-        """
-        ROMAN = [
-            (1000, "m"),
-            (900, "cm"),
-            (500, "d"),
-            (400, "cd"),
-            (100, "c"),
-            (90, "xc"),
-            (50, "l"),
-            (40, "xl"),
-            (10, "x"),
-            (9, "ix"),
-            (5, "v"),
-            (4, "iv"),
-            (1, "i"),
-        ]
-
-        def number_to_roman(n):
-            """Return n as a Roman number.
-            
-            Credit goes to the user 'Aristide' on stack overflow.
-            https://stackoverflow.com/a/47713392
-            """
-            result = []
-            for (arabic, roman) in ROMAN:
-                (factor, n) = divmod(n, arabic)
-                result.append(roman * factor)
-                if n == 0:
-                    break
-
-            return "".join(result)
-
-        TENS = {30: 'thirty', 40: 'forty', 50: 'fifty',
-                60: 'sixty', 70: 'seventy', 80: 'eighty', 90: 'ninety'}
-        ZERO_TO_TWENTY = (
-            'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
-            'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty'
-        )
-
-        def number_to_english(n):
-            """Return n as a number written out in English.
-            
-            Credit goes to the user 'Hunter_71' on stack overflow.
-            https://stackoverflow.com/a/51849443
-            """
-            if any(not x.isdigit() for x in str(n)):
-                return ''
-            if n <= 20:
-                return ZERO_TO_TWENTY[n]
-            elif n < 100 and n % 10 == 0:
-                return TENS[n]
-            elif n < 100:
-                return f'{number_to_english(n - (n % 10))} {number_to_english(n % 10)}'
-            elif n < 1000 and n % 100 == 0:
-                return f'{number_to_english(n / 100)} hundred'
-            elif n < 1000:
-                return f'{number_to_english(n / 100)} hundred {number_to_english(n % 100)}'
-            elif n < 1000000:
-                return f'{number_to_english(n / 1000)} thousand {number_to_english(n % 1000)}'
-            return ''
-
-        self.newFile = None
-        __, fileExtension = os.path.splitext(sourcePath)
-        if not fileExtension == Yw7File.EXTENSION:
-            self.ui.set_info_how(
-                f'{ERROR}File "{os.path.normpath(sourcePath)}" is not a yWriter 7 project.')
-            return
-
-        if not os.path.isfile(sourcePath):
-            self.ui.set_info_how(
-                f'{ERROR}File "{os.path.normpath(sourcePath)}" not found.')
-            return
-
-        source = Yw7File(sourcePath, **kwargs)
-        message = source.read()
-        if message.startswith(ERROR):
-            self.ui.set_info_how(message)
-            return
-
-        i = 0
-        for chId in source.srtChapters:
-            if source.chapters[chId].chType == 3:
-                if not kwargs['ren_unused']:
-                    continue
-
-            if source.chapters[chId].isTrash:
-                continue
-
-            if source.chapters[chId].chLevel == 0:
-                # Regular chapter
-                if not kwargs['ren_regular']:
-                    continue
-
-            else:
-                # Part (chapter "beginning a new section")
-                if kwargs['ren_within_parts']:
-                    i = 0
-                if not kwargs['ren_parts']:
-                    continue
-
-            if source.chapters[chId].chType == 0:
-                i += 1
-                if kwargs['numbering_style'] == '1':
-                    number = number_to_roman(i)
-                elif kwargs['numbering_style'] == '2':
-                    number = number_to_english(i)
-                else:
-                    number = str(i)
-                if kwargs['numbering_case'] == '0':
-                    number = number.upper()
-                elif kwargs['numbering_case'] == '1':
-                    number = number.capitalize()
-                source.chapters[chId].title = kwargs['heading_prefix'].replace(
-                    '|', '') + number + kwargs['heading_suffix'].replace('|', '')
-        message = source.write()
-        self.ui.set_info_how(message)
-        return
+"""Provide a report generator class for yWriter projects. 
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+from pywriter.pywriter_globals import ERROR
+from pywriter.yw.yw7_file import Yw7File
+from ywrenumberlib.yw7_title_patcher import Yw7TitlePatcher
+from ywrenumberlib.number_formatter import NumberFormatter
+
+
+class YwRn():
+    """Renumber chapters.
+    
+    Public methods:
+        run(source, **kwargs) -- Modify chapter headings.
+        get_new_titles(novel, **kwargs) -- Return the renumbered chapter titles without changing the project.
+        
+    Public instance variables:
+        ui -- Ui or YwRenumberTk instance: user interface.
+        stats -- PhaseStats instance with the read and write phases of the last run, or None.
+        isChanged -- bool: True, if the last run has changed chapter titles and written the project file.
+
+    Public class constants:
+        YW_CLASS -- yWriter project class for full read/write.
+        FORMATTER_CLASS -- chapter number formatter class.
+    """
+    YW_CLASS = Yw7File
+    FORMATTER_CLASS = NumberFormatter
+
+    def __init__(self):
+        """Initialize instance variables."""
+        self.ui = None
+        self.stats = None
+        self.isChanged = False
+
+    def run(self, source, **kwargs):
+        """Modify chapter headings.
+        
+        Positional arguments:
+            source -- str: path to the yWriter project file, 
+                      or YW_CLASS instance that has already been read in.
+        
+        Required keyword arguments:
+            ren_regular -- bool: include regular chapters.
+            ren_unused -- bool: include chapters marked "Unused" in yWriter.
+            ren_parts -- bool: include chapters marked "This chapter begins a new section" in yWriter.
+            ren_within_parts -- bool: Reset the chapter number after section beginnings.
+            numbering_style -- str: '0'=Arabic numbers; '1'= Roman numbers; '2'= Written out in English.
+            numbering_case -- str: '0'=Uppercase; '1'=Capitalized; '2'=Lowercase.
+            heading_prefix -- str: a string preceding each number.
+            heading_suffix -- str: a string following each number.
+
+        Optional keyword arguments:
+            title_only -- bool: if True, patch only the chapter titles, copying all other bytes through.
+            phase_stats -- bool: if True, collect the duration of the read and write phases in stats.
+
+        A YW_CLASS instance is reused without parsing the file again, 
+        unless the file has been modified since it was read in.
+        If no chapter title changes, the project file is not written.
+        If writing fails, the original chapter titles are restored, 
+        so a reused instance still matches the file.
+        """
+        self.newFile = None
+        self.stats = None
+        self.isChanged = False
+        if isinstance(source, self.YW_CLASS):
+            sourcePath = source.filePath
+        else:
+            sourcePath = source
+        __, fileExtension = os.path.splitext(sourcePath)
+        if not fileExtension == Yw7File.EXTENSION:
+            self.ui.set_info_how(
+                f'{ERROR}File "{os.path.normpath(sourcePath)}" is not a yWriter 7 project.')
+            return
+
+        if not os.path.isfile(sourcePath):
+            self.ui.set_info_how(
+                f'{ERROR}File "{os.path.normpath(sourcePath)}" not found.')
+            return
+
+        if kwargs.get('title_only', False):
+            source = Yw7TitlePatcher(sourcePath, **kwargs)
+            message = source.read()
+        elif isinstance(source, self.YW_CLASS):
+            if kwargs.get('phase_stats', False) and source.stats is None:
+                source.stats = source.STATS_CLASS()
+            if source.is_modified():
+                message = source.read()
+            else:
+                message = 'yWriter project data reused.'
+        else:
+            source = self.YW_CLASS(sourcePath, **kwargs)
+            message = source.read(sections=('chapters',))
+        self.stats = source.stats
+        if message.startswith(ERROR):
+            self.ui.set_info_how(message)
+            return
+
+        oldTitles = {}
+        for chId, title in self.get_new_titles(source, **kwargs).items():
+            if source.chapters[chId].title != title:
+                oldTitles[chId] = source.chapters[chId].title
+                source.chapters[chId].title = title
+        if not oldTitles:
+            self.ui.set_info_how(f'File unchanged: "{os.path.normpath(sourcePath)}".')
+            return
+
+        message = source.write()
+        if message.startswith(ERROR):
+            for chId, title in oldTitles.items():
+                source.chapters[chId].title = title
+        else:
+            self.isChanged = True
+        self.ui.set_info_how(message)
+        return
+
+    def get_new_titles(self, novel, **kwargs):
+        """Return the renumbered chapter titles without changing the project.
+        
+        Positional arguments:
+            novel -- Novel instance with the chapters read in.
+        
+        Required keyword arguments:
+            see run().
+
+        Return a dictionary with the new titles of the chapters to be renumbered; key: chapter ID.
+        """
+        labels = self.FORMATTER_CLASS(kwargs['numbering_style'], kwargs['numbering_case']).get_labels(len(novel.srtChapters))
+        # Only "Normal" chapters get new titles; parts of all types may reset the numbering.
+        index = novel.index
+        chIds = index.chaptersByType.get(0, [])
+        if kwargs['ren_within_parts'] and index.partPositions:
+            chIds = sorted(set(chIds).union(index.chaptersByLevel[1]), key=index.chapterPositions.get)
+        newTitles = {}
+        i = 0
+        for chId in chIds:
+            if novel.chapters[chId].chType == 3:
+                if not kwargs['ren_unused']:
+                    continue
+
+            if novel.chapters[chId].isTrash:
+                continue
+
+            if novel.chapters[chId].chLevel == 0:
+                # Regular chapter
+                if not kwargs['ren_regular']:
+                    continue
+
+            else:
+                # Part (chapter "beginning a new section")
+                if kwargs['ren_within_parts']:
+                    i = 0
+                if not kwargs['ren_parts']:
+                    continue
+
+            if novel.chapters[chId].chType == 0:
+                newTitles[chId] = kwargs['heading_prefix'].replace(
+                    '|', '') + labels[i] + kwargs['heading_suffix'].replace('|', '')
+                i += 1
+        return newTitles
@@ -0,0 +1,151 @@
+"""Provide a class for batch renumbering of yWriter projects.
+
+Copyright (c) 2022 Peter Triesberger
+For further information see https://github.com/peter88213/yw-renumber
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import glob
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pywriter.pywriter_globals import *
+from pywriter.ui.ui import Ui
+from ywrenumberlib.yw_rn import YwRn
+
+BatchResult = namedtuple('BatchResult', ['sourcePath', 'status', 'message', 'elapsed'])
+# One row of the batch result table.
+# sourcePath -- str: path to the yWriter project file.
+# status -- str: 'done', 'unchanged' (nothing written), or 'failed'.
+# message -- str: the converter's message, without the error marker.
+# elapsed -- float: processing time in seconds.
+
+
+class BatchUi(Ui):
+    """UI facade for batch processing: buffer messages without printing them."""
+
+    def set_info_how(self, message):
+        """Buffer the message.
+
+        Positional arguments:
+            message -- message to be buffered.
+
+        Overrides the superclass method.
+        """
+        self.infoHowText = message
+
+
+def renumber_file(sourcePath, kwargs):
+    """Renumber the chapters of a single project and return a BatchResult.
+
+    Positional arguments:
+        sourcePath -- str: path to the yWriter project file.
+        kwargs -- dict: keyword arguments for YwRn.run().
+
+    This is the worker function executed in the process pool.
+    """
+    startTime = time.perf_counter()
+    converter = YwRn()
+    converter.ui = BatchUi('')
+    try:
+        converter.run(sourcePath, **kwargs)
+        message = converter.ui.infoHowText
+    except Exception as ex:
+        message = f'{ERROR}{str(ex)}'
+    if message.startswith(ERROR):
+        status = 'failed'
+        message = message.split(ERROR, maxsplit=1)[1].strip()
+    elif converter.isChanged:
+        status = 'done'
+    else:
+        status = 'unchanged'
+    return BatchResult(sourcePath, status, message, time.perf_counter() - startTime)
+
+
+class YwRnBatch:
+    """Renumber chapters of many projects in a process pool.
+
+    Public methods:
+        collect_files(sources) -- Return a list of project paths without duplicates.
+        run(sources, **kwargs) -- Renumber all projects and return the result table.
+        format_results(results) -- Return the result table as text.
+
+    Public instance variables:
+        maxWorkers -- int: maximum number of worker processes (None: number of processors).
+    """
+
+    def __init__(self, maxWorkers=None):
+        """Initialize instance variables.
+
+        Optional arguments:
+            maxWorkers -- int: maximum number of worker processes (None: number of processors).
+        """
+        self.maxWorkers = maxWorkers
+
+    def collect_files(self, sources):
+        """Return a list of project paths without duplicates.
+
+        Positional arguments:
+            sources -- list of str: file paths, directories, or glob patterns.
+
+        The paths are listed in the order of the sources; the matches of each source are sorted.
+        Directories are searched for .yw7 files (not recursive).
+        Glob patterns may use '**' for recursive search.
+        Paths that match nothing are kept, so that they show up as failed.
+        Paths leading to the same file are listed once, in the first spelling,
+        so that no file is processed by two workers at a time.
+        """
+        sourcePaths = []
+        realPaths = set()
+        for source in sources:
+            if os.path.isdir(source):
+                matches = glob.glob(os.path.join(glob.escape(source), '*.yw7'))
+            elif glob.has_magic(source):
+                matches = glob.glob(source, recursive=True)
+            else:
+                matches = [source]
+            for sourcePath in sorted(matches):
+                realPath = os.path.realpath(sourcePath)
+                if not realPath in realPaths:
+                    realPaths.add(realPath)
+                    sourcePaths.append(sourcePath)
+        return sourcePaths
+
+    def run(self, sources, **kwargs):
+        """Renumber all projects and return the result table.
+
+        Positional arguments:
+            sources -- list of str: file paths, directories, or glob patterns.
+
+        Required keyword arguments:
+            see YwRn.run().
+
+        Return a list of BatchResult tuples in the order of the collected paths.
+        """
+        sourcePaths = self.collect_files(sources)
+        if not sourcePaths:
+            return []
+
+        with ProcessPoolExecutor(max_workers=self.maxWorkers) as executor:
+            futures = [executor.submit(renumber_file, sourcePath, kwargs) for sourcePath in sourcePaths]
+            results = []
+            for sourcePath, future in zip(sourcePaths, futures):
+                try:
+                    results.append(future.result())
+                except Exception as ex:
+                    results.append(BatchResult(sourcePath, 'failed', str(ex), 0.0))
+        return results
+
+    def format_results(self, results):
+        """Return the result table as text.
+
+        Positional arguments:
+            results -- list of BatchResult tuples.
+        """
+        lines = []
+        for result in results:
+            lines.append(f'{result.status}\t{result.elapsed:.3f}s\t{os.path.normpath(result.sourcePath)}\t{result.message}')
+        unchanged = len([result for result in results if result.status == 'unchanged'])
+        failed = len([result for result in results if result.status == 'failed'])
+        lines.append(f'{len(results)} file(s) processed, {unchanged} unchanged, {failed} failed.')
+        return '\n'.join(lines)
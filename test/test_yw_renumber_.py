@@ -5,12 +5,23 @@ For further information see https://github.com/peter88213/yw-renumber
 Published under the MIT License (https://opensource.org/licenses/mit-license.php)
 """
 from shutil import copyfile
+from shutil import rmtree
 import os
+import sys
+import json
 import unittest
 import yw_renumber_
+try:
+    from pywriter.yw.compact_yw7_file import CompactYw7File
+except ImportError:
+    # The library is not available when testing the built script.
+    CompactYw7File = None
 
 UPDATE = False
 
+ERROR = '!'
+# Prefix of error messages returned by the pywriter methods.
+
 # Test environment
 
 # The paths are relative to the "test" directory,
@@ -27,11 +38,16 @@ ROMAN_YW7 = TEST_DATA_PATH + 'roman.yw7'
 WRITTEN_YW7 = TEST_DATA_PATH + 'written.yw7'
 INI_ROMAN = TEST_DATA_PATH + 'roman.ini'
 INI_WRITTEN = TEST_DATA_PATH + 'written.ini'
+INI_TITLE_ONLY = TEST_DATA_PATH + 'title_only.ini'
 
 # Test data
 TEST_YW7 = TEST_EXEC_PATH + 'yw7 Sample Project.yw7'
 TEST_YW7_BAK = TEST_YW7 + '.bak'
+TEST_YW7_2 = TEST_EXEC_PATH + 'yw7 Sample Project 2.yw7'
+TEST_YW7_2_BAK = TEST_YW7_2 + '.bak'
 TEST_INI = TEST_EXEC_PATH + 'yw-renumber.ini'
+TEST_CACHE = TEST_EXEC_PATH + 'cache'
+TEST_STATS = TEST_EXEC_PATH + 'stats.json'
 
 
 def read_file(inputFile):
@@ -45,6 +61,10 @@ def read_file(inputFile):
 
 
 def remove_all_testfiles():
+    try:
+        rmtree(TEST_CACHE)
+    except:
+        pass
     try:
         os.remove(TEST_YW7)
     except:
@@ -53,10 +73,22 @@ def remove_all_testfiles():
         os.remove(TEST_YW7_BAK)
     except:
         pass
+    try:
+        os.remove(TEST_YW7_2)
+    except:
+        pass
+    try:
+        os.remove(TEST_YW7_2_BAK)
+    except:
+        pass
     try:
         os.remove(TEST_INI)
     except:
         pass
+    try:
+        os.remove(TEST_STATS)
+    except:
+        pass
 
 
 class NormalOperation(unittest.TestCase):
@@ -98,6 +130,328 @@ class NormalOperation(unittest.TestCase):
         self.assertEqual(read_file(TEST_YW7), read_file(WRITTEN_YW7))
         self.assertEqual(read_file(TEST_YW7_BAK), read_file(NORMAL_YW7))
 
+    def test_title_only(self):
+        copyfile(DEFAULT_YW7, TEST_YW7)
+        copyfile(INI_TITLE_ONLY, TEST_INI)
+        os.chdir(TEST_EXEC_PATH)
+        yw_renumber_.run(TEST_YW7, silentMode=True, installDir=TEST_EXEC_PATH)
+        self.assertEqual(read_file(TEST_YW7), read_file(ROMAN_YW7))
+        self.assertEqual(read_file(TEST_YW7_BAK), read_file(DEFAULT_YW7))
+
+    def test_title_only_special_cases(self):
+        # A chapter without title, and a literal chapters section in the scene content.
+        xmlText = read_file(DEFAULT_YW7)
+        xmlText = xmlText.replace('<SceneContent><![CDATA[(scene 1)',
+                                  '<SceneContent><![CDATA[<CHAPTERS><CHAPTER><ID>2</ID><Title>x</Title></CHAPTER></CHAPTERS> (scene 1)', 1)
+        xmlText = xmlText.replace('<SortOrder>3</SortOrder>\n      <Title><![CDATA[2]]></Title>\n',
+                                  '<SortOrder>3</SortOrder>\n', 1)
+        with open(TEST_YW7, 'w', encoding='utf-8') as f:
+            f.write(xmlText)
+        copyfile(INI_TITLE_ONLY, TEST_INI)
+        os.chdir(TEST_EXEC_PATH)
+        yw_renumber_.run(TEST_YW7, silentMode=True, installDir=TEST_EXEC_PATH)
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywPrj.read()
+        ywRoman = yw_renumber_.YwRn.YW_CLASS(ROMAN_YW7)
+        ywRoman.read()
+        for chId in ywRoman.srtChapters:
+            self.assertEqual(ywPrj.chapters[chId].title, ywRoman.chapters[chId].title)
+        self.assertTrue(ywPrj.scenes['1'].sceneContent.startswith('<CHAPTERS><CHAPTER><ID>2</ID><Title>x</Title>'))
+
+    def test_batch(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        copyfile(NORMAL_YW7, TEST_YW7_2)
+        copyfile(INI_ROMAN, TEST_INI)
+        os.chdir(TEST_EXEC_PATH)
+        results = yw_renumber_.run_batch([TEST_EXEC_PATH + '*.yw7'], maxWorkers=2, installDir=TEST_EXEC_PATH)
+        self.assertEqual([result.status for result in results], ['done', 'done'])
+        self.assertEqual(read_file(TEST_YW7), read_file(ROMAN_YW7))
+        self.assertEqual(read_file(TEST_YW7_2), read_file(ROMAN_YW7))
+
+    def test_batch_duplicates(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        sources = [TEST_EXEC_PATH, TEST_YW7, os.path.join('.', os.path.basename(TEST_YW7))]
+        self.assertEqual(yw_renumber_.YwRnBatch().collect_files(sources), [os.path.join(TEST_EXEC_PATH, os.path.basename(TEST_YW7))])
+
+    def test_batch_special_directory_name(self):
+        batchDir = TEST_EXEC_PATH + 'batch [1]'
+        self.addCleanup(rmtree, batchDir, True)
+        os.makedirs(batchDir)
+        copyfile(NORMAL_YW7, os.path.join(batchDir, 'normal.yw7'))
+        self.assertEqual(yw_renumber_.YwRnBatch().collect_files([batchDir]), [os.path.join(batchDir, 'normal.yw7')])
+
+    def test_unchanged(self):
+        copyfile(DEFAULT_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        fileStat = os.stat(TEST_YW7)
+        results = yw_renumber_.run_batch([TEST_YW7], maxWorkers=1, installDir=TEST_EXEC_PATH)
+        self.assertEqual([result.status for result in results], ['unchanged'])
+        self.assertEqual(os.stat(TEST_YW7).st_mtime_ns, fileStat.st_mtime_ns)
+        self.assertFalse(os.path.isfile(TEST_YW7_BAK))
+
+    def test_reuse_project(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        kwargs = {}
+        kwargs.update(yw_renumber_.SETTINGS)
+        kwargs.update(yw_renumber_.OPTIONS)
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywPrj.read()
+        self.assertFalse(ywPrj.is_modified())
+        converter = yw_renumber_.YwRn()
+        converter.ui = yw_renumber_.Ui('')
+        converter.run(ywPrj, **kwargs)
+        self.assertFalse(ywPrj.is_modified())
+        self.assertEqual(read_file(TEST_YW7), read_file(DEFAULT_YW7))
+        self.assertEqual(read_file(TEST_YW7_BAK), read_file(NORMAL_YW7))
+
+    def test_reuse_project_after_failed_write(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        kwargs = {}
+        kwargs.update(yw_renumber_.SETTINGS)
+        kwargs.update(yw_renumber_.OPTIONS)
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywPrj.read()
+        converter = yw_renumber_.YwRn()
+        converter.ui = yw_renumber_.Ui('')
+        lockPath = f'{TEST_YW7}.lock'
+        with open(lockPath, 'w'):
+            pass
+        try:
+            converter.run(ywPrj, **kwargs)
+        finally:
+            os.remove(lockPath)
+        self.assertFalse(converter.isChanged)
+        self.assertEqual(read_file(TEST_YW7), read_file(NORMAL_YW7))
+        converter.run(ywPrj, **kwargs)
+        self.assertTrue(converter.isChanged)
+        self.assertEqual(read_file(TEST_YW7), read_file(DEFAULT_YW7))
+
+    def test_change_tracking(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywPrj.read()
+        chId = ywPrj.srtChapters[1]
+        chapter = ywPrj.chapters[chId]
+        self.assertFalse(chapter.is_changed())
+        chapter.title = chapter.title
+        self.assertFalse(chapter.is_changed())
+
+        # In-place modifications are written.
+        scId = chapter.srtScenes[0]
+        chapter.srtScenes.remove(scId)
+        self.assertTrue(chapter.is_changed('srtScenes'))
+        self.assertFalse(chapter.is_changed('title'))
+        self.assertFalse(ywPrj.scenes[scId].is_changed())
+        ywPrj.write()
+        ywCheck = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywCheck.read()
+        self.assertFalse(scId in ywCheck.chapters[chId].srtScenes)
+        self.assertFalse(chapter.is_changed())
+
+        # Reading properties computed on access is not a change.
+        scene = ywPrj.scenes[scId]
+        scene.sceneContent = f'{scene.sceneContent} '
+        scene.reset_changes()
+        scene.wordCount
+        scene.letterCount
+        scene.languages
+        self.assertFalse(scene.is_changed())
+
+    @unittest.skipIf(CompactYw7File is None, 'pywriter library not available')
+    def test_compact_change_tracking(self):
+        ywPrj = CompactYw7File(NORMAL_YW7)
+        ywPrj.read()
+        for elements in (ywPrj.chapters, ywPrj.scenes, ywPrj.characters):
+            for element in elements.values():
+                element.kwVar
+                self.assertFalse(element.is_changed())
+        element.kwVar['Field_Test'] = 'x'
+        self.assertTrue(element.is_changed('kwVar'))
+
+    @unittest.skipIf(CompactYw7File is None, 'pywriter library not available')
+    def test_compact_yw7_file(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        kwargs = {}
+        kwargs.update(yw_renumber_.SETTINGS)
+        kwargs.update(yw_renumber_.OPTIONS)
+        ywPrj = CompactYw7File(TEST_YW7)
+        ywPrj.read()
+        for chapter in ywPrj.chapters.values():
+            self.assertIsInstance(chapter, yw_renumber_.YwRn.YW_CLASS.CHAPTER_CLASS)
+        converter = yw_renumber_.YwRn()
+        converter.ui = yw_renumber_.Ui('')
+        converter.run(ywPrj, **kwargs)
+        self.assertEqual(read_file(TEST_YW7), read_file(DEFAULT_YW7))
+        ywPrj.chapters[ywPrj.srtChapters[1]].title = 'Modified'
+        ywPrj.write()
+        ywCheck = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywCheck.read()
+        self.assertEqual(ywCheck.chapters[ywPrj.srtChapters[1]].title, 'Modified')
+        self.assertEqual(ywCheck.srtChapters, ywPrj.srtChapters)
+
+    def test_streaming_read(self):
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(NORMAL_YW7)
+        self.assertFalse(ywPrj.read().startswith(ERROR))
+        ywStreamed = yw_renumber_.YwRn.YW_CLASS(NORMAL_YW7)
+        self.assertFalse(ywStreamed.read(streaming=True).startswith(ERROR))
+        for name in ('title', 'desc', 'authorName', 'languageCode', 'countryCode', 'kwVar',
+                     'srtChapters', 'srtCharacters', 'srtLocations', 'srtItems', 'srtPrjNotes'):
+            self.assertEqual(getattr(ywStreamed, name), getattr(ywPrj, name), name)
+        for name in ('chapters', 'scenes', 'characters', 'locations', 'items', 'projectNotes'):
+            elements = getattr(ywPrj, name)
+            streamedElements = getattr(ywStreamed, name)
+            self.assertEqual(list(streamedElements), list(elements), name)
+            for elemId in elements:
+                self.assertEqual(vars(streamedElements[elemId]), vars(elements[elemId]), f'{name} {elemId}')
+
+    def test_streaming_write(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(TEST_YW7)
+        ywPrj.read(streaming=True)
+        self.assertTrue(ywPrj.write().startswith(ERROR))
+        self.assertEqual(read_file(TEST_YW7), read_file(NORMAL_YW7))
+        self.assertFalse(os.path.isfile(TEST_YW7_BAK))
+
+    def test_parse_cache(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        cacheClass = yw_renumber_.YwRn.YW_CLASS.CACHE_CLASS
+        self.addCleanup(setattr, cacheClass, 'CACHE_DIR', cacheClass.CACHE_DIR)
+        cacheClass.CACHE_DIR = TEST_CACHE
+        kwargs = {}
+        kwargs.update(yw_renumber_.SETTINGS)
+        kwargs.update(yw_renumber_.OPTIONS)
+        kwargs['parse_cache'] = True
+        kwargs['phase_stats'] = True
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(TEST_YW7, **kwargs)
+        ywPrj.read()
+        self.assertTrue('parse' in [record['phase'] for record in ywPrj.stats.records])
+        self.assertTrue(os.listdir(TEST_CACHE))
+
+        # The second read takes the project data from the cache, without parsing the file.
+        ywCached = yw_renumber_.YwRn.YW_CLASS(TEST_YW7, **kwargs)
+        ywCached.read()
+        self.assertEqual([record['phase'] for record in ywCached.stats.records], ['cache_load'])
+        self.assertEqual(ywCached.srtChapters, ywPrj.srtChapters)
+        for name in ('chapters', 'scenes', 'characters', 'locations', 'items', 'projectNotes'):
+            elements = getattr(ywPrj, name)
+            cachedElements = getattr(ywCached, name)
+            self.assertEqual(list(cachedElements), list(elements), name)
+            for elemId in elements:
+                self.assertEqual(vars(cachedElements[elemId]), vars(elements[elemId]), f'{name} {elemId}')
+
+        # The project read from the cache is written like a parsed one.
+        converter = yw_renumber_.YwRn()
+        converter.ui = yw_renumber_.Ui('')
+        converter.run(ywCached, **kwargs)
+        self.assertEqual(read_file(TEST_YW7), read_file(DEFAULT_YW7))
+
+    def test_phase_stats(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        yw_renumber_.run(TEST_YW7, silentMode=True, statsPath=TEST_STATS)
+        self.assertEqual(read_file(TEST_YW7), read_file(DEFAULT_YW7))
+        stats = json.loads(read_file(TEST_STATS))
+        self.assertEqual([record['phase'] for record in stats['phases']],
+                         ['parse', 'read_elements', 'build_tree', 'indent', 'serialize', 'write_file'])
+        self.assertEqual(stats['phases'][0]['bytes'], os.path.getsize(NORMAL_YW7))
+
+    def test_silent_mode_without_tkinter(self):
+        copyfile(NORMAL_YW7, TEST_YW7)
+        os.chdir(TEST_EXEC_PATH)
+        yw_renumber_.run(TEST_YW7, silentMode=True)
+        self.assertFalse('tkinter' in sys.modules)
+
+    def test_get_new_titles(self):
+        kwargs = {}
+        kwargs.update(yw_renumber_.SETTINGS)
+        kwargs.update(yw_renumber_.OPTIONS)
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(NORMAL_YW7)
+        ywPrj.read()
+        oldTitles = [ywPrj.chapters[chId].title for chId in ywPrj.srtChapters]
+        newTitles = yw_renumber_.YwRn().get_new_titles(ywPrj, **kwargs)
+        self.assertEqual([ywPrj.chapters[chId].title for chId in ywPrj.srtChapters], oldTitles)
+        self.assertEqual(newTitles, {'2': '1', '3': '2', '4': '3', '5': '4', '6': '5', '7': '6'})
+
+    def test_number_formatter(self):
+        formatter = yw_renumber_.YwRn.FORMATTER_CLASS('2', '2')
+        self.assertEqual(formatter.format(100), 'one hundred')
+        self.assertEqual(formatter.format(123456), 'one hundred twenty three thousand four hundred fifty six')
+        self.assertEqual(formatter.format(1000000), 'one million')
+        formatter = yw_renumber_.YwRn.FORMATTER_CLASS('1', '0')
+        self.assertEqual(formatter.get_labels(4), ['I', 'II', 'III', 'IV'])
+        self.assertEqual(formatter.format(1994), 'MCMXCIV')
+
+    def test_id_allocator(self):
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(NORMAL_YW7)
+        ywPrj.read()
+        scId = ywPrj.idAllocator.create_id('scene')
+        self.assertFalse(scId in ywPrj.scenes)
+        ywPrj.scenes[scId] = ywPrj.SCENE_CLASS()
+        self.assertEqual(ywPrj.idAllocator.create_id('scene'), str(max(int(i) for i in ywPrj.scenes) + 1))
+        del ywPrj.chapters['1']
+        self.assertEqual(ywPrj.idAllocator.create_id('chapter'), '1')
+        ywPrj.chapters['1'] = ywPrj.CHAPTER_CLASS()
+
+        # IDs requested before adding the elements are reserved.
+        del ywPrj.scenes['2']
+        scIds = [ywPrj.idAllocator.create_id('scene') for __ in range(3)]
+        self.assertEqual(len(set(scIds)), 3)
+        self.assertEqual(scIds[0], '2')
+        for scId in scIds:
+            self.assertFalse(scId in ywPrj.scenes)
+            ywPrj.scenes[scId] = ywPrj.SCENE_CLASS()
+
+        # Released IDs are reused, the lowest first.
+        maxId = max(int(i) for i in ywPrj.chapters)
+        for chId in ('3', '2'):
+            del ywPrj.chapters[chId]
+            ywPrj.idAllocator.release_id('chapter', chId)
+        for chId in ('2', '3', str(maxId + 1)):
+            self.assertEqual(ywPrj.idAllocator.create_id('chapter'), chId)
+            ywPrj.chapters[chId] = ywPrj.CHAPTER_CLASS()
+
+        # Gaps below a high ID are found without enumerating all IDs.
+        ywPrj.projectNotes = {'1': None, '5': None, '1000000000000': None}
+        for pnId in ('2', '3', '4', '6'):
+            self.assertEqual(ywPrj.idAllocator.create_id('note'), pnId)
+            ywPrj.projectNotes[pnId] = None
+
+    def test_languages(self):
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(NORMAL_YW7)
+        ywPrj.read()
+        scene = ywPrj.scenes[ywPrj.chapters[ywPrj.srtChapters[1]].srtScenes[0]]
+        scene.sceneContent = 'Text [lang=en-AU]Australian[/lang=en-AU] [lang=de-CH]Swiss[/lang=de-CH] [lang=en-AU].'
+        ywPrj.get_languages()
+        self.assertEqual(ywPrj.languages, ['en-AU', 'de-CH'])
+        scene.sceneContent = 'Text [lang=fr-FR]French[/lang=fr-FR].'
+        ywPrj.get_languages()
+        self.assertEqual(ywPrj.languages, ['fr-FR'])
+
+    def test_novel_index(self):
+        ywPrj = yw_renumber_.YwRn.YW_CLASS(NORMAL_YW7)
+        ywPrj.read()
+        self.assertEqual(ywPrj.index.partPositions, [0])
+        self.assertEqual(ywPrj.index.sceneChapters['1'], '2')
+
+        # The index is kept until it is invalidated.
+        index = ywPrj.index
+        ywPrj.chapters['7'].chType = 3
+        self.assertIs(ywPrj.index, index)
+        ywPrj.invalidate_index()
+        self.assertEqual(ywPrj.index.chaptersByType[3], ['7'])
+        ywPrj.srtChapters = ywPrj.srtChapters[:-1]
+        ywPrj.invalidate_index()
+        self.assertEqual(ywPrj.index.chaptersByType, {0: ['1', '2', '3', '4', '5', '6']})
+
+        # Reading invalidates the index.
+        ywPrj.read()
+        self.assertEqual(ywPrj.index.chaptersByType, {0: ['1', '2', '3', '4', '5', '6', '7']})
+
     def tearDown(self):
         remove_all_testfiles()
 